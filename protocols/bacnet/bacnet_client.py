@@ -5,15 +5,139 @@ A Python script to interact with BACnet servers using asyncio
 """
 
 import asyncio
+import datetime
+import logging
+import platform
 import socket
 import struct
-import time
 import sys
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
-class BACnetObjectType(Enum):
+# Precompiled wire formats for the APDU builders and BACnet/IP framing
+_HDR_BB = struct.Struct('!BB')
+_PROP = struct.Struct('!BI')
+_TAG_UINT = struct.Struct('!BBI')
+_WHO_IS_LIMITS = struct.Struct('!BIII')
+_ARRAY_INDEX = struct.Struct('!BBH')
+_READ_PROP = struct.Struct('!BBBBBHHBBH')
+_HDR_BBB = struct.Struct('!BBB')
+# Fixed Write-Property layouts (1-byte property id, no array index): header +
+# invoke ID, object identifier, property identifier[, priority]
+_WRITE_HDR = struct.Struct('!BBBBIBB')
+_WRITE_PRIO_HDR = struct.Struct('!BBBBIBBBB')
+_CMD_HDR = struct.Struct('!BBBBI')  # Header + invoke ID and object identifier
+_OBJID_TAG = struct.Struct('!BI')
+_CTX_UINT16 = struct.Struct('!BH')
+_U16 = struct.Struct('!H')
+_U32 = struct.Struct('!I')
+_REAL = struct.Struct('!f')
+_DOUBLE = struct.Struct('!d')
+_TAGGED_REAL = struct.Struct('!Bf')  # Application tag 4 (0x44) and its value
+_PKT_HDR = struct.Struct('!BBHBB')
+_pack_pkt_hdr = _PKT_HDR.pack
+
+# Seconds to wait for a confirmed-request response
+_RESPONSE_TIMEOUT = 3.0
+
+# Slicing received packets through memoryview avoids copies on CPython, but
+# short memoryview slices are slower than bytes slices on PyPy
+_USE_MEMORYVIEW = platform.python_implementation() != 'PyPy'
+
+# Received packets are memoryviews (bytes on PyPy); the decoders accept either
+_Buffer = Union[bytes, memoryview]
+
+# Send buffer requested for the fast-send socket (absorbs request bursts)
+_SNDBUF_SIZE = 1 << 20
+
+# Largest Read-Property APDU (with array index)
+_READ_PROP_MAX = _READ_PROP.size + _ARRAY_INDEX.size
+
+# Consecutive Reals (e.g. a priorityArray) decoded with one iter_unpack instead of per value
+_REAL_RUN_MIN = 4
+
+# Receive buffer size (largest UDP datagram)
+_RX_BUF_SIZE = 65536
+
+# Datagrams read per receive callback before yielding back to the event loop
+_RECV_BATCH_MAX = 64
+
+# Transmit buffer size (one Ethernet MTU); larger packets are framed separately
+_TX_BUF_SIZE = 1500
+
+# Most single reads kept in flight at once when reads are fanned out; enough to
+# fill a round trip without overrunning small devices' APDU queues
+_MAX_CONCURRENT_READS = 32
+
+# Queued packets that force an immediate flush instead of waiting for the next loop tick
+_SEND_BATCH_MAX = 64
+
+# Upper bound for a Write-Property APDU excluding any string payload
+_WRITE_FIXED_MAX = 32
+
+def _pack_objid(object_type: int, instance: int, _objid=_OBJID_TAG.pack) -> bytes:
+    """Encode a context tag 0 object identifier (10-bit type, 22-bit instance)"""
+    return _objid(0x0C, ((object_type & 0x3FF) << 22) | (instance & 0x3FFFFF))
+
+def _pack_prop_id(property_id: int, _bb=_HDR_BB.pack, _ctx_u16=_CTX_UINT16.pack) -> bytes:
+    """Encode a context tag 1 property identifier (1 or 2 bytes)"""
+    if property_id < 0x100:
+        return _bb(0x19, property_id)
+    return _ctx_u16(0x1A, property_id)
+
+def _pack_prop_id_into(buf: bytearray, off: int, property_id: int,
+                       _bb_into=_HDR_BB.pack_into, _ctx_u16_into=_CTX_UINT16.pack_into) -> int:
+    """Write a context tag 1 property identifier (1 or 2 bytes) into buf, returning the new offset"""
+    if property_id < 0x100:
+        _bb_into(buf, off, 0x19, property_id)
+        return off + 2
+    _ctx_u16_into(buf, off, 0x1A, property_id)
+    return off + 3
+
+def _pack_bool_into(buf: bytearray, off: int, value: bool, encoded: bytes,
+                    _bb_into=_HDR_BB.pack_into) -> int:
+    _bb_into(buf, off, 0x91, 1 if value else 0)
+    return off + 2
+
+def _pack_uint_into(buf: bytearray, off: int, value: int, encoded: bytes,
+                    _uint_into=_TAG_UINT.pack_into) -> int:
+    _uint_into(buf, off, 0x21, 0x02, value)
+    return off + 6
+
+def _pack_str_into(buf: bytearray, off: int, value: str, encoded: bytes,
+                   _bb_into=_HDR_BB.pack_into) -> int:
+    _bb_into(buf, off, 0x75, len(encoded))
+    off += 2
+    buf[off:off + len(encoded)] = encoded
+    return off + len(encoded)
+
+def _pack_null_into(buf: bytearray, off: int, value: Any, encoded: bytes) -> int:
+    buf[off] = 0x00
+    return off + 1
+
+# Tagged value encoders by exact Python type; bool must precede int for subclass lookups
+_VALUE_ENCODERS = {bool: _pack_bool_into, int: _pack_uint_into, str: _pack_str_into}
+
+def _string_tag(text: str) -> bytes:
+    """Encode a CharacterString tag as the command builders send it"""
+    encoded = text.encode('utf-8')
+    return _HDR_BB.pack(0x75, len(text)) + encoded
+
+# Command and action strings are a small fixed set, so their tags are prebuilt
+_STRING_TAGS = {text: _string_tag(text) for text in
+                ('reset', 'backup', 'restore', 'update_firmware', 'set_time', 'acknowledge')}
+
+def _pack_value_into(buf: bytearray, off: int, value: Any, encoded: bytes,
+                     _encoders=_VALUE_ENCODERS, _type=type) -> int:
+    """Write a tagged property value into buf at off, returning the new offset"""
+    encode = _encoders.get(_type(value))
+    if encode is None:
+        # Subclasses such as IntEnum members take the slower isinstance route
+        encode = next((enc for cls, enc in _encoders.items() if isinstance(value, cls)), _pack_null_into)
+    return encode(buf, off, value, encoded)
+
+class BACnetObjectType(IntEnum):
     """BACnet object types"""
     DEVICE = 8
     ANALOG_INPUT = 0
@@ -26,9 +150,10 @@ class BACnetObjectType(Enum):
     MULTI_STATE_OUTPUT = 14
     MULTI_STATE_VALUE = 19
 
-class BACnetProperty(Enum):
+class BACnetProperty(IntEnum):
     """BACnet property identifiers"""
     OBJECT_NAME = 77
+    OBJECT_LIST = 76
     PRESENT_VALUE = 85
     DESCRIPTION = 28
     UNITS = 117
@@ -49,9 +174,9 @@ class BACnetProperty(Enum):
     # Additional properties for manipulation
     PRIORITY_ARRAY = 87
     RELINQUISH_DEFAULT = 95
-    MINIMUM_ON_TIME = 81
-    MINIMUM_OFF_TIME = 82
-    ALARM_VALUE = 5
+    MINIMUM_ON_TIME = 67
+    MINIMUM_OFF_TIME = 66
+    ALARM_VALUE = 6
     COV_INCREMENT = 125
     TIME_DELAY = 113
     NOTIFICATION_CLASS = 17
@@ -65,38 +190,143 @@ class BACnetProperty(Enum):
     EVENT_TYPE = 37
     EVENT_PARAMETERS = 83
     EVENT_TIME = 40
-    ACKNOWLEDGE_TRANSITIONS = 0
-    ACKNOWLEDGE_ALARMS = 1
-    CONFIRMED_COV_NOTIFICATIONS = 2
-    CONFIRMED_EVENT_NOTIFICATIONS = 3
-    GET_ALARM_SUMMARY = 4
-    GET_ENROLLMENT_SUMMARY = 5
-    GET_EVENT_INFORMATION = 29
+
+class BACnetService(IntEnum):
+    """BACnet confirmed service choices"""
+    ACKNOWLEDGE_ALARMS = 0
+    CONFIRMED_COV_NOTIFICATIONS = 1
+    CONFIRMED_EVENT_NOTIFICATIONS = 2
+    GET_ALARM_SUMMARY = 3
+    GET_ENROLLMENT_SUMMARY = 4
     SUBSCRIBE_COV = 5
-    SUBSCRIBE_COV_PROPERTY = 28
-    LIFE_SAFETY_OPERATION = 20
-    PRIVATE_TRANSFER = 4
-    TEXT_MESSAGE = 6
-    REINITIALIZE_DEVICE = 19
-    VIRTUAL_TERMINAL = 18
-    AUTHENTICATE = 22
-    REQUEST_KEY = 25
-    I_AM = 26
-    I_HAVE = 27
-    WHO_IS = 28
-    WHO_HAS = 29
+    ADD_LIST_ELEMENT = 8
+    REMOVE_LIST_ELEMENT = 9
+    CREATE_OBJECT = 10
+    DELETE_OBJECT = 11
     READ_PROPERTY = 12
     READ_PROPERTY_CONDITIONAL = 13
     READ_PROPERTY_MULTIPLE = 14
-    READ_RANGE = 26
-    READ_TAG = 27
     WRITE_PROPERTY = 15
     WRITE_PROPERTY_MULTIPLE = 16
-    WRITE_GROUP = 17
-    DELETE_OBJECT = 11
-    CREATE_OBJECT = 10
-    ADD_LIST_ELEMENT = 8
-    REMOVE_LIST_ELEMENT = 9
+    PRIVATE_TRANSFER = 18
+    TEXT_MESSAGE = 19
+    REINITIALIZE_DEVICE = 20
+    VIRTUAL_TERMINAL = 21
+    AUTHENTICATE = 24
+    REQUEST_KEY = 25
+    READ_RANGE = 26
+    LIFE_SAFETY_OPERATION = 27
+    SUBSCRIBE_COV_PROPERTY = 28
+    GET_EVENT_INFORMATION = 29
+
+class BACnetUnconfirmedService(IntEnum):
+    """BACnet unconfirmed service choices"""
+    I_AM = 0
+    I_HAVE = 1
+    WHO_HAS = 7
+    WHO_IS = 8
+    WRITE_GROUP = 10
+
+def _to_camel(name: str) -> str:
+    """Convert an UPPER_SNAKE enum name to camelCase (OBJECT_NAME -> objectName)"""
+    head, *rest = name.lower().split('_')
+    return head + ''.join(part.capitalize() for part in rest)
+
+def _build_name_cache(members: Dict[str, Enum]) -> Dict[str, int]:
+    """Map every accepted spelling of an enum member name to its integer value"""
+    cache = {}
+    for name, member in members.items():
+        camel = _to_camel(name)
+        for spelling in (name, name.lower(), name.replace('_', '').lower(),
+                         name.replace('_', '-').lower(), camel, camel.lower()):
+            cache.setdefault(spelling, member.value)
+    return cache
+
+# Name -> id lookup tables, built once at import time
+_PROP_ID_CACHE = _build_name_cache(BACnetProperty.__members__)
+_OBJECT_TYPE_ID = _build_name_cache(BACnetObjectType.__members__)
+
+def _lookup_id(cache: Dict[str, int], name: str) -> int:
+    """Resolve a property/object type name in any supported spelling to its id"""
+    value = cache.get(name)
+    if value is None:
+        value = cache[name.lower().replace('-', '').replace('_', '')]
+    return value
+
+def _decode_tag(apdu: _Buffer, off: int) -> Tuple[int, bool, int, int]:
+    """
+    Decode the BACnet tag at off
+    
+    Returns (tag number, is context tag, length/value/type, offset after the tag).
+    For context tags the third field is 6/7 on opening/closing tags; for
+    application booleans it is the boolean value itself.
+    """
+    octet = apdu[off]
+    off += 1
+    tag_number = octet >> 4
+    if tag_number == 0x0F:
+        tag_number = apdu[off]
+        off += 1
+    is_context = bool(octet & 0x08)
+    lvt = octet & 0x07
+    if lvt == 5:
+        lvt = apdu[off]
+        off += 1
+        if lvt == 254:
+            lvt = _U16.unpack_from(apdu, off)[0]
+            off += 2
+        elif lvt == 255:
+            lvt = _U32.unpack_from(apdu, off)[0]
+            off += 4
+    return tag_number, is_context, lvt, off
+
+def _decode_application_value(apdu: _Buffer, off: int) -> Tuple[Any, int]:
+    """Decode one application-tagged value at off, returning (value, new offset)"""
+    tag_number, _, length, off = _decode_tag(apdu, off)
+    if tag_number == 1:  # Boolean (value carried in the tag)
+        return bool(length), off
+    end = off + length
+    if tag_number == 0:  # Null
+        return None, off
+    if tag_number in (2, 9):  # Unsigned / Enumerated
+        return int.from_bytes(apdu[off:end], 'big'), end
+    if tag_number == 3:  # Signed
+        return int.from_bytes(apdu[off:end], 'big', signed=True), end
+    if tag_number == 4:  # Real
+        return _REAL.unpack_from(apdu, off)[0], end
+    if tag_number == 5:  # Double
+        return _DOUBLE.unpack_from(apdu, off)[0], end
+    if tag_number == 7:  # CharacterString (first octet is the character set)
+        # str() decodes straight from the buffer without an intermediate bytes copy
+        return str(apdu[off + 1:end], 'utf-8', 'ignore'), end
+    if tag_number == 12:  # BACnetObjectIdentifier
+        object_id = _U32.unpack_from(apdu, off)[0]
+        return (object_id >> 22, object_id & 0x3FFFFF), end
+    # Octet/bit strings, dates and times are returned raw
+    return bytes(apdu[off:end]), end
+
+def _decode_value_list(apdu: _Buffer, off: int,
+                       _real_run=_TAGGED_REAL.iter_unpack, _real_size=_TAGGED_REAL.size) -> Tuple[List[Any], int]:
+    """
+    Decode application-tagged values up to the next closing tag
+    
+    Returns (values, offset of the closing tag). Runs of Reals are unpacked
+    in one call rather than tag by tag.
+    """
+    values = []
+    end = len(apdu)
+    while off < end and apdu[off] & 0x0F != 0x0F:  # Until the matching closing tag
+        if apdu[off] == 0x44:
+            stop = off + _real_size
+            while stop < end and apdu[stop] == 0x44:
+                stop += _real_size
+            if stop - off >= _REAL_RUN_MIN * _real_size:
+                values.extend([value for _, value in _real_run(apdu[off:stop])])
+                off = stop
+                continue
+        value, off = _decode_application_value(apdu, off)
+        values.append(value)
+    return values, off
 
 @dataclass
 class BACnetDevice:
@@ -118,250 +348,281 @@ class BACnetAPDU:
         service_choice = 0x10  # Who-Is
         
         # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
+        apdu = _HDR_BB.pack(apdu_type, service_choice)
         
         # Add limits if specified
         if low_limit != 0 or high_limit != 4194303:
-            apdu += struct.pack('!BIII', 0x0B, low_limit, 0x0C, high_limit)
+            apdu += _WHO_IS_LIMITS.pack(0x0B, low_limit, 0x0C, high_limit)
         
         return apdu
     
     @staticmethod
     def create_read_property_request(object_id: int, object_type: int, 
-                                   property_id: int, array_index: Optional[int] = None) -> bytes:
+                                   property_id: int, array_index: Optional[int] = None,
+                                   invoke_id: int = 1) -> bytes:
         """Create a Read-Property request"""
+        buf = bytearray(_READ_PROP_MAX)
+        length = BACnetAPDU.pack_read_property_into(buf, 0, object_id, object_type,
+                                                    property_id, array_index, invoke_id)
+        return bytes(buf[:length])
+    
+    @staticmethod
+    def pack_read_property_into(buf: bytearray, offset: int, object_id: int, object_type: int,
+                                property_id: int, array_index: Optional[int] = None,
+                                invoke_id: int = 1,
+                                _read_into=_READ_PROP.pack_into, _read_size=_READ_PROP.size,
+                                _index_into=_ARRAY_INDEX.pack_into) -> int:
+        """
+        Write a Read-Property request into buf at offset
+        
+        Lets callers serialize into a reused buffer instead of allocating
+        a new bytes object per request.
+        
+        Returns:
+            Offset just past the written APDU
+        """
         # BACnet APDU header - use proper confirmed request format
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x0C  # ReadProperty
         
-        # Create APDU with proper BACnet encoding
-        # All confirmed requests need an invoke ID
-        apdu = struct.pack('!BBB', apdu_type, service_choice, 0x01)  # Invoke ID
-        
-        # Object identifier (device,1) - use context tag 0 for ReadProperty
-        apdu += struct.pack('!B', 0x00)  # Context tag 0 for object identifier
-        apdu += struct.pack('!B', 0x04)  # Length (4 bytes)
-        apdu += struct.pack('!HH', object_type, object_id)  # Object type and instance
-        
-        # Property identifier - use context tag 1 for ReadProperty
-        apdu += struct.pack('!B', 0x01)  # Context tag 1 for property identifier
-        apdu += struct.pack('!B', 0x02)  # Length (2 bytes)
-        apdu += struct.pack('!H', property_id)  # Property identifier value
+        # Create APDU with proper BACnet encoding in a single pack:
+        # header + invoke ID, context tag 0 object identifier (type, instance),
+        # context tag 1 property identifier (2 bytes)
+        _read_into(buf, offset, apdu_type, service_choice, invoke_id,
+                   0x00, 0x04, object_type, object_id,
+                   0x01, 0x02, property_id)
+        offset += _read_size
         
         # Array index (optional)
         if array_index is not None:
-            apdu += struct.pack('!B', 0x12)  # Array index tag
-            apdu += struct.pack('!B', 0x02)  # Array index length (2 bytes)
-            apdu += struct.pack('!H', array_index)  # Array index value
+            _index_into(buf, offset, 0x12, 0x02, array_index)
+            offset += 4
         
-        return apdu
+        return offset
     
     @staticmethod
-    def create_write_property_with_priority(object_id: int, object_type: int,
-                                         property_id: int, value: Any, priority: int,
-                                         array_index: Optional[int] = None) -> bytes:
-        """Create a Write-Property request with priority"""
+    def create_read_property_multiple_request(pairs: List[Tuple[int, int, int]],
+                                             invoke_id: int = 1,
+                                             _bb=_HDR_BB.pack, _ctx_u16=_CTX_UINT16.pack,
+                                             _objid=_OBJID_TAG.pack) -> bytes:
+        """Create a Read-Property-Multiple request for (object_type, instance, property_id) tuples"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
-        service_choice = 0x0F  # WriteProperty
-        
-        # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
-        
-        # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, object_id)
-        
-        # Property identifier
-        apdu += struct.pack('!BI', 0x19, property_id)
-        
-        # Array index (optional)
-        if array_index is not None:
-            apdu += struct.pack('!BI', 0x12, array_index)
-        
-        # Priority array
-        apdu += struct.pack('!BB', 0x87, priority)  # Priority array
-        
-        # Property value
-        if isinstance(value, bool):
-            apdu += struct.pack('!BB', 0x91, 1 if value else 0)
-        elif isinstance(value, int):
-            apdu += struct.pack('!BBI', 0x21, 0x02, value)
-        elif isinstance(value, str):
-            apdu += struct.pack('!BB', 0x75, len(value)) + value.encode('utf-8')
-        else:
-            # Default to null
-            apdu += struct.pack('!B', 0x00)
+        service_choice = 0x0E  # ReadPropertyMultiple
+        
+        apdu = bytearray(_HDR_BBB.pack(apdu_type, service_choice, invoke_id))
+        
+        # One read access specification per object, listing all its properties
+        by_object: Dict[Tuple[int, int], List[int]] = {}
+        for object_type, instance, property_id in pairs:
+            by_object.setdefault((object_type, instance), []).append(property_id)
+        
+        for (object_type, instance), property_ids in by_object.items():
+            # Context tag 0: object identifier
+            apdu += _objid(0x0C, ((object_type & 0x3FF) << 22) | (instance & 0x3FFFFF))
+            apdu.append(0x1E)  # Opening tag 1: list of property references
+            for property_id in property_ids:
+                # Context tag 0: property identifier (1 or 2 bytes)
+                if property_id < 0x100:
+                    apdu += _bb(0x09, property_id)
+                else:
+                    apdu += _ctx_u16(0x0A, property_id)
+            apdu.append(0x1F)  # Closing tag 1
         
-        return apdu
+        return bytes(apdu)
+    
+    @staticmethod
+    def create_write_property_with_priority(object_id: int, object_type: int,
+                                         property_id: int, value: Any, priority: int,
+                                         array_index: Optional[int] = None,
+                                         invoke_id: int = 1) -> bytes:
+        """Create a Write-Property request with priority"""
+        return BACnetAPDU._pack_write_property(object_id, object_type, property_id, value,
+                                               priority, array_index, invoke_id)
     
     @staticmethod
     def create_write_property_request(object_id: int, object_type: int,
                                    property_id: int, value: Any,
-                                   array_index: Optional[int] = None) -> bytes:
+                                   array_index: Optional[int] = None,
+                                   invoke_id: int = 1) -> bytes:
         """Create a Write-Property request"""
+        return BACnetAPDU._pack_write_property(object_id, object_type, property_id, value,
+                                               None, array_index, invoke_id)
+    
+    @staticmethod
+    def _pack_write_property(object_id: int, object_type: int, property_id: int, value: Any,
+                             priority: Optional[int], array_index: Optional[int], invoke_id: int,
+                             _isinstance=isinstance, _str=str, _bb_into=_HDR_BB.pack_into,
+                             _bbb_into=_HDR_BBB.pack_into,
+                             _objid_into=_OBJID_TAG.pack_into, _prop_into=_PROP.pack_into,
+                             _write_into=_WRITE_HDR.pack_into, _write_size=_WRITE_HDR.size,
+                             _prio_into=_WRITE_PRIO_HDR.pack_into,
+                             _prio_size=_WRITE_PRIO_HDR.size) -> bytes:
+        """Build a Write-Property APDU, with a priority when one is given"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x0F  # WriteProperty
         
+        # Encode string payloads up front so the buffer can be sized once
+        encoded = value.encode('utf-8') if _isinstance(value, _str) else b''
+        buf = bytearray(_WRITE_FIXED_MAX + len(encoded))
+        object_id = ((object_type & 0x3FF) << 22) | (object_id & 0x3FFFFF)
+        
+        # Common layouts: everything up to the value in a single pack
+        if property_id < 0x100 and array_index is None:
+            if priority is None:
+                _write_into(buf, 0, apdu_type, service_choice, invoke_id,
+                            0x0C, object_id, 0x19, property_id)
+                off = _write_size
+            else:
+                _prio_into(buf, 0, apdu_type, service_choice, invoke_id,
+                           0x0C, object_id, 0x19, property_id, 0x87, priority)
+                off = _prio_size
+            off = _pack_value_into(buf, off, value, encoded)
+            return bytes(buf[:off])
+        
         # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
+        _bbb_into(buf, 0, apdu_type, service_choice, invoke_id)
         
         # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, object_id)
+        _objid_into(buf, 3, 0x0C, object_id)
         
         # Property identifier
-        apdu += struct.pack('!BI', 0x19, property_id)
+        off = _pack_prop_id_into(buf, 8, property_id)
         
         # Array index (optional)
         if array_index is not None:
-            apdu += struct.pack('!BI', 0x12, array_index)
+            _prop_into(buf, off, 0x12, array_index)
+            off += 5
         
-        # Property value
-        if isinstance(value, bool):
-            apdu += struct.pack('!BB', 0x91, 1 if value else 0)
-        elif isinstance(value, int):
-            apdu += struct.pack('!BBI', 0x21, 0x02, value)
-        elif isinstance(value, str):
-            apdu += struct.pack('!BB', 0x75, len(value)) + value.encode('utf-8')
-        else:
-            # Default to null
-            apdu += struct.pack('!B', 0x00)
+        # Priority array (optional)
+        if priority is not None:
+            _bb_into(buf, off, 0x87, priority)
+            off += 2
         
-        return apdu
+        # Property value
+        off = _pack_value_into(buf, off, value, encoded)
+        return bytes(buf[:off])
     
     @staticmethod
     def create_device_control_request(object_id: int, object_type: int,
-                                   command: str, parameters: Dict[str, Any]) -> bytes:
+                                   command: str, parameters: Dict[str, Any],
+                                   invoke_id: int = 1) -> bytes:
         """Create a Device Control request"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x13  # DeviceCommunicationControl
         
-        # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
-        
-        # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, object_id)
-        
-        # Command
-        apdu += struct.pack('!BB', 0x75, len(command)) + command.encode('utf-8')
+        # Create APDU: header and object identifier, then the command
+        apdu = _CMD_HDR.pack(apdu_type, service_choice, invoke_id,
+                             0x0C, ((object_type & 0x3FF) << 22) | (object_id & 0x3FFFFF))
+        apdu += _STRING_TAGS.get(command) or _string_tag(command)
         
         # Parameters (simplified)
         if parameters:
             for key, value in parameters.items():
-                apdu += struct.pack('!BB', 0x75, len(str(value))) + str(value).encode('utf-8')
+                apdu += _HDR_BB.pack(0x75, len(str(value))) + str(value).encode('utf-8')
         
         return apdu
     
     @staticmethod
-    def create_reinitialize_device_request(reinit_type: str) -> bytes:
+    def create_reinitialize_device_request(reinit_type: str, invoke_id: int = 1) -> bytes:
         """Create a Reinitialize Device request"""
-        # BACnet APDU header
-        apdu_type = 0x00  # Confirmed-Request
-        service_choice = 0x13  # ReinitializeDevice
-        
-        # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
-        
-        # Reinitialize type
-        type_map = {'coldstart': 0, 'warmstart': 1, 'startbackup': 2, 'startupdate': 3}
-        reinit_code = type_map.get(reinit_type.lower(), 0)
-        apdu += struct.pack('!BB', 0x91, reinit_code)
-        
-        return apdu
+        # Only four reinitialize types exist, so the type tags are prebuilt
+        return (_HDR_BBB.pack(0x00, 0x13, invoke_id)
+                + _REINIT_TYPES.get(reinit_type.lower(), _REINIT_TYPES['coldstart']))
     
     @staticmethod
     def create_acknowledge_alarm_request(object_id: int, object_type: int,
-                                       action: str) -> bytes:
+                                       action: str, invoke_id: int = 1) -> bytes:
         """Create an Acknowledge Alarm request"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x00  # AcknowledgeAlarm
         
-        # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
-        
-        # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, object_id)
-        
-        # Action
-        apdu += struct.pack('!BB', 0x75, len(action)) + action.encode('utf-8')
+        # Create APDU: header and object identifier, then the action
+        apdu = _CMD_HDR.pack(apdu_type, service_choice, invoke_id,
+                             0x0C, ((object_type & 0x3FF) << 22) | (object_id & 0x3FFFFF))
+        apdu += _STRING_TAGS.get(action) or _string_tag(action)
         
         return apdu
     
     @staticmethod
     def create_create_object_request(object_type: int, instance: int,
-                                  properties: Dict[str, Any]) -> bytes:
+                                  properties: Dict[str, Any],
+                                  invoke_id: int = 1) -> bytes:
         """Create a Create Object request"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x0A  # CreateObject
         
         # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
+        apdu = _HDR_BBB.pack(apdu_type, service_choice, invoke_id)
         
         # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, instance)
+        apdu += _pack_objid(object_type, instance)
         
         # Properties
         for prop_name, prop_value in properties.items():
-            prop_id = BACnetProperty[prop_name.upper()].value
-            apdu += struct.pack('!BI', 0x19, prop_id)
+            prop_id = _lookup_id(_PROP_ID_CACHE, prop_name)
+            apdu += _pack_prop_id(prop_id)
             
             # Property value
-            if isinstance(prop_value, bool):
-                apdu += struct.pack('!BB', 0x91, 1 if prop_value else 0)
-            elif isinstance(prop_value, int):
-                apdu += struct.pack('!BBI', 0x21, 0x02, prop_value)
-            elif isinstance(prop_value, str):
-                apdu += struct.pack('!BB', 0x75, len(prop_value)) + prop_value.encode('utf-8')
-            else:
-                apdu += struct.pack('!B', 0x00)
+            encoded = prop_value.encode('utf-8') if isinstance(prop_value, str) else b''
+            value_buf = bytearray(6 + len(encoded))
+            apdu += value_buf[:_pack_value_into(value_buf, 0, prop_value, encoded)]
         
         return apdu
     
     @staticmethod
-    def create_delete_object_request(object_type: int, instance: int) -> bytes:
+    def create_delete_object_request(object_type: int, instance: int,
+                                     invoke_id: int = 1) -> bytes:
         """Create a Delete Object request"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x0B  # DeleteObject
         
         # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
+        apdu = _HDR_BBB.pack(apdu_type, service_choice, invoke_id)
         
         # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, instance)
+        apdu += _pack_objid(object_type, instance)
         
         return apdu
     
     @staticmethod
     def create_subscribe_cov_request(object_type: int, instance: int,
-                                   property_id: int) -> bytes:
+                                   property_id: int, invoke_id: int = 1) -> bytes:
         """Create a Subscribe COV request"""
         # BACnet APDU header
         apdu_type = 0x00  # Confirmed-Request
         service_choice = 0x05  # SubscribeCOV
         
         # Create APDU
-        apdu = struct.pack('!BB', apdu_type, service_choice)
+        apdu = _HDR_BBB.pack(apdu_type, service_choice, invoke_id)
         
         # Object identifier
-        apdu += struct.pack('!BII', 0x0C, object_type, instance)
+        apdu += _pack_objid(object_type, instance)
         
         # Property identifier
-        apdu += struct.pack('!BI', 0x19, property_id)
+        apdu += _pack_prop_id(property_id)
         
         # Issue confirmed notifications
-        apdu += struct.pack('!BB', 0x91, 1)
+        apdu += _HDR_BB.pack(0x91, 1)
         
         return apdu
 
+# Reinitialize Device type tags by type name
+_REINIT_TYPES = {
+    name: _HDR_BB.pack(0x91, code)
+    for name, code in (('coldstart', 0), ('warmstart', 1), ('startbackup', 2), ('startupdate', 3))
+}
+
 class BACnetClient:
     """Modern asyncio-based BACnet client"""
     
     def __init__(self, device_id: int = 999, local_address: str = '0.0.0.0', 
-                 local_port: int = None):
+                 local_port: int = None, fast_send: bool = True):
         """
         Initialize BACnet client
         
@@ -369,7 +630,10 @@ class BACnetClient:
             device_id: Local device ID
             local_address: Local IP address to bind to
             local_port: Local port to bind to (None for auto-assign, 47808 for default BACnet port)
+            fast_send: Send directly on the UDP socket instead of through the
+                       asyncio transport buffer (falls back when the socket would block)
         """
+        self.logger = logging.getLogger(__name__)
         self.device_id = device_id
         self.local_address = local_address
         self.local_port = local_port or 0  # 0 means auto-assign port
@@ -377,8 +641,42 @@ class BACnetClient:
         self.protocol = None
         self.discovered_devices: Dict[str, BACnetDevice] = {}
         self.target_address = None
-        self.pending_responses = {}  # Track pending requests
-        self.response_data = {}  # Store response data
+        # Pending requests by (peer IP address, invoke ID)
+        self.pending_responses: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._next_invoke_id = 0
+        self._addr_cache: Dict[str, Tuple[str, int]] = {}  # Resolved peers by target string
+        self.fast_send = fast_send
+        self._sock = None  # Raw socket used by _send_fast
+        # Reused transmit buffer for packets sent immediately (sends are synchronous,
+        # so one buffer serves every request); the header only needs its length updated
+        self._tx_buf = bytearray(_TX_BUF_SIZE)
+        _PKT_HDR.pack_into(self._tx_buf, 0, 0x01, 0x01, 0, 0x01, 0x00)
+        self._tx_view = memoryview(self._tx_buf)
+        self._read_slots: Optional[asyncio.Semaphore] = None  # Created in start()
+        self._send_queue: List[Tuple[bytes, Tuple[str, int]]] = []  # Drained by _flush
+        
+        # write_command handlers by command name, called as
+        # handler(target_address, obj_type, obj_inst, value, priority)
+        self._command_handlers = {
+            'set_value': self._write_present_value,
+            'enable': lambda target, obj_type, obj_inst, value, priority:
+                self._write_out_of_service(target, obj_type, obj_inst, False),
+            'disable': lambda target, obj_type, obj_inst, value, priority:
+                self._write_out_of_service(target, obj_type, obj_inst, True),
+            'reset': lambda target, obj_type, obj_inst, value, priority:
+                self._reset_object(target, obj_type, obj_inst),
+            'acknowledge': lambda target, obj_type, obj_inst, value, priority:
+                self._acknowledge_alarm(target, obj_type, obj_inst),
+        }
+        
+        # manipulate_device handlers by operation name, called as handler(target_address, parameters)
+        self._operation_handlers = {
+            'reinitialize': self._reinitialize_device,
+            'backup': lambda target, parameters: self._backup_device(target),
+            'restore': self._restore_device,
+            'update_firmware': self._update_firmware,
+            'set_time': self._set_device_time,
+        }
         
     async def start(self) -> bool:
         """Start the BACnet client"""
@@ -390,7 +688,8 @@ class BACnetClient:
             try:
                 self.transport, self.protocol = await loop.create_datagram_endpoint(
                     lambda: BACnetProtocol(self),
-                    local_addr=(self.local_address, self.local_port)
+                    local_addr=(self.local_address, self.local_port),
+                    allow_broadcast=True
                 )
             except OSError as e:
                 if "Address already in use" in str(e) and self.local_port != 0:
@@ -399,14 +698,26 @@ class BACnetClient:
                     self.local_port = 0
                     self.transport, self.protocol = await loop.create_datagram_endpoint(
                         lambda: BACnetProtocol(self),
-                        local_addr=(self.local_address, self.local_port)
+                        local_addr=(self.local_address, self.local_port),
+                        allow_broadcast=True
                     )
                 else:
                     raise e
             
+            # Cap concurrent single reads (created here so it binds to the running loop)
+            self._read_slots = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+            
             # Get the actual port that was bound
             actual_port = self.transport.get_extra_info('socket').getsockname()[1]
             
+            if self.fast_send:
+                # Duplicate the transport's socket so bursts can bypass the transport
+                # buffer; the copy shares the bound port and non-blocking mode
+                self._sock = self.transport.get_extra_info('socket').dup()
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SNDBUF_SIZE)
+                # Who-Is goes to the broadcast address
+                self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            
             print(f"BACnet client started with device ID: {self.device_id}")
             print(f"Local address: {self.local_address}:{actual_port}")
             return True
@@ -427,21 +738,20 @@ class BACnetClient:
             # Clear previous discoveries
             self.discovered_devices.clear()
             
-            # Create Who-Is request
-            who_is_apdu = BACnetAPDU.create_who_is_request()
-            
-            # Create BACnet packet
-            packet = self._create_bacnet_packet(who_is_apdu)
+            # Who-Is without limits is constant, reuse the prebuilt packet
+            packet = _WHO_IS_PACKET
+            send = self._send_fast
             
             # Send to broadcast address
             broadcast_addr = ('255.255.255.255', 47808)
-            self.transport.sendto(packet, broadcast_addr)
+            send(packet, broadcast_addr)
             
             # Also send directly to target if specified
-            if hasattr(self, 'target_address') and self.target_address:
-                target_addr = (self.target_address, 47808)
-                self.transport.sendto(packet, target_addr)
-                print(f"Sent Who-Is request to {self.target_address}")
+            target_address = self.target_address
+            if target_address:
+                target_addr = (target_address, 47808)
+                send(packet, target_addr)
+                print(f"Sent Who-Is request to {target_address}")
             
             # Wait for responses
             await asyncio.sleep(timeout)
@@ -473,104 +783,167 @@ class BACnetClient:
             obj_type_str, obj_inst_str = object_id.split(',')
             obj_inst = int(obj_inst_str)
             
-            # Get object type enum
-            obj_type = BACnetObjectType[obj_type_str.upper().replace('-', '_')].value
-            
-            # Get property enum - handle common property name variations
-            property_mapping = {
-                'objectname': 'OBJECT_NAME',
-                'presentvalue': 'PRESENT_VALUE',
-                'description': 'DESCRIPTION',
-                'units': 'UNITS',
-                'statusflags': 'STATUS_FLAGS',
-                'reliability': 'RELIABILITY',
-                'outofservice': 'OUT_OF_SERVICE',
-                'vendorname': 'VENDOR_NAME',
-                'vendoridentifier': 'VENDOR_IDENTIFIER',
-                'modelname': 'MODEL_NAME',
-                'firmwarerevision': 'FIRMWARE_REVISION',
-                'applicationsoftwareversion': 'APPLICATION_SOFTWARE_VERSION',
-                'location': 'LOCATION',
-                'protocolversion': 'PROTOCOL_VERSION',
-                'protocolrevision': 'PROTOCOL_REVISION',
-                'systemstatus': 'SYSTEM_STATUS',
-                'maxapdulengthaccepted': 'MAX_APDU_LENGTH_ACCEPTED',
-                'segmentationsupported': 'SEGMENTATION_SUPPORTED'
-            }
-            
-            prop_key = property_id.upper().replace('-', '').replace('_', '')
-            if prop_key in property_mapping:
-                mapped_prop = property_mapping[prop_key]
-                prop_id = BACnetProperty[mapped_prop].value
-            else:
-                # Try direct mapping with common variations
-                try:
-                    prop_id = BACnetProperty[property_id.upper()].value
-                except KeyError:
-                    # Try with underscores
-                    try:
-                        prop_id = BACnetProperty[property_id.upper().replace('-', '_')].value
-                    except KeyError:
-                        # Try with camelCase to UPPER_CASE conversion
-                        import re
-                        upper_case = re.sub(r'([a-z])([A-Z])', r'\1_\2', property_id).upper()
-                        try:
-                            prop_id = BACnetProperty[upper_case].value
-                        except KeyError:
-                            print(f"Error: Property '{property_id}' not found in BACnetProperty enum")
-                            raise
-            
-            # Create read request
-            read_apdu = BACnetAPDU.create_read_property_request(obj_inst, obj_type, prop_id)
-            
-            # Create BACnet packet
-            packet = self._create_bacnet_packet(read_apdu)
-            
-            # Debug: Print what we're sending
-            print(f"  Sending APDU: {read_apdu.hex()}")
-            print(f"  Object type: {obj_type}, Object ID: {obj_inst}, Property: {prop_id}")
-            
-            # Send request
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Reading {property_id} from {object_id} at {target_address}...")
-            
-            # Create a unique request ID for tracking
-            import uuid
-            request_id = str(uuid.uuid4())
-            self.pending_responses[request_id] = {
-                'object_id': object_id,
-                'property_id': property_id,
-                'target': target_address,
-                'timestamp': time.time()
-            }
-            
-            # Wait for response with timeout
-            start_time = time.time()
-            timeout = 3.0  # 3 second timeout
-            
-            while time.time() - start_time < timeout:
-                if request_id in self.response_data:
-                    # We got a response!
-                    response_value = self.response_data[request_id]
-                    del self.response_data[request_id]
-                    del self.pending_responses[request_id]
-                    return response_value
-                await asyncio.sleep(0.1)
-            
-            # Timeout - remove pending request
-            if request_id in self.pending_responses:
-                del self.pending_responses[request_id]
-            
-            # No response received - return None to indicate no data
-            print(f"  (No response received from {target_address})")
-            return None
+            # Resolve object type and property ids (camelCase, snake_case, hyphenated...)
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, obj_type_str)
+            try:
+                prop_id = _lookup_id(_PROP_ID_CACHE, property_id)
+            except KeyError:
+                print(f"Error: Property '{property_id}' not found in BACnetProperty enum")
+                raise
+            
+            # Allocate an invoke ID and register the response future before sending
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._new_request(target_addr)
+            
+            # The finally releases the invoke ID even if packing or sending fails
+            try:
+                # Build the read request packet in the reused transmit buffer
+                length = self._pack_read_packet(obj_inst, obj_type, prop_id, invoke_id)
+                
+                # Debug: Print what we're sending
+                self.logger.debug("  Sending APDU: %s", self._tx_view[_PKT_HDR.size:length].hex())
+                self.logger.debug("  Object type: %s, Object ID: %s, Property: %s", obj_type, obj_inst, prop_id)
+                
+                # Send request
+                self._send_fast(self._tx_view[:length], target_addr)
+                
+                self.logger.debug("Reading %s from %s at %s...", property_id, object_id, target_address)
+                
+                # Wait for the protocol to resolve the future; the timeout runs on the
+                # loop's monotonic clock
+                return await asyncio.wait_for(response, _RESPONSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # No response received - return None to indicate no data
+                self.logger.debug("  (No response received from %s)", target_address)
+                return None
+            finally:
+                self.pending_responses.pop((target_addr[0], invoke_id), None)
             
         except Exception as e:
             print(f"Error reading property: {e}")
             return None
     
+    async def read_property_multiple(self, target_address: str,
+                                     requests: List[Tuple[str, str]]) -> Optional[Dict[Tuple[str, str], Any]]:
+        """
+        Read several properties with a single ReadPropertyMultiple request
+        
+        Args:
+            target_address: Target device address
+            requests: (object_id, property_id) pairs, e.g. ('analogInput,1', 'presentValue')
+        
+        Returns:
+            Values keyed by the requested pairs (None for properties the device
+            reported errors for), or None if the request was rejected or unanswered
+        """
+        try:
+            # Resolve every pair to (object type, instance, property id)
+            keys = {}
+            for object_id, property_id in requests:
+                obj_type_str, obj_inst_str = object_id.split(',')
+                key = (_lookup_id(_OBJECT_TYPE_ID, obj_type_str), int(obj_inst_str),
+                       _lookup_id(_PROP_ID_CACHE, property_id))
+                keys[key] = (object_id, property_id)
+            
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._new_request(target_addr)
+            try:
+                rpm_apdu = BACnetAPDU.create_read_property_multiple_request(list(keys), invoke_id=invoke_id)
+                self._send_apdu(rpm_apdu, target_addr)
+                
+                self.logger.debug("Reading %d properties from %s (ReadPropertyMultiple)...", len(keys), target_address)
+                
+                results = await asyncio.wait_for(response, _RESPONSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                self.logger.debug("  (No response received from %s)", target_address)
+                return None
+            finally:
+                self.pending_responses.pop((target_addr[0], invoke_id), None)
+            
+            if results is None:
+                return None
+            return {request: results.get(key) for key, request in keys.items()}
+            
+        except Exception as e:
+            print(f"Error reading properties: {e}")
+            return None
+    
+    async def _read_many(self, target_address: str,
+                         requests: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Any]:
+        """Read properties via ReadPropertyMultiple, falling back to concurrent single reads"""
+        values = await self.read_property_multiple(target_address, requests)
+        if values is not None:
+            return values
+        
+        # Device does not support ReadPropertyMultiple - issue single reads concurrently
+        results = await asyncio.gather(
+            *[self._read_limited(target_address, object_id, property_id)
+              for object_id, property_id in requests],
+            return_exceptions=True
+        )
+        return dict(zip(requests, results))
+    
+    async def _read_limited(self, target_address: str, object_id: str,
+                            property_id: str) -> Optional[Any]:
+        """Read a property, waiting for a free slot when too many reads are in flight"""
+        async with self._read_slots:
+            return await self.read_property(target_address, object_id, property_id)
+    
+    def _peer(self, target_address: str) -> Tuple[str, int]:
+        """Resolve a target to the (IP address, port) its replies will come from"""
+        # Resolve each target once; sends then hand sendto a numeric address
+        addr = self._addr_cache.get(target_address)
+        if addr is None:
+            addr = self._addr_cache[target_address] = (socket.gethostbyname(target_address), 47808)
+        return addr
+    
+    def _new_request(self, target_addr: Tuple[str, int]) -> Tuple[int, asyncio.Future]:
+        """Allocate an invoke ID for a peer and register the future its response will resolve"""
+        # Invoke IDs are a single byte and only need to be unique per peer;
+        # skip any still held by an outstanding request to the same device
+        pending = self.pending_responses
+        host = target_addr[0]
+        invoke_id = self._next_invoke_id
+        for _ in range(256):
+            invoke_id = (invoke_id + 1) & 0xFF
+            if (host, invoke_id) not in pending:
+                break
+        else:
+            raise RuntimeError(f"All 256 BACnet invoke IDs are in use for {host}")
+        self._next_invoke_id = invoke_id
+        
+        response = asyncio.get_running_loop().create_future()
+        pending[(host, invoke_id)] = response
+        return invoke_id, response
+    
+    def _start_request(self, target_addr: Tuple[str, int],
+                       build_apdu: Callable[[int], bytes]) -> Tuple[int, asyncio.Future]:
+        """
+        Register a confirmed request, then build and queue its APDU
+        
+        build_apdu receives the allocated invoke ID; if building or framing
+        the APDU fails, the invoke ID is released before the error propagates.
+        """
+        invoke_id, response = self._new_request(target_addr)
+        try:
+            self._queue_send(self._create_bacnet_packet(build_apdu(invoke_id)), target_addr)
+        except BaseException:
+            self.pending_responses.pop((target_addr[0], invoke_id), None)
+            raise
+        return invoke_id, response
+    
+    async def _await_ack(self, target_addr: Tuple[str, int], invoke_id: int, response: asyncio.Future,
+                         timeout: float = _RESPONSE_TIMEOUT) -> bool:
+        """Wait for the device to acknowledge a confirmed request"""
+        try:
+            result = await asyncio.wait_for(response, timeout)
+        except asyncio.TimeoutError:
+            self.logger.debug("  (No response received from %s)", target_addr[0])
+            return False
+        finally:
+            self.pending_responses.pop((target_addr[0], invoke_id), None)
+        return result is not None
+    
     async def write_property(self, target_address: str, object_id: str,
                            property_id: str, value: Any) -> bool:
         """
@@ -587,30 +960,29 @@ class BACnetClient:
             obj_type_str, obj_inst_str = object_id.split(',')
             obj_inst = int(obj_inst_str)
             
-            # Get object type enum
-            obj_type = BACnetObjectType[obj_type_str.upper().replace('-', '_')].value
+            # Resolve object type id
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, obj_type_str)
             
-            # Get property enum
-            prop_id = BACnetProperty[property_id.upper()].value
+            # Resolve property id
+            prop_id = _lookup_id(_PROP_ID_CACHE, property_id)
             
             # Create write request
-            write_apdu = BACnetAPDU.create_write_property_request(obj_inst, obj_type, prop_id, value)
-            
-            # Create BACnet packet
-            packet = self._create_bacnet_packet(write_apdu)
-            
-            # Send request
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Writing {value} to {property_id} of {object_id} at {target_address}...")
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._new_request(target_addr)
+            try:
+                write_apdu = BACnetAPDU.create_write_property_request(obj_inst, obj_type, prop_id, value,
+                                                                      invoke_id=invoke_id)
+                
+                # Frame and send the request from the transmit buffer
+                self._send_apdu(write_apdu, target_addr)
+            except BaseException:
+                self.pending_responses.pop((target_addr[0], invoke_id), None)
+                raise
             
-            # Wait for response
-            await asyncio.sleep(1)
+            self.logger.debug("Writing %s to %s of %s at %s...", value, property_id, object_id, target_address)
             
-            # For now, return success
-            # In a real implementation, you'd check the response
-            return True
+            # Wait for the device to acknowledge the write
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error writing property: {e}")
@@ -638,16 +1010,16 @@ class BACnetClient:
             print("Device Information:")
             print("-" * 30)
             
-            # Read device properties
+            # Read all device properties with one ReadPropertyMultiple request
+            values = await self._read_many(target_address, [('device,1', prop) for prop in device_properties])
             for prop in device_properties:
-                try:
-                    value = await self.read_property(target_address, 'device,1', prop)
-                    if value is not None:
-                        print(f"  {prop}: {value}")
-                    else:
-                        print(f"  {prop}: <no response>")
-                except Exception as e:
-                    print(f"  {prop}: <error: {e}>")
+                value = values[('device,1', prop)]
+                if isinstance(value, Exception):
+                    print(f"  {prop}: <error: {value}>")
+                elif value is not None:
+                    print(f"  {prop}: {value}")
+                else:
+                    print(f"  {prop}: <no response>")
             
             print(f"\nObject Enumeration:")
             print("-" * 30)
@@ -659,36 +1031,56 @@ class BACnetClient:
                 'multiStateInput', 'multiStateOutput', 'multiStateValue'
             ]
             
+            # Ask the device for its object list, then read every listed object's
+            # name and present value in one request
+            object_ids = await self._read_object_list(target_address, object_types)
+            if object_ids is not None:
+                present_values = await self._read_many(
+                    target_address,
+                    [(object_id, prop) for object_id in object_ids for prop in ('objectName', 'presentValue')]
+                )
+                found = []
+                for object_id in object_ids:
+                    name = present_values[(object_id, 'objectName')]
+                    if name is None or isinstance(name, Exception):
+                        name = '<unnamed>'
+                    found.append((object_id, name))
+            else:
+                # No object list available - probe the first 5 instances of each type,
+                # one request per type, all types at once
+                names_by_type = await asyncio.gather(
+                    *[self._read_many(target_address,
+                                      [(f"{obj_type},{instance}", 'objectName') for instance in range(1, 6)])
+                      for obj_type in object_types]
+                )
+                found = [(object_id, name) for names in names_by_type for (object_id, _), name in names.items()
+                         if name is not None and not isinstance(name, Exception)]
+                
+                # Read present values of every object that answered in one more request
+                present_values = {}
+                if found:
+                    present_values = await self._read_many(
+                        target_address, [(object_id, 'presentValue') for object_id, _ in found]
+                    )
+            
             for obj_type in object_types:
                 print(f"\n{obj_type.upper()} Objects:")
                 print("-" * 20)
                 
-                # Try to find objects of this type
-                found_objects = []
-                
-                # Check first 5 instances of each type
-                for instance in range(1, 6):
-                    try:
-                        obj_id = f"{obj_type},{instance}"
-                        name = await self.read_property(target_address, obj_id, 'objectName')
-                        if name is not None:
-                            found_objects.append((instance, name))
-                    except:
-                        continue
+                found_objects = [(object_id, name) for object_id, name in found
+                                 if object_id.split(',')[0] == obj_type]
                 
                 if found_objects:
-                    for instance, name in found_objects:
-                        print(f"  {obj_type},{instance}: {name}")
+                    for object_id, name in found_objects:
+                        print(f"  {object_id}: {name}")
                         
-                        # Try to read present value
-                        try:
-                            value = await self.read_property(target_address, f"{obj_type},{instance}", 'presentValue')
-                            if value is not None:
-                                print(f"    presentValue: {value}")
-                            else:
-                                print(f"    presentValue: <no response>")
-                        except Exception as e:
-                            print(f"    presentValue: <error: {e}>")
+                        value = present_values[(object_id, 'presentValue')]
+                        if isinstance(value, Exception):
+                            print(f"    presentValue: <error: {value}>")
+                        elif value is not None:
+                            print(f"    presentValue: {value}")
+                        else:
+                            print(f"    presentValue: <no response>")
                 else:
                     print(f"  No {obj_type} objects found")
             
@@ -697,6 +1089,28 @@ class BACnetClient:
         except Exception as e:
             print(f"Error enumerating device: {e}")
     
+    async def _read_object_list(self, target_address: str,
+                                object_types: List[str]) -> Optional[List[str]]:
+        """
+        Read the device's objectList and return the ids of objects of the given types
+        
+        Returns None if the device did not return a decodable object list.
+        """
+        values = await self.read_property_multiple(target_address, [('device,1', 'objectList')])
+        if values is not None:
+            object_list = values[('device,1', 'objectList')]
+        else:
+            # ReadPropertyMultiple is optional; every device supports ReadProperty
+            object_list = await self.read_property(target_address, 'device,1', 'objectList')
+        if isinstance(object_list, tuple):  # Single-entry list
+            object_list = [object_list]
+        if not isinstance(object_list, list):
+            return None
+        
+        type_names = {_lookup_id(_OBJECT_TYPE_ID, obj_type): obj_type for obj_type in object_types}
+        return [f"{type_names[entry[0]]},{entry[1]}" for entry in object_list
+                if isinstance(entry, tuple) and entry[0] in type_names]
+    
     async def check_permissions(self, target_address: str, object_id: str = 'device,1') -> None:
         """
         Check read/write permissions for common properties
@@ -750,26 +1164,88 @@ class BACnetClient:
         
         print(f"\nPermission check completed for {object_id}")
     
-    def _create_bacnet_packet(self, apdu: bytes) -> bytes:
+    @staticmethod
+    def _create_bacnet_packet(apdu: bytes) -> bytes:
         """Create a BACnet packet with the given APDU"""
-        # BACnet/IP header
-        version = 0x01
-        function = 0x01  # Original-Unicast-NPDU
-        
-        # NPDU (Network Protocol Data Unit)
-        npdu_version = 0x01
-        npdu_control = 0x00  # No special control
-        
-        # Create packet
-        packet = struct.pack('!BB', version, function)
-        packet += struct.pack('!H', len(apdu) + 4)  # Length
-        packet += struct.pack('!BB', npdu_version, npdu_control)
-        packet += apdu
+        # BACnet/IP header (version, Original-Unicast-NPDU, length) followed
+        # by the NPDU (version, no special control)
+        return _pack_pkt_hdr(0x01, 0x01, len(apdu) + 4, 0x01, 0x00) + apdu
+    
+    def _pack_read_packet(self, object_id: int, object_type: int, property_id: int,
+                          invoke_id: int, _len_into=_U16.pack_into,
+                          _hdr_size=_PKT_HDR.size) -> int:
+        """Write a Read-Property request into the transmit buffer, returning the packet length"""
+        length = BACnetAPDU.pack_read_property_into(self._tx_buf, _hdr_size, object_id, object_type,
+                                                    property_id, None, invoke_id)
+        # Same length field as _create_bacnet_packet (APDU length + 4)
+        _len_into(self._tx_buf, 2, length - _hdr_size + 4)
+        return length
+    
+    def _send_apdu(self, apdu: bytes, addr: Tuple[str, int],
+                   _len_into=_U16.pack_into, _hdr_size=_PKT_HDR.size) -> None:
+        """Frame an APDU in the transmit buffer and send it immediately"""
+        end = _hdr_size + len(apdu)
+        if end > _TX_BUF_SIZE:
+            self._send_fast(self._create_bacnet_packet(apdu), addr)
+            return
+        self._tx_buf[_hdr_size:end] = apdu
+        _len_into(self._tx_buf, 2, len(apdu) + 4)
+        self._send_fast(self._tx_view[:end], addr)
+    
+    def _send_fast(self, packet: Union[bytes, memoryview], addr: Tuple[str, int]) -> None:
+        """Send a packet directly on the socket, using the transport as fallback"""
+        if self._sock is not None:
+            try:
+                self._sock.sendto(packet, addr)
+                return
+            except OSError:
+                pass  # Let the transport buffer it or report the error
+        self.transport.sendto(packet, addr)
+    
+    def _queue_send(self, packet: bytes, addr: Tuple[str, int]) -> None:
+        """
+        Queue a packet for the next flush
         
-        return packet
+        Packets queued during one event loop iteration (e.g. commands issued
+        concurrently with gather) go out back to back in a single flush.
+        """
+        queue = self._send_queue
+        queue.append((packet, addr))
+        if len(queue) == 1:
+            asyncio.get_running_loop().call_soon(self._flush)
+        elif len(queue) >= _SEND_BATCH_MAX:
+            self._flush()
+    
+    def _flush(self) -> None:
+        """Send every queued packet"""
+        queue = self._send_queue
+        if not queue:
+            return
+        self._send_queue = []
+        
+        # Write the batch straight to the raw socket; once it pushes back or
+        # fails, the rest goes to the transport, which buffers it or reports
+        # the error, so the packets still leave in order
+        start = 0
+        if self._sock is not None:
+            sendto = self._sock.sendto
+            try:
+                for packet, addr in queue:
+                    sendto(packet, addr)
+                    start += 1
+            except OSError:
+                pass
+        transport_send = self.transport.sendto
+        for packet, addr in queue[start:]:
+            transport_send(packet, addr)
     
     async def stop(self) -> None:
         """Stop the BACnet client"""
+        if self.transport:
+            self._flush()  # Don't drop packets queued this tick
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
         if self.transport:
             self.transport.close()
             print("BACnet client stopped")
@@ -792,22 +1268,14 @@ class BACnetClient:
             # Parse object identifier
             obj_type_str, obj_inst_str = object_id.split(',')
             obj_inst = int(obj_inst_str)
-            obj_type = BACnetObjectType[obj_type_str.upper().replace('-', '_')].value
-            
-            # Create command based on type
-            if command.lower() == 'set_value':
-                return await self._write_present_value(target_address, obj_type, obj_inst, value, priority)
-            elif command.lower() == 'enable':
-                return await self._write_out_of_service(target_address, obj_type, obj_inst, False)
-            elif command.lower() == 'disable':
-                return await self._write_out_of_service(target_address, obj_type, obj_inst, True)
-            elif command.lower() == 'reset':
-                return await self._reset_object(target_address, obj_type, obj_inst)
-            elif command.lower() == 'acknowledge':
-                return await self._acknowledge_alarm(target_address, obj_type, obj_inst)
-            else:
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, obj_type_str)
+            
+            # Dispatch on the command name
+            handler = self._command_handlers.get(command.lower())
+            if handler is None:
                 print(f"Unknown command: {command}")
                 return False
+            return await handler(target_address, obj_type, obj_inst, value, priority)
                 
         except Exception as e:
             print(f"Error executing command: {e}")
@@ -818,17 +1286,13 @@ class BACnetClient:
         """Write present value with priority"""
         try:
             # Create write request with priority
-            write_apdu = BACnetAPDU.create_write_property_with_priority(
-                obj_inst, obj_type, BACnetProperty.PRESENT_VALUE.value, value, priority
-            )
-            
-            packet = self._create_bacnet_packet(write_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_write_property_with_priority(
+                obj_inst, obj_type, BACnetProperty.PRESENT_VALUE, value, priority, invoke_id=invoke_id
+            ))
             
-            print(f"Writing value {value} with priority {priority} to {obj_type},{obj_inst}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Writing value %s with priority %s to %s,%s", value, priority, obj_type, obj_inst)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error writing present value: {e}")
@@ -838,18 +1302,14 @@ class BACnetClient:
                                   obj_inst: int, out_of_service: bool) -> bool:
         """Enable/disable an object"""
         try:
-            write_apdu = BACnetAPDU.create_write_property_request(
-                obj_inst, obj_type, BACnetProperty.OUT_OF_SERVICE.value, out_of_service
-            )
-            
-            packet = self._create_bacnet_packet(write_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_write_property_request(
+                obj_inst, obj_type, BACnetProperty.OUT_OF_SERVICE, out_of_service, invoke_id=invoke_id
+            ))
             
             status = "disabled" if out_of_service else "enabled"
-            print(f"Object {obj_type},{obj_inst} {status}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Object %s,%s %s", obj_type, obj_inst, status)
+            return await self._await_ack(target_addr, invoke_id, response)
                 
         except Exception as e:
             print(f"Error setting out of service: {e}")
@@ -859,17 +1319,13 @@ class BACnetClient:
         """Reset an object to default values"""
         try:
             # Create reset command
-            reset_apdu = BACnetAPDU.create_device_control_request(
-                obj_inst, obj_type, "reset", {}
-            )
-            
-            packet = self._create_bacnet_packet(reset_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_device_control_request(
+                obj_inst, obj_type, "reset", {}, invoke_id=invoke_id
+            ))
             
-            print(f"Reset command sent to {obj_type},{obj_inst}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Reset command sent to %s,%s", obj_type, obj_inst)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error resetting object: {e}")
@@ -879,17 +1335,13 @@ class BACnetClient:
         """Acknowledge an alarm"""
         try:
             # Create acknowledge alarm request
-            ack_apdu = BACnetAPDU.create_acknowledge_alarm_request(
-                obj_inst, obj_type, "acknowledge"
-            )
-            
-            packet = self._create_bacnet_packet(ack_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_acknowledge_alarm_request(
+                obj_inst, obj_type, "acknowledge", invoke_id=invoke_id
+            ))
             
-            print(f"Alarm acknowledged for {obj_type},{obj_inst}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Alarm acknowledged for %s,%s", obj_type, obj_inst)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error acknowledging alarm: {e}")
@@ -906,19 +1358,11 @@ class BACnetClient:
             parameters: Operation parameters
         """
         try:
-            if operation.lower() == 'reinitialize':
-                return await self._reinitialize_device(target_address, parameters)
-            elif operation.lower() == 'backup':
-                return await self._backup_device(target_address)
-            elif operation.lower() == 'restore':
-                return await self._restore_device(target_address, parameters)
-            elif operation.lower() == 'update_firmware':
-                return await self._update_firmware(target_address, parameters)
-            elif operation.lower() == 'set_time':
-                return await self._set_device_time(target_address, parameters)
-            else:
+            handler = self._operation_handlers.get(operation.lower())
+            if handler is None:
                 print(f"Unknown device operation: {operation}")
                 return False
+            return await handler(target_address, parameters)
                 
         except Exception as e:
             print(f"Error performing device operation: {e}")
@@ -930,15 +1374,13 @@ class BACnetClient:
         try:
             reinit_type = parameters.get('type', 'coldstart') if parameters else 'coldstart'
             
-            reinit_apdu = BACnetAPDU.create_reinitialize_device_request(reinit_type)
-            packet = self._create_bacnet_packet(reinit_apdu)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_reinitialize_device_request(
+                reinit_type, invoke_id=invoke_id
+            ))
             
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Reinitialize command sent to device at {target_address} (type: {reinit_type})")
-            await asyncio.sleep(2)
-            return True
+            self.logger.debug("Reinitialize command sent to device at %s (type: %s)", target_address, reinit_type)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error reinitializing device: {e}")
@@ -947,17 +1389,13 @@ class BACnetClient:
     async def _backup_device(self, target_address: str) -> bool:
         """Backup device configuration"""
         try:
-            backup_apdu = BACnetAPDU.create_device_control_request(
-                1, BACnetObjectType.DEVICE.value, "backup", {}
-            )
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_device_control_request(
+                1, BACnetObjectType.DEVICE, "backup", {}, invoke_id=invoke_id
+            ))
             
-            packet = self._create_bacnet_packet(backup_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Backup command sent to device at {target_address}")
-            await asyncio.sleep(2)
-            return True
+            self.logger.debug("Backup command sent to device at %s", target_address)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error backing up device: {e}")
@@ -968,17 +1406,13 @@ class BACnetClient:
         try:
             config_data = parameters.get('config_data', b'')
             
-            restore_apdu = BACnetAPDU.create_device_control_request(
-                1, BACnetObjectType.DEVICE.value, "restore", {'data': config_data}
-            )
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_device_control_request(
+                1, BACnetObjectType.DEVICE, "restore", {'data': config_data}, invoke_id=invoke_id
+            ))
             
-            packet = self._create_bacnet_packet(restore_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Restore command sent to device at {target_address}")
-            await asyncio.sleep(2)
-            return True
+            self.logger.debug("Restore command sent to device at %s", target_address)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error restoring device: {e}")
@@ -989,17 +1423,13 @@ class BACnetClient:
         try:
             firmware_data = parameters.get('firmware_data', b'')
             
-            update_apdu = BACnetAPDU.create_device_control_request(
-                1, BACnetObjectType.DEVICE.value, "update_firmware", {'data': firmware_data}
-            )
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_device_control_request(
+                1, BACnetObjectType.DEVICE, "update_firmware", {'data': firmware_data}, invoke_id=invoke_id
+            ))
             
-            packet = self._create_bacnet_packet(update_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
-            
-            print(f"Firmware update command sent to device at {target_address}")
-            await asyncio.sleep(5)  # Longer timeout for firmware operations
-            return True
+            self.logger.debug("Firmware update command sent to device at %s", target_address)
+            return await self._await_ack(target_addr, invoke_id, response, 5.0)
             
         except Exception as e:
             print(f"Error updating firmware: {e}")
@@ -1007,21 +1437,15 @@ class BACnetClient:
     
     async def _set_device_time(self, target_address: str, parameters: Dict[str, Any]) -> bool:
         """Set device time"""
+        new_time = parameters.get('time') or datetime.datetime.now()
         try:
-            import datetime
-            new_time = parameters.get('time', datetime.datetime.now())
-            
-            time_apdu = BACnetAPDU.create_device_control_request(
-                1, BACnetObjectType.DEVICE.value, "set_time", {'time': new_time}
-            )
-            
-            packet = self._create_bacnet_packet(time_apdu)
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_device_control_request(
+                1, BACnetObjectType.DEVICE, "set_time", {'time': new_time}, invoke_id=invoke_id
+            ))
             
-            print(f"Time set command sent to device at {target_address}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Time set command sent to device at %s", target_address)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error setting device time: {e}")
@@ -1039,17 +1463,15 @@ class BACnetClient:
             properties: Initial properties
         """
         try:
-            obj_type = BACnetObjectType[object_type.upper().replace('-', '_')].value
-            
-            create_apdu = BACnetAPDU.create_create_object_request(obj_type, instance, properties or {})
-            packet = self._create_bacnet_packet(create_apdu)
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, object_type)
             
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_create_object_request(
+                obj_type, instance, properties or {}, invoke_id=invoke_id
+            ))
             
-            print(f"Create object command sent: {object_type},{instance}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Create object command sent: %s,%s", object_type, instance)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error creating object: {e}")
@@ -1066,17 +1488,15 @@ class BACnetClient:
         try:
             obj_type_str, obj_inst_str = object_id.split(',')
             obj_inst = int(obj_inst_str)
-            obj_type = BACnetObjectType[obj_type_str.upper().replace('-', '_')].value
-            
-            delete_apdu = BACnetAPDU.create_delete_object_request(obj_type, obj_inst)
-            packet = self._create_bacnet_packet(delete_apdu)
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, obj_type_str)
             
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_delete_object_request(
+                obj_type, obj_inst, invoke_id=invoke_id
+            ))
             
-            print(f"Delete object command sent: {object_id}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("Delete object command sent: %s", object_id)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error deleting object: {e}")
@@ -1119,58 +1539,92 @@ class BACnetClient:
         try:
             obj_type_str, obj_inst_str = object_id.split(',')
             obj_inst = int(obj_inst_str)
-            obj_type = BACnetObjectType[obj_type_str.upper().replace('-', '_')].value
-            prop_id = BACnetProperty[property_id.upper()].value
-            
-            cov_apdu = BACnetAPDU.create_subscribe_cov_request(obj_type, obj_inst, prop_id)
-            packet = self._create_bacnet_packet(cov_apdu)
+            obj_type = _lookup_id(_OBJECT_TYPE_ID, obj_type_str)
+            prop_id = _lookup_id(_PROP_ID_CACHE, property_id)
             
-            target_addr = (target_address, 47808)
-            self.transport.sendto(packet, target_addr)
+            target_addr = self._peer(target_address)
+            invoke_id, response = self._start_request(target_addr, lambda invoke_id: BACnetAPDU.create_subscribe_cov_request(
+                obj_type, obj_inst, prop_id, invoke_id=invoke_id
+            ))
             
-            print(f"COV subscription sent for {object_id}.{property_id}")
-            await asyncio.sleep(1)
-            return True
+            self.logger.debug("COV subscription sent for %s.%s", object_id, property_id)
+            return await self._await_ack(target_addr, invoke_id, response)
             
         except Exception as e:
             print(f"Error subscribing to changes: {e}")
             return False
 
+# Unlimited Who-Is broadcast, framed once at import time
+_WHO_IS_PACKET = BACnetClient._create_bacnet_packet(BACnetAPDU.create_who_is_request())
+
 class BACnetProtocol(asyncio.DatagramProtocol):
     """Protocol for handling BACnet UDP packets"""
     
     def __init__(self, client: BACnetClient):
         self.client = client
+        # Receive buffer for datagrams drained directly from the socket
+        self._rx_buf = bytearray(_RX_BUF_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
     
     def connection_made(self, transport):
         self.transport = transport
     
     def datagram_received(self, data, addr):
         """Handle received BACnet packets"""
+        self._dispatch(data, addr)
+        if self.client._sock is not None:
+            self._drain(self.client._sock)
+    
+    def _drain(self, sock: socket.socket) -> None:
+        """
+        Handle datagrams already queued on the socket without another loop wakeup
+        
+        Replies to a burst of requests tend to arrive together; reading them
+        here saves an event loop iteration and callback per datagram.
+        """
+        buf = self._rx_buf
+        view = self._rx_view
+        recv_into = sock.recvfrom_into
+        for _ in range(_RECV_BATCH_MAX):
+            try:
+                length, addr = recv_into(buf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return  # Leave error reporting to the transport
+            self._dispatch(view[:length] if _USE_MEMORYVIEW else bytes(buf[:length]), addr)
+    
+    def _dispatch(self, data, addr):
+        """Parse one BACnet packet and route it to its handler"""
         try:
             # Parse BACnet packet
             if len(data) < 6:
                 return
             
-            # Extract APDU
+            # Extract APDU as a zero-copy view; handlers walk it by offset
             apdu_start = 6  # Skip BACnet/IP header
-            apdu = data[apdu_start:]
+            apdu = memoryview(data)[apdu_start:] if _USE_MEMORYVIEW else data[apdu_start:]
             
             # Handle different APDU types
             if len(apdu) > 0:
                 apdu_type = apdu[0] & 0xF0
                 
-                if apdu_type == 0x20:  # I-Am response
-                    self._handle_i_am(apdu, addr)
+                if apdu_type == 0x20:
+                    if len(apdu) > 1 and (addr[0], apdu[1]) in self.client.pending_responses:
+                        self._handle_write_response(apdu, addr)  # Simple-ACK for a pending request
+                    else:
+                        self._handle_i_am(apdu, addr)  # I-Am response
                 elif apdu_type == 0x30:  # ReadProperty response
                     self._handle_read_response(apdu, addr)
                 elif apdu_type == 0x40:  # WriteProperty response
                     self._handle_write_response(apdu, addr)
+                elif apdu_type in (0x50, 0x60, 0x70):  # Error / Reject / Abort
+                    self._handle_error_response(apdu, addr)
                     
         except Exception as e:
             print(f"Error parsing BACnet packet: {e}")
     
-    def _handle_i_am(self, apdu: bytes, addr: Tuple[str, int]) -> None:
+    def _handle_i_am(self, apdu: _Buffer, addr: Tuple[str, int]) -> None:
         """Handle I-Am response from device discovery"""
         try:
             # Parse device information from I-Am
@@ -1184,54 +1638,121 @@ class BACnetProtocol(asyncio.DatagramProtocol):
         except Exception as e:
             print(f"Error parsing I-Am response: {e}")
     
-    def _handle_read_response(self, apdu: bytes, addr: Tuple[str, int]) -> None:
+    def _handle_read_response(self, apdu: _Buffer, addr: Tuple[str, int]) -> None:
         """Handle ReadProperty response"""
         try:
             # Parse BACnet ReadProperty response
             if len(apdu) < 4:
                 return
             
-            # Extract property value from response
-            # This is a simplified parser - in a real implementation you'd parse the full APDU
-            value = self._parse_bacnet_value(apdu)
-            
-            # Find matching pending request
-            for request_id, request_data in self.client.pending_responses.items():
-                if request_data['target'] == addr[0]:
-                    # Store the response
-                    self.client.response_data[request_id] = value
-                    print(f"  Received response: {value}")
-                    break
+            # Extract property value(s) from response
+            if apdu[2] == 0x0E:  # ReadPropertyMultiple-ACK
+                value = self._parse_read_property_multiple(apdu)
+            else:
+                # This is a simplified parser - in a real implementation you'd parse the full APDU
+                value = self._parse_bacnet_value(apdu)
+            
+            # Complete the pending request matching the echoed invoke ID
+            response = self.client.pending_responses.pop((addr[0], apdu[1]), None)
+            if response is not None and not response.done():
+                response.set_result(value)
+                self.client.logger.debug("  Received response: %s", value)
                     
         except Exception as e:
             print(f"Error parsing read response: {e}")
     
-    def _parse_bacnet_value(self, apdu: bytes) -> str:
-        """Parse BACnet value from APDU"""
-        try:
-            # This is a simplified parser
-            # In a real implementation, you'd parse the full BACnet APDU structure
-            
-            # Look for common BACnet data types
-            if len(apdu) >= 2:
-                # Try to extract string values
-                for i in range(len(apdu) - 1):
-                    if apdu[i] == 0x75:  # CharacterString tag
-                        length = apdu[i + 1]
-                        if i + 2 + length <= len(apdu):
-                            value = apdu[i + 2:i + 2 + length].decode('utf-8', errors='ignore')
-                            return value
+    def _handle_error_response(self, apdu: _Buffer, addr: Tuple[str, int]) -> None:
+        """Handle Error/Reject/Abort PDUs by failing the matching request immediately"""
+        if len(apdu) < 2:
+            return
+        response = self.client.pending_responses.pop((addr[0], apdu[1]), None)
+        if response is not None and not response.done():
+            response.set_result(None)
+            self.client.logger.debug("  Request %d refused by %s (PDU type 0x%02x)", apdu[1], addr[0], apdu[0] & 0xF0)
+    
+    def _parse_read_property_multiple(self, apdu: _Buffer) -> Dict[Tuple[int, int, int], Any]:
+        """
+        Parse a ReadPropertyMultiple-ACK
+        
+        Returns values keyed by (object type, instance, property id); properties
+        the device returned an error for map to None.
+        """
+        results = {}
+        off = 3  # Skip PDU type, invoke ID and service choice
+        end = len(apdu)
+        while off < end:
+            # Context tag 0: object identifier
+            _, _, length, off = _decode_tag(apdu, off)
+            object_id = _U32.unpack_from(apdu, off)[0]
+            off += length
+            obj = (object_id >> 22, object_id & 0x3FFFFF)
+            
+            _, _, _, off = _decode_tag(apdu, off)  # Opening tag 1
+            while True:
+                tag_number, _, length, off = _decode_tag(apdu, off)
+                if length == 7:  # Closing tag 1
+                    break
+                
+                # Context tag 2: property identifier, optional tag 3: array index
+                property_id = int.from_bytes(apdu[off:off + length], 'big')
+                off += length
+                tag_number, _, length, off = _decode_tag(apdu, off)
+                if tag_number == 3:
+                    off += length
+                    tag_number, _, length, off = _decode_tag(apdu, off)
                 
-                # Try to extract numeric values
-                for i in range(len(apdu) - 3):
-                    if apdu[i] == 0x21:  # UnsignedInteger tag
-                        if i + 4 <= len(apdu):
-                            value = struct.unpack('!I', apdu[i + 1:i + 5])[0]
-                            return str(value)
-                    elif apdu[i] == 0x44:  # Real tag
-                        if i + 5 <= len(apdu):
-                            value = struct.unpack('!f', apdu[i + 1:i + 5])[0]
-                            return str(value)
+                # Opening tag 4 (property value) or 5 (property access error)
+                values, off = _decode_value_list(apdu, off)
+                off += 1
+                
+                if tag_number == 4:
+                    results[obj + (property_id,)] = values[0] if len(values) == 1 else values
+                else:
+                    results[obj + (property_id,)] = None
+        return results
+    
+    def _parse_bacnet_value(self, apdu: _Buffer) -> Any:
+        """
+        Parse the property value from a ReadProperty-ACK
+        
+        Walks the tags once, skipping the context-tagged object and property
+        identifiers and the opening/closing tags around the value. Array and
+        list values are returned as a list; otherwise the first CharacterString
+        wins, then the first other value is returned as text.
+        """
+        try:
+            first = None
+            off = 3  # Skip PDU type, invoke ID and service choice
+            end = len(apdu)
+            try:
+                while off < end:
+                    tag_number, is_context, lvt, value_off = _decode_tag(apdu, off)
+                    if is_context:
+                        if tag_number == 3 and lvt == 6:
+                            # Opening tag 3: arrays and lists come back whole
+                            values, off = _decode_value_list(apdu, value_off)
+                            if len(values) > 1:
+                                return values
+                            if values:
+                                if isinstance(values[0], str):
+                                    return values[0]
+                                if first is None and values[0] is not None:
+                                    first = values[0]
+                            continue
+                        # Closing tags carry no data; skip other context values
+                        off = value_off if lvt in (6, 7) else value_off + lvt
+                        continue
+                    
+                    value, off = _decode_application_value(apdu, off)
+                    if tag_number == 7:  # CharacterString
+                        return value
+                    if first is None and value is not None:
+                        first = value
+            except (IndexError, struct.error):
+                pass  # Truncated or malformed tag - keep what was decoded
+            
+            if first is not None:
+                return str(first)
             
             # If we can't parse it, return a hex representation
             return f"0x{apdu.hex()[:20]}..."
@@ -1239,10 +1760,15 @@ class BACnetProtocol(asyncio.DatagramProtocol):
         except Exception as e:
             return f"<parse_error: {e}>"
     
-    def _handle_write_response(self, apdu: bytes, addr: Tuple[str, int]) -> None:
-        """Handle WriteProperty response"""
-        # Parse write response
-        pass
+    def _handle_write_response(self, apdu: _Buffer, addr: Tuple[str, int]) -> None:
+        """Handle WriteProperty (and other Simple-ACK) responses"""
+        if len(apdu) < 2:
+            return
+        
+        # Complete the pending request matching the echoed invoke ID
+        response = self.client.pending_responses.pop((addr[0], apdu[1]), None)
+        if response is not None and not response.done():
+            response.set_result(True)
 
 async def main():
     """Main async function demonstrating BACnet client usage"""
@@ -1277,14 +1803,22 @@ async def main():
                        help='Subscribe to property changes (format: object,property)')
     parser.add_argument('--test-connection', action='store_true',
                        help='Test direct connection to target device')
+    parser.add_argument('--no-fast-send', action='store_true',
+                       help='Send through the asyncio transport buffer instead of the raw socket')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log every request and response sent or received')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(message)s')
+    
     print("Modern BACnet Client Demo (asyncio-based)")
     print("=" * 50)
     
     # Create client
-    client = BACnetClient(device_id=args.device_id, local_address=args.address, local_port=args.port)
+    client = BACnetClient(device_id=args.device_id, local_address=args.address, local_port=args.port,
+                          fast_send=not args.no_fast_send)
     
     # Set target address if specified
     if args.target:
@@ -1379,7 +1913,6 @@ async def main():
             if args.operation == 'reinitialize':
                 parameters = {'type': 'coldstart'}
             elif args.operation == 'set_time':
-                import datetime
                 parameters = {'time': datetime.datetime.now()}
             
             success = await client.manipulate_device(target_addr, args.operation, parameters)
@@ -1469,9 +2002,11 @@ async def main():
                 ('binaryInput,1', 'presentValue')
             ]
             
+            # Issue all reads together (one ReadPropertyMultiple, or concurrent single reads)
+            values = await client._read_many(target_addr, properties_to_read)
             for obj_id, prop_id in properties_to_read:
-                value = await client.read_property(target_addr, obj_id, prop_id)
-                if value is not None:
+                value = values[(obj_id, prop_id)]
+                if value is not None and not isinstance(value, Exception):
                     print(f"  {obj_id}.{prop_id} = {value}")
         
         print("\nDemo completed!")
